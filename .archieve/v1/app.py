@@ -19,15 +19,15 @@ Features:
 
 import os
 import sys
+import asyncio
 import logging
 import argparse
 from datetime import datetime
 import pytz
-from modules.telegram import TelegramBot
 import schedule
 import time
 import threading
-from main import main as run_main_process
+from main import main as run_main_process, get_telegram_bot
 
 
 def setup_logging(daemon_mode=False):
@@ -70,7 +70,7 @@ class BotServer:
     def __init__(self, daemon_mode=False):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.daemon_mode = daemon_mode
-        self.telegram_bot = TelegramBot()
+        self.telegram_bot = get_telegram_bot()
         self.ist = pytz.timezone("Asia/Kolkata")
         self.running = True
 
@@ -92,7 +92,7 @@ class BotServer:
             self.logger.info(f"SCHEDULED JOB STARTED AT {current_time}")
 
             # Run the main process (scraping + formatting + sending)
-            result = run_main_process(daemon_mode=self.daemon_mode)
+            result = asyncio.run(run_main_process(daemon_mode=self.daemon_mode))
 
             if result == 0:
                 success_msg = (
@@ -17,15 +17,212 @@ Modules:
 - telegram: Sends formatted messages from database to Telegram
 """
 
+import asyncio
 import logging
+from enum import IntFlag
+from functools import lru_cache
 from modules.webscraping import WebScraper
-from modules.formatting import TextFormatter
+from modules.formatting import TextFormatter, FormatResult
 from modules.telegram import TelegramBot
-from modules.config import set_daemon_mode, safe_print
+from modules.config import (
+    set_daemon_mode,
+    safe_print,
+    create_http_session,
+    get_mongo_client,
+    close_mongo_client,
+    close_async_mongo_client,
+)
 import sys
 
+# Maximum number of post broadcasts allowed in flight at once
+PIPELINE_CONCURRENCY = 10
 
-def main(daemon_mode=False):
+# Upper bound on post ids buffered between the scraper and the consumers
+NEW_POST_QUEUE_SIZE = 1000
+
+
+class Step(IntFlag):
+    """Workflow steps, combined into a bitmask of the ones that succeeded"""
+
+    SCRAPE = 1
+    FORMAT = 2
+    TELEGRAM = 4
+    ALL = SCRAPE | FORMAT | TELEGRAM
+
+
+# Exit code, log level and message for the final summary, keyed by
+# (all steps succeeded, any step succeeded)
+RUN_STATUS = {
+    (True, True): (0, logging.INFO, "All steps completed successfully!"),
+    (False, True): (1, logging.WARNING, "Process completed with some issues."),
+    (False, False): (2, logging.ERROR, "Process failed completely."),
+}
+RUN_ONCE_STATUS = {
+    (True, True): (
+        0,
+        logging.INFO,
+        "🎉 All steps completed successfully! New posts sent to all users.",
+    ),
+    (False, True): (1, logging.WARNING, "⚠️  Process completed with some issues."),
+    (False, False): (2, logging.ERROR, "❌ Process failed completely."),
+}
+
+# Pipeline stage sizes for the scrape -> format -> send run in main()
+FORMAT_WORKERS = 4
+SEND_WORKERS = 8
+PIPELINE_QUEUE_SIZE = 100
+
+
+@lru_cache(maxsize=1)
+def get_scraper():
+    """Return the WebScraper reused across runs in this process"""
+    return WebScraper(mongo_client=get_mongo_client())
+
+
+@lru_cache(maxsize=1)
+def get_formatter():
+    """Return the TextFormatter reused across runs in this process"""
+    return TextFormatter(mongo_client=get_mongo_client())
+
+
+@lru_cache(maxsize=1)
+def get_telegram_bot():
+    """Return the TelegramBot reused across runs in this process"""
+    return TelegramBot(mongo_client=get_mongo_client())
+
+
+async def format_and_send(formatter, telegram_bot, session):
+    """Format unsent posts and broadcast each one as soon as it is ready
+
+    Formatting post N overlaps with the Telegram broadcast of post N-1, with at
+    most PIPELINE_CONCURRENCY broadcasts in flight. Returns a
+    (format_result, telegram_result) pair shaped like the results of
+    format_content() and TelegramBot.run(); telegram_result is an exception
+    instance if sending failed outright.
+    """
+    try:
+        posts = await asyncio.to_thread(formatter.get_posts_to_format)
+    except Exception as e:
+        # Without the post list neither stage can do anything
+        return FormatResult(success=False, error=str(e)), e
+
+    can_send = telegram_bot.test_connection()
+    users = []
+    if can_send and posts:
+        users = await telegram_bot.async_db_manager.get_all_users()
+        if not users:
+            safe_print("No users registered for notifications")
+
+    semaphore = asyncio.Semaphore(PIPELINE_CONCURRENCY)
+
+    async def send(post):
+        async with semaphore:
+            return await telegram_bot.send_post(session, post, users)
+
+    send_tasks = []
+    enhanced_count = 0
+    for post in posts:
+        if await asyncio.to_thread(formatter.format_post, post):
+            enhanced_count += 1
+        if users and post.get("content", "").strip():
+            send_tasks.append(asyncio.create_task(send(post)))
+
+    formatter.log_format_summary(len(posts), enhanced_count)
+    format_result = FormatResult(
+        success=True, new_posts=enhanced_count, total_processed=len(posts)
+    )
+
+    if not can_send:
+        return format_result, False
+    if not send_tasks:
+        # Nothing to send is only a success if there was nobody left out
+        return format_result, not posts or bool(users)
+
+    results = await asyncio.gather(*send_tasks, return_exceptions=True)
+    errors = [r for r in results if isinstance(r, Exception)]
+    for error in errors:
+        safe_print(f"Error sending post: {error}")
+    if len(errors) == len(results):
+        return format_result, errors[0]
+
+    sent_count = sum(1 for r in results if r is True)
+    safe_print(
+        f"Broadcast summary: {sent_count}/{len(results)} posts sent successfully"
+    )
+    return format_result, sent_count > 0
+
+
+async def run_pipeline(scraper, formatter, telegram_bot, session):
+    """Scrape, format and send as overlapping stages connected by bounded queues
+
+    The scraper feeds post ids into raw_q as posts are saved, FORMAT_WORKERS
+    formatters turn them into ready posts on ready_q and SEND_WORKERS senders
+    broadcast them. Posts left unsent by earlier runs are queued ahead of the
+    scraper's output. Each stage is shut down with one None sentinel per
+    consumer. Returns (scrape_result, format_result, telegram_result) shaped
+    like the results of scrape(), format_content() and TelegramBot.run().
+    """
+    raw_q = asyncio.Queue(PIPELINE_QUEUE_SIZE)
+    ready_q = asyncio.Queue(PIPELINE_QUEUE_SIZE)
+
+    can_send = telegram_bot.test_connection()
+    users = []
+    if can_send:
+        users = await telegram_bot.async_db_manager.get_all_users()
+
+    async def produce():
+        try:
+            pending_ids = await formatter.async_db_manager.get_unsent_post_ids()
+            for post_id in pending_ids:
+                await raw_q.put(post_id)
+            return await scraper.produce(raw_q)
+        finally:
+            for _ in range(FORMAT_WORKERS):
+                await raw_q.put(None)
+
+    async def format_stage():
+        try:
+            async with asyncio.TaskGroup() as tg:
+                workers = [
+                    tg.create_task(formatter.worker(raw_q, ready_q))
+                    for _ in range(FORMAT_WORKERS)
+                ]
+        finally:
+            for _ in range(SEND_WORKERS):
+                await ready_q.put(None)
+        return [worker.result() for worker in workers]
+
+    async with asyncio.TaskGroup() as tg:
+        scrape_task = tg.create_task(produce())
+        format_task = tg.create_task(format_stage())
+        send_tasks = [
+            tg.create_task(telegram_bot.sender(ready_q, session, users))
+            for _ in range(SEND_WORKERS)
+        ]
+
+    total_processed = sum(processed for processed, _ in format_task.result())
+    enhanced_count = sum(enhanced for _, enhanced in format_task.result())
+    formatter.log_format_summary(total_processed, enhanced_count)
+    format_result = FormatResult(
+        success=True, new_posts=enhanced_count, total_processed=total_processed
+    )
+
+    sent_count = sum(sent for sent, _ in (task.result() for task in send_tasks))
+    failed_count = sum(failed for _, failed in (task.result() for task in send_tasks))
+
+    if not can_send:
+        return scrape_task.result(), format_result, False
+    if total_processed and not users:
+        safe_print("No users registered for notifications")
+        return scrape_task.result(), format_result, False
+    if sent_count or failed_count:
+        safe_print(
+            f"Broadcast summary: {sent_count}/{sent_count + failed_count} posts sent successfully"
+        )
+    return scrape_task.result(), format_result, not failed_count or sent_count > 0
+
+
+async def main(daemon_mode=False):
     """Main function to orchestrate the complete workflow"""
     logger = logging.getLogger(__name__)
     logger.info("Starting SuperSet Telegram Notification Bot")
@@ -36,111 +233,88 @@ def main(daemon_mode=False):
     safe_print("Starting SuperSet Telegram Notification Bot...")
     safe_print("=" * 50)
 
-    scraper = WebScraper()
-    formatter = TextFormatter()
-    telegram_bot = TelegramBot()
+    scraper = get_scraper()
+    formatter = get_formatter()
+    telegram_bot = get_telegram_bot()
 
-    success_count = 0
-    total_steps = 3
+    results = Step(0)
 
-    # Step 1: Web Scraping
+    # Steps 1-3: Web scraping, formatting and Telegram sending, pipelined
     safe_print("\nStep 1/3: Starting incremental web scraping...")
+    safe_print("Step 2/3: Enhancing post formatting...")
+    safe_print("Step 3/3: Sending formatted content to Telegram...")
     safe_print("-" * 30)
-    logger.info("Step 1/3: Starting incremental web scraping")
+    logger.info("Steps 1-3/3: Scraping, formatting and sending to Telegram")
 
     try:
-        if scraper.scrape():
-            success_msg = "Web scraping completed successfully!"
-            safe_print(success_msg)
-            logger.info(success_msg)
-            success_count += 1
-        else:
-            error_msg = "Web scraping failed!"
-            safe_print(error_msg)
-            logger.error(error_msg)
-
-    except Exception as e:
-        error_msg = f"Web scraping error: {e}"
-        safe_print(error_msg)
-        logger.error(error_msg, exc_info=True)
-
-    # Step 2: Formatting
-    safe_print("\nStep 2/3: Enhancing post formatting...")
-    safe_print("-" * 30)
-    logger.info("Step 2/3: Enhancing post formatting")
-
-    try:
-        format_result = formatter.format_content()
-        if isinstance(format_result, dict) and format_result.get("success"):
-            enhanced_posts = format_result.get("new_posts", 0)
-            total_processed = format_result.get("total_processed", 0)
-            success_msg = f"Content formatting enhancement completed! Posts enhanced: {enhanced_posts}, Total processed: {total_processed}"
-            safe_print(f"Content formatting enhancement completed!")
-            safe_print(
-                f"   Posts enhanced: {enhanced_posts}, Total processed: {total_processed}"
+        async with create_http_session() as session:
+            scrape_result, format_result, telegram_result = await run_pipeline(
+                scraper, formatter, telegram_bot, session
             )
-            logger.info(success_msg)
-            success_count += 1
-        else:
-            error_msg = "Content formatting failed!"
-            if isinstance(format_result, dict):
-                error_detail = format_result.get("error", "Unknown error")
-                error_msg += f" - Error: {error_detail}"
-                safe_print("Content formatting failed!")
-                safe_print(f"   Error: {error_detail}")
-            else:
-                safe_print(error_msg)
-            logger.error(error_msg)
-
     except Exception as e:
-        error_msg = f"Formatting error: {e}"
+        # A stage raised and the TaskGroup cancelled the others
+        error = e.exceptions[0] if isinstance(e, ExceptionGroup) else e
+        scrape_result = False
+        format_result = FormatResult(success=False, error=str(error))
+        telegram_result = error
+
+    if scrape_result:
+        success_msg = "Web scraping completed successfully!"
+        safe_print(success_msg)
+        logger.info(success_msg)
+        results |= Step.SCRAPE
+    else:
+        error_msg = "Web scraping failed!"
         safe_print(error_msg)
-        logger.error(error_msg, exc_info=True)
-
-    # Step 3: Telegram Sending
-    safe_print("\nStep 3/3: Sending formatted content to Telegram...")
-    safe_print("-" * 30)
-    logger.info("Step 3/3: Sending formatted content to Telegram")
-
-    try:
-        if telegram_bot.run():
-            success_msg = "Telegram sending completed successfully!"
-            safe_print(success_msg)
-            logger.info(success_msg)
-            success_count += 1
-        else:
-            error_msg = "Telegram sending failed!"
-            safe_print(error_msg)
-            logger.error(error_msg)
+        logger.error(error_msg)
+
+    if format_result.success:
+        enhanced_posts = format_result.new_posts
+        total_processed = format_result.total_processed
+        success_msg = f"Content formatting enhancement completed! Posts enhanced: {enhanced_posts}, Total processed: {total_processed}"
+        safe_print(f"Content formatting enhancement completed!")
+        safe_print(
+            f"   Posts enhanced: {enhanced_posts}, Total processed: {total_processed}"
+        )
+        logger.info(success_msg)
+        results |= Step.FORMAT
+    else:
+        error_msg = f"Content formatting failed! - Error: {format_result.error}"
+        safe_print("Content formatting failed!")
+        safe_print(f"   Error: {format_result.error}")
+        logger.error(error_msg)
 
-    except Exception as e:
-        error_msg = f"Telegram error: {e}"
+    if isinstance(telegram_result, Exception):
+        error_msg = f"Telegram error: {telegram_result}"
         safe_print(error_msg)
-        logger.error(error_msg, exc_info=True)
+        logger.error(error_msg, exc_info=telegram_result)
+    elif telegram_result:
+        success_msg = "Telegram sending completed successfully!"
+        safe_print(success_msg)
+        logger.info(success_msg)
+        results |= Step.TELEGRAM
+    else:
+        error_msg = "Telegram sending failed!"
+        safe_print(error_msg)
+        logger.error(error_msg)
+
+    # This loop's Motor client cannot be reused once asyncio.run() returns
+    close_async_mongo_client()
 
     # Final Summary
     safe_print("\n" + "=" * 50)
     safe_print("PROCESS SUMMARY")
     safe_print("=" * 50)
-    safe_print(f"Completed steps: {success_count}/{total_steps}")
+    safe_print(f"Completed steps: {results.bit_count()}/{len(Step.ALL)}")
 
-    logger.info(f"Process completed: {success_count}/{total_steps} steps successful")
+    logger.info(
+        "Process completed: %s/%s steps successful", results.bit_count(), len(Step.ALL)
+    )
 
-    if success_count == total_steps:
-        final_msg = "All steps completed successfully!"
-        safe_print(final_msg)
-        logger.info(final_msg)
-        return 0
-    elif success_count > 0:
-        final_msg = "Process completed with some issues."
-        safe_print(final_msg)
-        logger.warning(final_msg)
-        return 1
-    else:
-        final_msg = "Process failed completely."
-        safe_print(final_msg)
-        logger.error(final_msg)
-        return 2
+    return_code, level, final_msg = RUN_STATUS[(results == Step.ALL, bool(results))]
+    safe_print(final_msg)
+    logger.log(level, final_msg)
+    return return_code
 
 
 def run_scraping_only(daemon_mode=False):
@@ -149,9 +323,9 @@ def run_scraping_only(daemon_mode=False):
     logger.info("Running web scraping only")
     if not daemon_mode:
         print("Running web scraping only...")
-    scraper = WebScraper()
+    scraper = get_scraper()
     result = scraper.scrape()
-    logger.info(f"Web scraping only completed with result: {result}")
+    logger.info("Web scraping only completed with result: %s", result)
     return result
 
 
@@ -161,9 +335,9 @@ def run_formatting_only(daemon_mode=False):
     logger.info("Running formatting only")
     if not daemon_mode:
         print("Running formatting only...")
-    formatter = TextFormatter()
+    formatter = get_formatter()
     result = formatter.format_content()
-    logger.info(f"Formatting only completed with result: {result}")
+    logger.info("Formatting only completed with result: %s", result)
     return result
 
 
@@ -173,13 +347,13 @@ def run_telegram_only(daemon_mode=False):
     logger.info("Running Telegram sending only")
     if not daemon_mode:
         print("Running Telegram sending only...")
-    telegram_bot = TelegramBot()
-    result = telegram_bot.run()
-    logger.info(f"Telegram sending only completed with result: {result}")
+    telegram_bot = get_telegram_bot()
+    result = asyncio.run(telegram_bot.run())
+    logger.info("Telegram sending only completed with result: %s", result)
     return result
 
 
-def run_once_and_notify_if_new_posts(daemon_mode=False):
+async def run_once_and_notify_if_new_posts(daemon_mode=False):
     """
     Run the complete workflow once and send notifications to all users only if new posts are found.
     This function provides explicit feedback about whether new posts were discovered and sent.
@@ -193,25 +367,16 @@ def run_once_and_notify_if_new_posts(daemon_mode=False):
         print("Will only send notifications if NEW posts are discovered!")
         print()
 
-    scraper = WebScraper()
-    formatter = TextFormatter()
-    telegram_bot = TelegramBot()
+    # The scraper publishes the id of every newly saved post here
+    new_post_queue = asyncio.Queue(maxsize=NEW_POST_QUEUE_SIZE)
 
-    # Step 1: Check current unsent posts count (before scraping)
-    if not daemon_mode:
-        print("📊 Checking current status...")
-    try:
-        initial_unsent_count = len(telegram_bot.db_manager.get_unsent_posts())
-        if not daemon_mode:
-            print(f"   Unsent posts before scraping: {initial_unsent_count}")
-    except Exception as e:
-        logger.error(f"Error checking initial unsent posts: {e}")
-        initial_unsent_count = 0
+    scraper = get_scraper()
+    formatter = get_formatter()
+    telegram_bot = get_telegram_bot()
 
-    success_count = 0
-    total_steps = 3
+    results = Step(0)
 
-    # Step 2: Web Scraping
+    # Step 1: Web Scraping
     if not daemon_mode:
         print("\nStep 1/3: Scraping for new job posts...")
         print("-" * 40)
@@ -219,12 +384,12 @@ def run_once_and_notify_if_new_posts(daemon_mode=False):
 
     scraping_success = False
     try:
-        if scraper.scrape():
+        if scraper.scrape(new_post_queue=new_post_queue):
             success_msg = "✅ Web scraping completed successfully!"
             if not daemon_mode:
                 print(success_msg)
             logger.info(success_msg)
-            success_count += 1
+            results |= Step.SCRAPE
             scraping_success = True
         else:
             error_msg = "❌ Web scraping failed!"
@@ -238,120 +403,89 @@ def run_once_and_notify_if_new_posts(daemon_mode=False):
             print(error_msg)
         logger.error(error_msg, exc_info=True)
 
-    # Step 3: Check if new posts were found
+    # Step 2: Drain the ids the scraper queued to see if new posts were found
     new_posts_found = False
     if scraping_success:
-        try:
-            current_unsent_count = len(telegram_bot.db_manager.get_unsent_posts())
-            new_posts_count = current_unsent_count - initial_unsent_count
-            if not daemon_mode:
-                print(f"\n📈 Scraping Results:")
-                print(f"   Unsent posts after scraping: {current_unsent_count}")
-                print(f"   New posts discovered: {new_posts_count}")
-
-            if new_posts_count > 0:
-                new_posts_found = True
-                if not daemon_mode:
-                    print(
-                        f"🎉 Found {new_posts_count} new posts! Will proceed with formatting and notifications."
-                    )
-                logger.info(f"Found {new_posts_count} new posts during scraping")
-            else:
-                if not daemon_mode:
-                    print(
-                        "ℹ️  No new posts found. Skipping formatting and notifications."
-                    )
-                logger.info("No new posts found during scraping")
-
-        except Exception as e:
-            logger.error(f"Error checking post counts: {e}")
-            # If we can't determine, proceed with the rest of the workflow
-            new_posts_found = True
+        new_posts_count = 0
+        while not new_post_queue.empty():
+            await new_post_queue.get()
+            new_post_queue.task_done()
+            new_posts_count += 1
 
-    # Step 4: Formatting (only if new posts found)
-    if new_posts_found:
         if not daemon_mode:
-            print("\nStep 2/3: Enhancing post formatting...")
-            print("-" * 40)
-        logger.info("Step 2/3: Starting post formatting")
+            unsent_count = await telegram_bot.async_db_manager.count_unsent()
+            print(f"\n📈 Scraping Results:")
+            print(f"   Unsent posts after scraping: {unsent_count}")
+            print(f"   New posts discovered: {new_posts_count}")
 
-        try:
-            format_result = formatter.format_content()
-            if isinstance(format_result, dict) and format_result.get("success"):
-                enhanced_posts = format_result.get("new_posts", 0)
-                total_processed = format_result.get("total_processed", 0)
-                success_msg = f"✅ Content formatting completed! Posts enhanced: {enhanced_posts}, Total processed: {total_processed}"
-                if not daemon_mode:
-                    print(f"✅ Content formatting enhancement completed!")
-                    print(
-                        f"   Posts enhanced: {enhanced_posts}, Total processed: {total_processed}"
-                    )
-                logger.info(success_msg)
-                success_count += 1
-            else:
-                error_msg = "❌ Content formatting failed!"
-                if isinstance(format_result, dict):
-                    error_detail = format_result.get("error", "Unknown error")
-                    error_msg += f" - Error: {error_detail}"
-                    if not daemon_mode:
-                        print("❌ Content formatting failed!")
-                        print(f"   Error: {error_detail}")
-                else:
-                    if not daemon_mode:
-                        print(error_msg)
-                logger.error(error_msg)
-
-        except Exception as e:
-            error_msg = f"❌ Formatting error: {e}"
+        if new_posts_count > 0:
+            new_posts_found = True
             if not daemon_mode:
-                print(error_msg)
-            logger.error(error_msg, exc_info=True)
+                print(
+                    f"🎉 Found {new_posts_count} new posts! Will proceed with formatting and notifications."
+                )
+            logger.info("Found %s new posts during scraping", new_posts_count)
+        else:
+            if not daemon_mode:
+                print("ℹ️  No new posts found. Skipping formatting and notifications.")
+            logger.info("No new posts found during scraping")
 
-        # Step 5: Send to all registered users (only if new posts found)
+    # Steps 3 and 4: Formatting and sending to all registered users, pipelined
+    # (only if new posts found)
+    if new_posts_found:
         if not daemon_mode:
-            print("\nStep 3/3: Sending notifications to all registered users...")
+            print("\nStep 2/3: Enhancing post formatting...")
+            print("Step 3/3: Sending notifications to all registered users...")
             print("-" * 55)
-        logger.info("Step 3/3: Sending notifications to registered users")
+        logger.info("Steps 2-3/3: Formatting posts and notifying registered users")
 
-        try:
-            # Get user count first
-            users = telegram_bot.db_manager.get_all_users()
-            user_count = len(users) if users else 0
-
-            if user_count == 0:
-                if not daemon_mode:
-                    print("⚠️  No users registered for notifications!")
-                logger.warning("No registered users found")
-            else:
-                if not daemon_mode:
-                    print(
-                        f"📢 Sending notifications to {user_count} registered users..."
-                    )
-
-                if telegram_bot.run():
-                    success_msg = (
-                        f"✅ Notifications sent successfully to all {user_count} users!"
-                    )
-                    if not daemon_mode:
-                        print(success_msg)
-                    logger.info(success_msg)
-                    success_count += 1
-                else:
-                    error_msg = "❌ Failed to send notifications!"
-                    if not daemon_mode:
-                        print(error_msg)
-                    logger.error(error_msg)
-
-        except Exception as e:
-            error_msg = f"❌ Notification error: {e}"
+        async with create_http_session() as session:
+            format_result, telegram_result = await format_and_send(
+                formatter, telegram_bot, session
+            )
+
+        if format_result.success:
+            enhanced_posts = format_result.new_posts
+            total_processed = format_result.total_processed
+            success_msg = f"✅ Content formatting completed! Posts enhanced: {enhanced_posts}, Total processed: {total_processed}"
+            if not daemon_mode:
+                print(f"✅ Content formatting enhancement completed!")
+                print(
+                    f"   Posts enhanced: {enhanced_posts}, Total processed: {total_processed}"
+                )
+            logger.info(success_msg)
+            results |= Step.FORMAT
+        else:
+            error_msg = f"❌ Content formatting failed! - Error: {format_result.error}"
+            if not daemon_mode:
+                print("❌ Content formatting failed!")
+                print(f"   Error: {format_result.error}")
+            logger.error(error_msg)
+
+        if isinstance(telegram_result, Exception):
+            error_msg = f"❌ Notification error: {telegram_result}"
             if not daemon_mode:
                 print(error_msg)
-            logger.error(error_msg, exc_info=True)
+            logger.error(error_msg, exc_info=telegram_result)
+        elif telegram_result:
+            success_msg = "✅ Notifications sent successfully to all registered users!"
+            if not daemon_mode:
+                print(success_msg)
+            logger.info(success_msg)
+            results |= Step.TELEGRAM
+        else:
+            error_msg = "❌ Failed to send notifications!"
+            if not daemon_mode:
+                print(error_msg)
+            logger.error(error_msg)
     else:
         if not daemon_mode:
             print("\n⏭️  Skipping formatting and notifications (no new posts found)")
         logger.info("Skipped formatting and notifications - no new posts")
-        success_count += 1  # Consider this a success since no action was needed
+        results |= Step.FORMAT | Step.TELEGRAM  # Nothing needed doing
+
+    # This loop's Motor client cannot be reused once asyncio.run() returns
+    close_async_mongo_client()
 
     # Final Summary
     if not daemon_mode:
@@ -361,31 +495,20 @@ def run_once_and_notify_if_new_posts(daemon_mode=False):
 
     if new_posts_found:
         if not daemon_mode:
-            print(f"📊 Completed steps: {success_count}/{total_steps}")
+            print(f"📊 Completed steps: {results.bit_count()}/{len(Step.ALL)}")
         logger.info(
-            f"Run-once process completed: {success_count}/{total_steps} steps successful"
+            "Run-once process completed: %s/%s steps successful",
+            results.bit_count(),
+            len(Step.ALL),
         )
 
-        if success_count == total_steps:
-            final_msg = (
-                "🎉 All steps completed successfully! New posts sent to all users."
-            )
-            if not daemon_mode:
-                print(final_msg)
-            logger.info(final_msg)
-            return 0
-        elif success_count > 0:
-            final_msg = "⚠️  Process completed with some issues."
-            if not daemon_mode:
-                print(final_msg)
-            logger.warning(final_msg)
-            return 1
-        else:
-            final_msg = "❌ Process failed completely."
-            if not daemon_mode:
-                print(final_msg)
-            logger.error(final_msg)
-            return 2
+        return_code, level, final_msg = RUN_ONCE_STATUS[
+            (results == Step.ALL, bool(results))
+        ]
+        if not daemon_mode:
+            print(final_msg)
+        logger.log(level, final_msg)
+        return return_code
     else:
         final_msg = "✅ Run completed successfully - No new posts to send."
         if not daemon_mode:
@@ -395,4 +518,7 @@ def run_once_and_notify_if_new_posts(daemon_mode=False):
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        asyncio.run(main())
+    finally:
+        close_mongo_client()
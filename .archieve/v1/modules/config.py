@@ -1,7 +1,13 @@
+import os
+import asyncio
 import logging
-import inspect
+import weakref
 from datetime import datetime
 
+import aiohttp
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import MongoClient
+
 """
 Global configuration for SuperSet Telegram Bot
 
@@ -12,6 +18,26 @@ across all modules, particularly for daemon mode support.
 # Global daemon mode flag
 DAEMON_MODE = False
 
+# Connection settings for the aiohttp session shared by every step of a run
+HTTP_CONNECTION_LIMIT = 20
+HTTP_DNS_CACHE_TTL = 300
+HTTP_KEEPALIVE_TIMEOUT = 60
+
+# Connection pool settings for the MongoClient shared by every MongoDBManager;
+# the max pool size can be overridden with the MONGO_MAX_POOL_SIZE env var
+MONGO_MAX_POOL_SIZE = 20
+MONGO_MIN_POOL_SIZE = 2
+MONGO_WAIT_QUEUE_TIMEOUT_MS = 2500
+
+_mongo_client = None
+
+# Motor clients are bound to the event loop they were first used on, so one
+# is kept per loop (the scheduler and the bot server each run their own)
+_async_mongo_clients = weakref.WeakKeyDictionary()
+
+# Logger used by safe_print in daemon mode, configured once on first use
+_daemon_logger = None
+
 
 def set_daemon_mode(enabled=True):
     """Set the global daemon mode flag"""
@@ -24,25 +50,100 @@ def is_daemon_mode():
     return DAEMON_MODE
 
 
+def _init_daemon_logger():
+    """Configure the daemon-mode logger once and cache it
+
+    A file handler is only attached when nothing up the logger hierarchy
+    handles records yet (e.g. app.py's root logging setup).
+    """
+    global _daemon_logger
+    logger = logging.getLogger("SuperSetTelegramBot")
+    if not logger.hasHandlers():
+        handler = logging.FileHandler("superset_telegram_bot.log")
+        formatter = logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+
+    _daemon_logger = logger
+    return logger
+
+
 def safe_print(*args, **kwargs):
     """Print only if not in daemon mode"""
     if not DAEMON_MODE:
         print(*args, **kwargs)
     else:
-        logger = logging.getLogger("SuperSetTelegramBot")
-        if not logger.hasHandlers():
-            handler = logging.FileHandler("superset_telegram_bot.log")
-            formatter = logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s",
-                datefmt="%Y-%m-%d %H:%M:%S",
-            )
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-            logger.setLevel(logging.INFO)
-
-        frame = inspect.currentframe().f_back
-        func_name = frame.f_code.co_name
-        line_no = frame.f_lineno
-        msg = " ".join(str(arg) for arg in args)
+        msg = " ".join(map(str, args))
         if msg:
-            logger.info(f"{func_name}:{line_no} - {msg}")
+            logger = _daemon_logger or _init_daemon_logger()
+            # stacklevel=2 makes %(funcName)s:%(lineno)d report our caller
+            logger.info(msg, stacklevel=2)
+
+
+def create_http_session():
+    """Create the aiohttp session reused across scraping, formatting and sending
+
+    Must be called from inside a running event loop; use it as an async
+    context manager so the pooled connections are closed when the run ends.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=HTTP_CONNECTION_LIMIT,
+        ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+        keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+def get_mongo_client():
+    """Return the process-wide MongoClient, creating it on first use
+
+    Every MongoDBManager draws sockets from this single pool instead of
+    opening its own client.
+    """
+    global _mongo_client
+    if _mongo_client is None:
+        _mongo_client = MongoClient(
+            os.getenv("MONGO_CONNECTION_STR"),
+            maxPoolSize=int(os.getenv("MONGO_MAX_POOL_SIZE", MONGO_MAX_POOL_SIZE)),
+            minPoolSize=MONGO_MIN_POOL_SIZE,
+            waitQueueTimeoutMS=MONGO_WAIT_QUEUE_TIMEOUT_MS,
+        )
+    return _mongo_client
+
+
+def close_mongo_client():
+    """Close the shared MongoClient, if one was created"""
+    global _mongo_client
+    if _mongo_client is not None:
+        _mongo_client.close()
+        _mongo_client = None
+
+
+def get_async_mongo_client():
+    """Return the AsyncIOMotorClient for the running event loop
+
+    Uses the same pool settings as get_mongo_client(). Must be called from
+    inside a running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_mongo_clients.get(loop)
+    if client is None:
+        client = AsyncIOMotorClient(
+            os.getenv("MONGO_CONNECTION_STR"),
+            maxPoolSize=int(os.getenv("MONGO_MAX_POOL_SIZE", MONGO_MAX_POOL_SIZE)),
+            minPoolSize=MONGO_MIN_POOL_SIZE,
+            waitQueueTimeoutMS=MONGO_WAIT_QUEUE_TIMEOUT_MS,
+        )
+        _async_mongo_clients[loop] = client
+    return client
+
+
+def close_async_mongo_client():
+    """Close the running event loop's AsyncIOMotorClient, if one was created"""
+    client = _async_mongo_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        client.close()
@@ -2,19 +2,22 @@ import os
 import re
 import dotenv
 import logging
-from pymongo import MongoClient
 from datetime import datetime
-import hashlib
-from .config import safe_print
+import xxhash
+from bson.binary import Binary
+from bson.objectid import ObjectId
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, OperationFailure
+from .config import safe_print, get_mongo_client, get_async_mongo_client
 
 dotenv.load_dotenv()
 
 
 class MongoDBManager:
-    def __init__(self):
+    def __init__(self, client=None):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.connection_string = os.getenv("MONGO_CONNECTION_STR")
-        self.client = None
+        self.client = client
         self.db = None
         self.collection = None
         self.users_collection = None  # Add users collection
@@ -30,7 +33,7 @@ class MongoDBManager:
                 self.logger.error(error_msg)
                 raise ValueError(error_msg)
 
-            self.client = MongoClient(self.connection_string)
+            self.client = self.client or get_mongo_client()
             self.db = self.client["SupersetPlacement"]
             self.collection = self.db["Posts"]
             self.users_collection = self.db["Users"]  # Initialize users collection
@@ -41,14 +44,84 @@ class MongoDBManager:
             self.logger.info(success_msg)
             safe_print(success_msg)
 
+            self.ensure_indexes()
+
         except Exception as e:
             error_msg = f"Failed to connect to MongoDB: {e}"
             self.logger.error(error_msg, exc_info=True)
             safe_print(error_msg)
             raise
 
+    def ensure_indexes(self):
+        """Create the indexes the post queries rely on (no-op if they exist)"""
+        # Legacy SHA-256 hex hashes never match the binary ones, so every
+        # stored post would look new and be re-sent; convert them first
+        if self.collection.find_one({"content_hash": {"$type": "string"}}, {"_id": 1}):
+            self.rehash_legacy_posts()
+
+        try:
+            self.collection.create_index("content_hash", unique=True)
+        except OperationFailure as e:
+            # Existing duplicates block the unique index until they are cleaned
+            warning_msg = f"Could not create unique content_hash index, run clean_duplicate_posts(): {e}"
+            self.logger.warning(warning_msg)
+            safe_print(warning_msg)
+            self.collection.create_index("content_hash")
+
+        self.collection.create_index("sent_to_telegram")
+        self.collection.create_index("created_at")
+
+    def rehash_legacy_posts(self):
+        """Recompute legacy SHA-256 hex content hashes with the current binary hash
+
+        Returns the number of posts rehashed.
+        """
+        # Imported here: webscraping imports this module
+        from .webscraping import WebScraper
+
+        # The scraper hashes its basic formatting of the raw post lines, which
+        # can be rebuilt from the stored raw_content
+        operations = []
+        for post in self.collection.find(
+            {"content_hash": {"$type": "string"}}, {"raw_content": 1}
+        ):
+            content_lines = post.get("raw_content", "").split("\n")
+            formatted_content = WebScraper.create_basic_formatted_content(content_lines)
+            operations.append(
+                UpdateOne(
+                    {"_id": post["_id"]},
+                    {
+                        "$set": {
+                            "content_hash": self.create_post_hash(formatted_content)
+                        }
+                    },
+                )
+            )
+
+        if not operations:
+            return 0
+
+        try:
+            result = self.collection.bulk_write(operations, ordered=False)
+            modified = result.modified_count
+            safe_print(f"Rehashed {modified} legacy posts")
+        except BulkWriteError as e:
+            modified = e.details["nModified"]
+            warning_msg = (
+                f"Rehashed {modified} legacy posts, "
+                f"{len(e.details['writeErrors'])} failed (likely duplicates)"
+            )
+            self.logger.warning(warning_msg)
+            safe_print(warning_msg)
+        return modified
+
     def create_post_hash(self, content):
-        """Create a unique hash for exact content matching (no fuzzy matching)"""
+        """Create a unique hash for exact content matching (no fuzzy matching)
+
+        Returns the 16-byte xxh3_128 digest as BSON BinData: duplicate
+        detection needs no cryptographic strength, and raw bytes keep the
+        content_hash index far smaller than a 64-char hex string.
+        """
 
         lines = content.split("\n")
         time_keywords = [
@@ -72,14 +145,14 @@ class MongoDBManager:
         content_to_hash = "\n".join(non_time_lines)
 
         exact_content = content_to_hash.strip()
-        content_hash = hashlib.sha256(exact_content.encode("utf-8")).hexdigest()
-        safe_print(f"Created hash for content: {content_hash[:16]}...")
+        content_hash = Binary(xxhash.xxh3_128_digest(exact_content.encode("utf-8")))
+        safe_print(f"Created hash for content: {content_hash.hex()[:16]}...")
         return content_hash
 
     def post_exists(self, content_hash, content=None):
         """Check if a post with this exact hash already exists (no fuzzy matching)"""
 
-        safe_print(f"Checking if post exists with hash: {content_hash[:16]}...")
+        safe_print(f"Checking if post exists with hash: {content_hash.hex()[:16]}...")
         try:
             existing_post = self.collection.find_one(
                 {
@@ -97,7 +170,9 @@ class MongoDBManager:
         try:
             existing_post = self.collection.find_one({"content_hash": content_hash})
             if existing_post:
-                safe_print(f"Found exact duplicate with hash: {content_hash[:16]}...")
+                safe_print(
+                    f"Found exact duplicate with hash: {content_hash.hex()[:16]}..."
+                )
                 return existing_post
 
             return None
@@ -108,8 +183,19 @@ class MongoDBManager:
 
     # Removed fuzzy matching method - now using exact content matching only
 
-    def save_post(self, title, content, raw_content="", author="", posted_time=""):
-        """Save a new post to MongoDB with exact duplicate prevention"""
+    def save_post(
+        self,
+        title,
+        content,
+        raw_content="",
+        author="",
+        posted_time="",
+        extra_fields=None,
+    ):
+        """Save a new post to MongoDB with exact duplicate prevention
+
+        extra_fields are stored on the document as-is (e.g. {"_test": True}).
+        """
         try:
             # Create hash of exact content for precise duplicate detection
             content_hash = self.create_post_hash(content)
@@ -117,26 +203,23 @@ class MongoDBManager:
             # Check for exact duplicates only
             existing_post = self.post_exists(content_hash)
             if existing_post:
-                safe_print(f"Exact duplicate found with hash: {content_hash[:16]}...")
+                safe_print(
+                    f"Exact duplicate found with hash: {content_hash.hex()[:16]}..."
+                )
                 safe_print(
                     f"🔄 Exact duplicate exists: {existing_post.get('title', 'No Title')[:50]}..."
                 )
                 return False, "Exact duplicate post already exists"
 
-            post_data = {
-                "title": title.strip() if title else "No Title",
-                "content": content,
-                "raw_content": raw_content,
-                "content_hash": content_hash,
-                "author": author.strip() if author else "Unknown",
-                "posted_time": posted_time.strip() if posted_time else "",
-                "scraped_at": datetime.utcnow(),
-                "sent_to_telegram": False,
-                "created_at": datetime.utcnow(),
-                "updated_at": datetime.utcnow(),
-            }
-
-            post_data.update(self._extract_post_metadata(content))
+            post_data = self.build_post_document(
+                title,
+                content,
+                content_hash,
+                raw_content=raw_content,
+                author=author,
+                posted_time=posted_time,
+                extra_fields=extra_fields,
+            )
 
             result = self.collection.insert_one(post_data)
             safe_print(f"Saved new post with ID: {result.inserted_id}")
@@ -146,6 +229,34 @@ class MongoDBManager:
             safe_print(f"Error saving post: {e}")
             return False, str(e)
 
+    def build_post_document(
+        self,
+        title,
+        content,
+        content_hash,
+        raw_content="",
+        author="",
+        posted_time="",
+        extra_fields=None,
+    ):
+        """Build the document stored for a new post without saving it"""
+        post_data = {
+            "title": title.strip() if title else "No Title",
+            "content": content,
+            "raw_content": raw_content,
+            "content_hash": content_hash,
+            "author": author.strip() if author else "Unknown",
+            "posted_time": posted_time.strip() if posted_time else "",
+            "scraped_at": datetime.utcnow(),
+            "sent_to_telegram": False,
+            "created_at": datetime.utcnow(),
+            "updated_at": datetime.utcnow(),
+        }
+
+        post_data.update(self._extract_post_metadata(content))
+        post_data.update(extra_fields or {})
+        return post_data
+
     def _extract_post_metadata(self, content):
         """Extract metadata from post content"""
         metadata = {
@@ -208,13 +319,16 @@ class MongoDBManager:
 
         return metadata
 
-    def get_unsent_posts(self):
-        """Get all posts that haven't been sent to Telegram yet, sorted by oldest first (chronological order)"""
+    def get_unsent_posts(self, projection=None):
+        """Get all posts that haven't been sent to Telegram yet, sorted by oldest first (chronological order)
+
+        Pass a projection to fetch only the fields the caller needs.
+        """
         try:
             query = {"sent_to_telegram": {"$ne": True}}
 
             # Sort by created_at in ascending order (1) to send oldest messages first (chronological order)
-            cursor = self.collection.find(query).sort("created_at", -1)
+            cursor = self.collection.find(query, projection).sort("created_at", -1)
             posts = list(cursor)
 
             unsent_posts = []
@@ -236,6 +350,36 @@ class MongoDBManager:
             safe_print(f"Error getting unsent posts: {e}")
             return []
 
+    def get_unsent_post_ids(self):
+        """Get the ids of all unsent posts, oldest first, without their content"""
+        try:
+            cursor = self.collection.find(
+                {"sent_to_telegram": {"$ne": True}}, {"_id": 1}
+            ).sort("created_at", 1)
+            return [post["_id"] for post in cursor]
+
+        except Exception as e:
+            safe_print(f"Error getting unsent post ids: {e}")
+            return []
+
+    def get_post(self, post_id):
+        """Get a single post by its id (ObjectId or its string form)"""
+        try:
+            return self.collection.find_one({"_id": ObjectId(post_id)})
+
+        except Exception as e:
+            safe_print(f"Error getting post {post_id}: {e}")
+            return None
+
+    def count_unsent(self):
+        """Count posts not yet sent to Telegram without fetching the documents"""
+        try:
+            return self.collection.count_documents({"sent_to_telegram": {"$ne": True}})
+
+        except Exception as e:
+            safe_print(f"Error counting unsent posts: {e}")
+            return 0
+
     def mark_as_sent(self, post_id):
         """Mark a post as sent to Telegram"""
         try:
@@ -286,10 +430,15 @@ class MongoDBManager:
             safe_print(f"Error resetting send status: {e}")
             return False
 
-    def get_all_posts(self, limit=50):
-        """Get all posts with optional limit"""
+    def get_all_posts(self, limit=50, projection=None):
+        """Get all posts with optional limit
+
+        Pass a projection to fetch only the fields the caller needs.
+        """
         try:
-            cursor = self.collection.find().sort("created_at", -1).limit(limit)
+            cursor = (
+                self.collection.find({}, projection).sort("created_at", -1).limit(limit)
+            )
             return list(cursor)
 
         except Exception as e:
@@ -368,8 +517,11 @@ class MongoDBManager:
                 posts_to_keep = posts[0]
                 posts_to_delete = posts[1:]
 
+                content_hash = dup_group["_id"]
+                if isinstance(content_hash, bytes):
+                    content_hash = content_hash.hex()
                 safe_print(
-                    f"  📝 Hash: {dup_group['_id'][:16]}... ({count} duplicates)"
+                    f"  📝 Hash: {str(content_hash)[:16]}... ({count} duplicates)"
                 )
                 safe_print(f"     Keeping: {posts_to_keep['title'][:50]}...")
 
@@ -404,10 +556,13 @@ class MongoDBManager:
             return {"error": str(e)}
 
     def close_connection(self):
-        """Close MongoDB connection"""
+        """Release this manager's MongoDB handle
+
+        The underlying client is a shared connection pool, so it is left open
+        for other managers; use config.close_mongo_client() at shutdown.
+        """
         if self.client:
-            self.client.close()
-            safe_print("MongoDB connection closed")
+            safe_print("MongoDB connection released")
 
     # User Management Methods
     def add_user(self, user_id, username=None, first_name=None, last_name=None):
@@ -565,3 +720,150 @@ class MongoDBManager:
             return 0
 
     # ...existing code...
+
+
+class AsyncMongoDBManager:
+    """Motor-backed counterpart of MongoDBManager for use inside coroutines
+
+    Collections are resolved on every call so a single manager can be reused
+    across event loops; get_async_mongo_client() keeps one client per loop.
+    """
+
+    # Hashing and document building are pure, so share them with the sync manager
+    create_post_hash = MongoDBManager.create_post_hash
+    build_post_document = MongoDBManager.build_post_document
+    _extract_post_metadata = MongoDBManager._extract_post_metadata
+
+    def __init__(self, client=None):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.client = client
+
+    @property
+    def db(self):
+        return (self.client or get_async_mongo_client())["SupersetPlacement"]
+
+    @property
+    def collection(self):
+        return self.db["Posts"]
+
+    @property
+    def users_collection(self):
+        return self.db["Users"]
+
+    async def save_post(
+        self,
+        title,
+        content,
+        raw_content="",
+        author="",
+        posted_time="",
+        extra_fields=None,
+    ):
+        """Save a new post to MongoDB with exact duplicate prevention
+
+        extra_fields are stored on the document as-is (e.g. {"_test": True}).
+        """
+        try:
+            content_hash = self.create_post_hash(content)
+
+            existing_post = await self.collection.find_one(
+                {"content_hash": content_hash}, {"title": 1}
+            )
+            if existing_post:
+                safe_print(
+                    f"🔄 Exact duplicate exists: {existing_post.get('title', 'No Title')[:50]}..."
+                )
+                return False, "Exact duplicate post already exists"
+
+            post_data = self.build_post_document(
+                title,
+                content,
+                content_hash,
+                raw_content=raw_content,
+                author=author,
+                posted_time=posted_time,
+                extra_fields=extra_fields,
+            )
+
+            result = await self.collection.insert_one(post_data)
+            safe_print(f"Saved new post with ID: {result.inserted_id}")
+            return True, str(result.inserted_id)
+
+        except Exception as e:
+            safe_print(f"Error saving post: {e}")
+            return False, str(e)
+
+    async def get_unsent_posts(self):
+        """Get all posts that haven't been sent to Telegram yet"""
+        try:
+            cursor = self.collection.find({"sent_to_telegram": {"$ne": True}}).sort(
+                "created_at", -1
+            )
+            unsent_posts = await cursor.to_list(length=None)
+            safe_print(f"Found {len(unsent_posts)} unsent posts")
+            return unsent_posts
+
+        except Exception as e:
+            safe_print(f"Error getting unsent posts: {e}")
+            return []
+
+    async def get_unsent_post_ids(self):
+        """Get the ids of all unsent posts, oldest first, without their content"""
+        try:
+            cursor = self.collection.find(
+                {"sent_to_telegram": {"$ne": True}}, {"_id": 1}
+            ).sort("created_at", 1)
+            return [post["_id"] async for post in cursor]
+
+        except Exception as e:
+            safe_print(f"Error getting unsent post ids: {e}")
+            return []
+
+    async def get_post(self, post_id):
+        """Get a single post by its id (ObjectId or its string form)"""
+        try:
+            return await self.collection.find_one({"_id": ObjectId(post_id)})
+
+        except Exception as e:
+            safe_print(f"Error getting post {post_id}: {e}")
+            return None
+
+    async def count_unsent(self):
+        """Count posts not yet sent to Telegram without fetching the documents"""
+        try:
+            return await self.collection.count_documents(
+                {"sent_to_telegram": {"$ne": True}}
+            )
+
+        except Exception as e:
+            safe_print(f"Error counting unsent posts: {e}")
+            return 0
+
+    async def mark_as_sent(self, post_id):
+        """Mark a post as sent to Telegram"""
+        try:
+            result = await self.collection.update_one(
+                {"_id": post_id},
+                {
+                    "$set": {
+                        "sent_to_telegram": True,
+                        "sent_at": datetime.utcnow(),
+                        "updated_at": datetime.utcnow(),
+                    }
+                },
+            )
+            return result.modified_count > 0
+
+        except Exception as e:
+            safe_print(f"Error marking post as sent: {e}")
+            return False
+
+    async def get_all_users(self):
+        """Get all active users"""
+        try:
+            return await self.users_collection.find({"is_active": True}).to_list(
+                length=None
+            )
+        except Exception as e:
+            safe_print(f"Error getting users: {e}")
+            return []
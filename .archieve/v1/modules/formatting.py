@@ -1,102 +1,179 @@
 import re
 import os
+import asyncio
 import logging
 from datetime import datetime
-from .database import MongoDBManager
+from typing import NamedTuple
+from .database import MongoDBManager, AsyncMongoDBManager
 from .config import safe_print
 
+# Link patterns are compiled once at import instead of on every call
+URL_PATTERN = re.compile(r'(https?://[^\s<>"]+|www\.[^\s<>"]+)')
+
+# Subdomain-only URLs (like apple.adobe or hiring.justpay): at least one dot
+# and no spaces or common punctuation
+SUBDOMAIN_PATTERN = re.compile(
+    r"([a-zA-Z0-9][-a-zA-Z0-9]*\.[a-zA-Z0-9][-a-zA-Z0-9\.]*\.[a-zA-Z]{2,}|\b[a-zA-Z0-9][-a-zA-Z0-9]*\.[a-zA-Z]{2,})"
+)
+
+HTML_LINK_PATTERN = re.compile(
+    r'<a\s+(?:[^>]*?\s+)?href=["\'](.*?)["\'].*?>(.*?)<\/a>', re.IGNORECASE
+)
+
+# Version numbers like 1.2 or 1.2.3 and dates like 17.06.2023
+VERSION_OR_DATE_PATTERN = re.compile(
+    r"^(?:\d+\.\d+|\d+\.\d+\.\d+|\d{1,2}\.\d{1,2}\.\d{2,4})$"
+)
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif")
+
+EXTRA_NEWLINES_PATTERN = re.compile(r"\n{3,}")
+
+
+def is_probable_domain(match):
+    """Filter out subdomain matches that are really versions, dates or images"""
+    return not VERSION_OR_DATE_PATTERN.match(match) and not match.endswith(
+        IMAGE_EXTENSIONS
+    )
+
+
+class FormatResult(NamedTuple):
+    """Outcome of a formatting pass"""
+
+    success: bool
+    new_posts: int = 0
+    total_processed: int = 0
+    error: str | None = None
+
 
 class TextFormatter:
-    def __init__(self):
+    def __init__(self, mongo_client=None):
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.db_manager = MongoDBManager()
+        self.db_manager = MongoDBManager(client=mongo_client)
+        self.async_db_manager = AsyncMongoDBManager()
         self.logger.info("TextFormatter initialized")
 
-    def format_content(self):
-        """Main method to enhance formatting of posts in the database"""
-        self.logger.info("Starting content formatting enhancement")
-        try:
-            # Get all posts that need formatting enhancement
-            posts = self.db_manager.collection.find(
+    def get_posts_to_format(self):
+        """Fetch all unsent posts, oldest first, for formatting enhancement"""
+        return list(
+            self.db_manager.collection.find(
                 {
                     "sent_to_telegram": {
                         "$ne": True,
                     },
                 }
             ).sort("created_at", 1)
+        )
+
+    def format_post(self, post):
+        """Enhance the formatting of a single post and persist it
+
+        The post dict is updated in place so it can be handed straight to the
+        Telegram sender. Returns True if the stored content was changed.
+        """
+        try:
+            # Check if post needs enhanced formatting
+            current_content = post.get("content", "")
+            raw_content = post.get("raw_content", "")
+
+            if not raw_content:
+                return False
+
+            # Apply enhanced formatting
+            content_lines = raw_content.split("\n")
+            enhanced_content = self.format_placement_message(content_lines)
+
+            # Only update if enhanced content is significantly different or better
+            if not enhanced_content or enhanced_content == current_content:
+                return False
+
+            # Update the post with enhanced formatting
+            result = self.db_manager.collection.update_one(
+                {"_id": post["_id"]},
+                {
+                    "$set": {
+                        "content": enhanced_content,
+                        "updated_at": datetime.utcnow(),
+                    }
+                },
+            )
+            post["content"] = enhanced_content
+
+            if result.modified_count > 0:
+                title = post.get("title", "No Title")
+                success_msg = f"✅ Enhanced formatting for: {title[:50]}..."
+                safe_print(success_msg)
+                self.logger.debug(success_msg)
+                return True
+
+            return False
 
-            posts_list = list(posts)
+        except Exception as post_error:
+            error_msg = f"Error processing post {post.get('_id')}: {post_error}"
+            safe_print(error_msg)
+            self.logger.error(error_msg, exc_info=True)
+            return False
+
+    def format_content(self):
+        """Main method to enhance formatting of posts in the database"""
+        self.logger.info("Starting content formatting enhancement")
+        try:
+            # Get all posts that need formatting enhancement
+            posts_list = self.get_posts_to_format()
             if not posts_list:
                 msg = "No posts found to format"
                 safe_print(msg)
                 self.logger.info(msg)
-                return {
-                    "success": True,
-                    "new_posts": 0,
-                    "total_processed": 0,
-                }
+                return FormatResult(success=True)
 
-            enhanced_count = 0
             total_processed = len(posts_list)
 
             self.logger.info(f"Found {total_processed} posts to process for formatting")
 
-            for post in posts_list:
-                try:
-                    # Check if post needs enhanced formatting
-                    current_content = post.get("content", "")
-                    raw_content = post.get("raw_content", "")
-
-                    if raw_content:
-                        # Apply enhanced formatting
-                        content_lines = raw_content.split("\n")
-                        enhanced_content = self.format_placement_message(content_lines)
-
-                        # Only update if enhanced content is significantly different or better
-                        if enhanced_content and enhanced_content != current_content:
-                            # Update the post with enhanced formatting
-                            result = self.db_manager.collection.update_one(
-                                {"_id": post["_id"]},
-                                {
-                                    "$set": {
-                                        "content": enhanced_content,
-                                        "updated_at": datetime.utcnow(),
-                                    }
-                                },
-                            )
-
-                            if result.modified_count > 0:
-                                enhanced_count += 1
-                                title = post.get("title", "No Title")
-                                success_msg = (
-                                    f"✅ Enhanced formatting for: {title[:50]}..."
-                                )
-                                safe_print(success_msg)
-                                self.logger.debug(success_msg)
-
-                except Exception as post_error:
-                    error_msg = f"Error processing post {post.get('_id')}: {post_error}"
-                    safe_print(error_msg)
-                    self.logger.error(error_msg, exc_info=True)
-                    continue
+            enhanced_count = sum(1 for post in posts_list if self.format_post(post))
 
-            summary_msg = f"📝 Formatting enhancement completed: Posts processed: {total_processed}, Posts enhanced: {enhanced_count}"
-            safe_print(f"📝 Formatting enhancement completed:")
-            safe_print(f"   Posts processed: {total_processed}")
-            safe_print(f"   Posts enhanced: {enhanced_count}")
-            self.logger.info(summary_msg)
+            self.log_format_summary(total_processed, enhanced_count)
 
-            return {
-                "success": True,
-                "new_posts": enhanced_count,
-                "total_processed": total_processed,
-            }
+            return FormatResult(
+                success=True,
+                new_posts=enhanced_count,
+                total_processed=total_processed,
+            )
 
         except Exception as e:
             error_msg = f"Error during text formatting: {e}"
             safe_print(error_msg)
             self.logger.error(error_msg, exc_info=True)
-            return {"success": False, "error": str(e)}
+            return FormatResult(success=False, error=str(e))
+
+    async def worker(self, raw_q, ready_q):
+        """Format posts whose ids arrive on raw_q and pass them on to ready_q
+
+        Runs until it receives a None sentinel. Returns a
+        (posts_processed, posts_enhanced) tuple for this worker.
+        """
+        processed_count = 0
+        enhanced_count = 0
+
+        while (post_id := await raw_q.get()) is not None:
+            post = await self.async_db_manager.get_post(post_id)
+            if post is None:
+                continue
+
+            processed_count += 1
+            if await asyncio.to_thread(self.format_post, post):
+                enhanced_count += 1
+            await ready_q.put(post)
+
+        return processed_count, enhanced_count
+
+    def log_format_summary(self, total_processed, enhanced_count):
+        """Print and log the outcome of a formatting pass"""
+        summary_msg = f"📝 Formatting enhancement completed: Posts processed: {total_processed}, Posts enhanced: {enhanced_count}"
+        safe_print(f"📝 Formatting enhancement completed:")
+        safe_print(f"   Posts processed: {total_processed}")
+        safe_print(f"   Posts enhanced: {enhanced_count}")
+        self.logger.info(summary_msg)
 
     def extract_post_metadata(self, content_lines):
         """Extract title, author, and posted time from content lines"""
@@ -310,26 +387,12 @@ class TextFormatter:
         if "http" in line.lower() or "www." in line.lower():
             return True
 
-        # Check for subdomain patterns like apple.adobe or hiring.justpay
-        subdomain_pattern = re.compile(
-            r"([a-zA-Z0-9][-a-zA-Z0-9]*\.[a-zA-Z0-9][-a-zA-Z0-9\.]*\.[a-zA-Z]{2,}|\b[a-zA-Z0-9][-a-zA-Z0-9]*\.[a-zA-Z]{2,})"
+        # Check for subdomain patterns like apple.adobe or hiring.justpay,
+        # filtering out common false positives
+        return any(
+            is_probable_domain(match)
+            for match in SUBDOMAIN_PATTERN.findall(line.lower())
         )
-        matches = subdomain_pattern.findall(line.lower())
-
-        # Filter out common false positives
-        for match in matches:
-            if (
-                not re.match(r"^\d+\.\d+$", match)  # Not version numbers
-                and not re.match(r"^\d+\.\d+\.\d+$", match)  # Not version numbers
-                and not re.match(r"^\d{1,2}\.\d{1,2}\.\d{2,4}$", match)  # Not dates
-                and not match.endswith(".png")  # Not image extensions
-                and not match.endswith(".jpg")
-                and not match.endswith(".jpeg")
-                and not match.endswith(".gif")
-            ):
-                return True
-
-        return False
 
     def extract_and_add_links(self, text):
         """Extract links from text without appending them to the message
@@ -339,20 +402,6 @@ class TextFormatter:
         It also handles subdomain-only URLs like "apple.adobe" or "hiring.justpay".
         The extracted links are processed but not added to the final message.
         """
-        # Regular expression to find standard URLs in text
-        url_pattern = re.compile(r'(https?://[^\s<>"]+|www\.[^\s<>"]+)')
-
-        # Regular expression for subdomain-only URLs (like apple.adobe or hiring.justpay)
-        # Matches domain patterns that have at least one dot and don't have spaces or common punctuation
-        subdomain_pattern = re.compile(
-            r"([a-zA-Z0-9][-a-zA-Z0-9]*\.[a-zA-Z0-9][-a-zA-Z0-9\.]*\.[a-zA-Z]{2,}|\b[a-zA-Z0-9][-a-zA-Z0-9]*\.[a-zA-Z]{2,})"
-        )
-
-        # Regular expression to find HTML anchor tags
-        html_link_pattern = re.compile(
-            r'<a\s+(?:[^>]*?\s+)?href=["\'](.*?)["\'].*?>(.*?)<\/a>', re.IGNORECASE
-        )
-
         # Process each line but don't append extracted links
         lines = text.split("\n")
         result_lines = []
@@ -367,32 +416,22 @@ class TextFormatter:
 
             # Extract links for processing but don't append them to result
             # Check for HTML links
-            html_matches = html_link_pattern.findall(line)
+            html_matches = HTML_LINK_PATTERN.findall(line)
             if html_matches:
                 # Links are extracted but not added to result_lines
                 continue
 
             # Look for standard URLs in the text
-            matches = url_pattern.findall(line)
+            matches = URL_PATTERN.findall(line)
             if matches:
                 # Links are extracted but not added to result_lines
                 continue
 
             # Look for subdomain-only URLs
-            subdomain_matches = subdomain_pattern.findall(line)
+            subdomain_matches = SUBDOMAIN_PATTERN.findall(line)
             for domain in subdomain_matches:
                 # Filter out common false positives like "v1.0" or dates like "17.06.2023"
-                if (
-                    not re.match(r"^\d+\.\d+$", domain)  # Not version numbers
-                    and not re.match(r"^\d+\.\d+\.\d+$", domain)  # Not version numbers
-                    and not re.match(
-                        r"^\d{1,2}\.\d{1,2}\.\d{2,4}$", domain
-                    )  # Not dates
-                    and not domain.endswith(".png")  # Not image extensions
-                    and not domain.endswith(".jpg")
-                    and not domain.endswith(".jpeg")
-                    and not domain.endswith(".gif")
-                ):
+                if is_probable_domain(domain):
                     # Links are extracted but not added to result_lines
                     pass
 
@@ -401,5 +440,5 @@ class TextFormatter:
     def clean_extra_newlines(self, text):
         """Clean up excessive newlines"""
         # Replace multiple newlines with maximum of 2
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        text = EXTRA_NEWLINES_PATTERN.sub("\n\n", text)
         return text.strip()
@@ -1,11 +1,14 @@
 import dotenv
 import os
 import re
+import json
 import time
+import asyncio
 import logging
-import requests
-from .database import MongoDBManager
-from .config import safe_print
+import aiohttp
+from contextlib import asynccontextmanager
+from .database import MongoDBManager, AsyncMongoDBManager
+from .config import safe_print, create_http_session
 from telegram import Update, Bot
 from telegram.ext import (
     Application,
@@ -15,13 +18,49 @@ from telegram.ext import (
 
 dotenv.load_dotenv()
 
+# Telegram allows roughly 30 messages per second across all chats
+TELEGRAM_MESSAGES_PER_SECOND = 30
+TELEGRAM_MAX_CONCURRENT_SENDS = 30
+TELEGRAM_MAX_RETRIES = 3
+TELEGRAM_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+
+class RateLimiter:
+    """Token bucket that spaces out awaiting callers to a fixed rate per second"""
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.tokens = rate
+        self.updated_at = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available and consume it"""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.rate, self.tokens + (now - self.updated_at) * self.rate
+                )
+                self.updated_at = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
 
 class TelegramBot:
-    def __init__(self):
+    def __init__(self, mongo_client=None):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
         self.TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
-        self.db_manager = MongoDBManager()
+        self.db_manager = MongoDBManager(client=mongo_client)
+        self.async_db_manager = AsyncMongoDBManager()
+        self._send_limits_loop = None
+        self._send_semaphore = None
+        self._rate_limiter = None
         self.bot = (
             Bot(token=self.TELEGRAM_BOT_TOKEN) if self.TELEGRAM_BOT_TOKEN else None
         )
@@ -244,7 +283,7 @@ class TelegramBot:
                 return
 
             # Send broadcast message
-            success = self.broadcast_to_all_users(broadcast_message)
+            success = await self.broadcast_to_all_users(broadcast_message)
             if success:
                 await update.message.reply_text("✅ Message broadcasted successfully!")
             else:
@@ -266,22 +305,17 @@ class TelegramBot:
             target_chat_id, target_message = parts
 
             # Send to specific user
-            url = f"https://api.telegram.org/bot{self.TELEGRAM_BOT_TOKEN}/sendMessage"
-            payload = {
-                "chat_id": target_chat_id,
-                "text": target_message,
-                "parse_mode": "HTML",
-                "disable_web_page_preview": True,
-            }
-
-            response = requests.post(url, json=payload)
+            async with self._http_session() as session:
+                status, response_text = await self.send_one(
+                    session, target_chat_id, target_message
+                )
 
-            if response.status_code == 200:
+            if status == 200:
                 await update.message.reply_text(
                     f"✅ Message sent to user {target_chat_id}"
                 )
             else:
-                error_msg = f"Failed to send message: {response.text}"
+                error_msg = f"Failed to send message: {response_text}"
                 await update.message.reply_text(f"❌ {error_msg}")
                 safe_print(error_msg)
 
@@ -308,7 +342,7 @@ class TelegramBot:
         try:
             from main import main as run_main_process
 
-            result = run_main_process(daemon_mode=True)
+            result = await run_main_process(daemon_mode=True)
             if result == 0:
                 await update.message.reply_text(
                     "✅ main.py workflow completed successfully!"
@@ -371,6 +405,75 @@ class TelegramBot:
         except Exception as e:
             await update.message.reply_text(f"❌ Error reading log file: {e}")
 
+    @asynccontextmanager
+    async def _http_session(self, session=None):
+        """Yield the caller's aiohttp session, or a short-lived one if none was given"""
+        if session is not None:
+            yield session
+            return
+
+        async with create_http_session() as own_session:
+            yield own_session
+
+    def _send_limits(self):
+        """Return the concurrency semaphore and rate limiter for the running loop
+
+        They are rebuilt whenever the event loop changes, since asyncio
+        primitives cannot be shared across loops.
+        """
+        loop = asyncio.get_running_loop()
+        if self._send_limits_loop is not loop:
+            self._send_semaphore = asyncio.Semaphore(TELEGRAM_MAX_CONCURRENT_SENDS)
+            self._rate_limiter = RateLimiter(TELEGRAM_MESSAGES_PER_SECOND)
+            self._send_limits_loop = loop
+        return self._send_semaphore, self._rate_limiter
+
+    @staticmethod
+    def _retry_after(response_text):
+        """Read the back-off delay Telegram returns with an HTTP 429"""
+        try:
+            return json.loads(response_text)["parameters"]["retry_after"]
+        except (ValueError, KeyError, TypeError):
+            return 1
+
+    async def _post_message(self, session, payload):
+        """POST a sendMessage payload to the Telegram Bot API
+
+        Calls are bounded by a shared semaphore and rate limiter, and retried
+        after the advertised delay when Telegram answers 429.
+        Returns a (status_code, response_text) tuple.
+        """
+        url = f"https://api.telegram.org/bot{self.TELEGRAM_BOT_TOKEN}/sendMessage"
+        semaphore, rate_limiter = self._send_limits()
+
+        async with semaphore:
+            for attempt in range(TELEGRAM_MAX_RETRIES + 1):
+                await rate_limiter.acquire()
+                async with session.post(
+                    url, json=payload, timeout=TELEGRAM_REQUEST_TIMEOUT
+                ) as response:
+                    status, response_text = response.status, await response.text()
+
+                if status != 429 or attempt == TELEGRAM_MAX_RETRIES:
+                    return status, response_text
+
+                retry_after = self._retry_after(response_text)
+                safe_print(f"Rate limited by Telegram, retrying in {retry_after}s...")
+                await asyncio.sleep(retry_after)
+
+    async def send_one(self, session, chat_id, text, parse_mode="HTML"):
+        """Send one message to one chat
+
+        Returns a (status_code, response_text) tuple.
+        """
+        payload = {
+            "chat_id": chat_id,
+            "text": text,
+            "parse_mode": parse_mode,
+            "disable_web_page_preview": True,
+        }
+        return await self._post_message(session, payload)
+
     @staticmethod
     def escape_html(text):
         """Escape HTML special characters for Telegram HTML parse mode"""
@@ -393,54 +496,71 @@ class TelegramBot:
             safe_print(f"Error testing Telegram connection: {e}")
             return False
 
-    def send_message(self, message, parse_mode="MarkdownV2"):
+    async def get_me(self, session=None):
+        """Verify the bot token with a getMe call over the shared HTTP session
+
+        Returns the bot's user object, or None if Telegram rejects the token.
+        """
+        url = f"https://api.telegram.org/bot{self.TELEGRAM_BOT_TOKEN}/getMe"
+        try:
+            async with self._http_session(session) as session:
+                async with session.get(
+                    url, timeout=TELEGRAM_REQUEST_TIMEOUT
+                ) as response:
+                    data = await response.json()
+            return data.get("result") if data.get("ok") else None
+
+        except Exception as e:
+            safe_print(f"Error calling Telegram getMe: {e}")
+            return None
+
+    async def send_message(self, message, parse_mode="MarkdownV2", session=None):
         """Send a message to Telegram, automatically splitting if too long"""
         try:
             if not self.TELEGRAM_BOT_TOKEN or not self.TELEGRAM_CHAT_ID:
                 safe_print("Error: Telegram bot token or chat ID not configured")
                 return False
 
-            # Check if message needs to be split
-            if len(message) > 4000:
-                safe_print(
-                    f"Message too long ({len(message)} chars), splitting into chunks..."
-                )
-                chunks = self.split_long_message(message, max_length=4000)
-                chunks_sent = 0
-
-                for i, chunk in enumerate(chunks, 1):
+            async with self._http_session(session) as session:
+                # Check if message needs to be split
+                if len(message) > 4000:
                     safe_print(
-                        f"  Sending chunk {i}/{len(chunks)} ({len(chunk)} chars)..."
+                        f"Message too long ({len(message)} chars), splitting into chunks..."
                     )
-                    if self._send_single_message(chunk, parse_mode):
-                        chunks_sent += 1
-                        if i < len(chunks):  # Don't delay after the last chunk
-                            time.sleep(1)  # Rate limiting between chunks
-                    else:
-                        safe_print(f"  ❌ Failed to send chunk {i}/{len(chunks)}")
-                        break
+                    chunks = self.split_long_message(message, max_length=4000)
+                    chunks_sent = 0
+
+                    for i, chunk in enumerate(chunks, 1):
+                        safe_print(
+                            f"  Sending chunk {i}/{len(chunks)} ({len(chunk)} chars)..."
+                        )
+                        if await self._send_single_message(session, chunk, parse_mode):
+                            chunks_sent += 1
+                            if i < len(chunks):  # Don't delay after the last chunk
+                                await asyncio.sleep(1)  # Rate limiting between chunks
+                        else:
+                            safe_print(f"  ❌ Failed to send chunk {i}/{len(chunks)}")
+                            break
 
-                success = chunks_sent == len(chunks)
-                if success:
-                    safe_print(f"✅ All {len(chunks)} chunks sent successfully")
+                    success = chunks_sent == len(chunks)
+                    if success:
+                        safe_print(f"✅ All {len(chunks)} chunks sent successfully")
+                    else:
+                        safe_print(
+                            f"⚠️  Partial send: {chunks_sent}/{len(chunks)} chunks sent"
+                        )
+                    return success
                 else:
-                    safe_print(
-                        f"⚠️  Partial send: {chunks_sent}/{len(chunks)} chunks sent"
-                    )
-                return success
-            else:
-                # Single message, send normally
-                return self._send_single_message(message, parse_mode)
+                    # Single message, send normally
+                    return await self._send_single_message(session, message, parse_mode)
 
         except Exception as e:
             safe_print(f"Error sending Telegram message: {e}")
             return False
 
-    def _send_single_message(self, message, parse_mode="MarkdownV2"):
+    async def _send_single_message(self, session, message, parse_mode="MarkdownV2"):
         """Send a single message chunk to Telegram"""
         try:
-            url = f"https://api.telegram.org/bot{self.TELEGRAM_BOT_TOKEN}/sendMessage"
-
             if parse_mode == "MarkdownV2":
                 formatted_message = self.convert_markdown_to_telegram(message)
             else:
@@ -453,23 +573,21 @@ class TelegramBot:
                 "disable_web_page_preview": True,
             }
 
-            response = requests.post(url, json=payload)
+            status, response_text = await self._post_message(session, payload)
 
-            if response.status_code == 200:
+            if status == 200:
                 safe_print(
                     f"Message sent successfully (length: {len(formatted_message)} chars)"
                 )
                 return True
             else:
-                safe_print(
-                    f"Failed to send message. Status code: {response.status_code}"
-                )
-                safe_print(f"Response: {response.text}")
+                safe_print(f"Failed to send message. Status code: {status}")
+                safe_print(f"Response: {response_text}")
 
                 # if MarkdownV2 fails, retry with plain text
                 if parse_mode == "MarkdownV2":
                     safe_print("Retrying with plain text...")
-                    return self._send_single_message(message, "")
+                    return await self._send_single_message(session, message, "")
 
                 return False
 
@@ -478,58 +596,61 @@ class TelegramBot:
             # fallback plain text
             if parse_mode == "MarkdownV2":
                 safe_print("Retrying with plain text...")
-                return self._send_single_message(message, "")
+                return await self._send_single_message(session, message, "")
 
             return False
 
-    def send_message_html(self, message):
+    async def send_message_html(self, message, session=None):
         """Send message using HTML formatting, automatically splitting if too long"""
         try:
             if not self.TELEGRAM_BOT_TOKEN or not self.TELEGRAM_CHAT_ID:
                 safe_print("Error: Telegram bot token or chat ID not configured")
                 return False
 
-            # Check if message needs to be split
-            if len(message) > 4000:
-                safe_print(
-                    f"HTML message too long ({len(message)} chars), splitting into chunks..."
-                )
-                chunks = self.split_long_message(message, max_length=4000)
-                chunks_sent = 0
-
-                for i, chunk in enumerate(chunks, 1):
+            async with self._http_session(session) as session:
+                # Check if message needs to be split
+                if len(message) > 4000:
                     safe_print(
-                        f"  Sending HTML chunk {i}/{len(chunks)} ({len(chunk)} chars)..."
+                        f"HTML message too long ({len(message)} chars), splitting into chunks..."
                     )
-                    if self._send_single_html_message(chunk):
-                        chunks_sent += 1
-                        if i < len(chunks):  # Don't delay after the last chunk
-                            time.sleep(1)  # Rate limiting between chunks
-                    else:
-                        safe_print(f"  ❌ Failed to send HTML chunk {i}/{len(chunks)}")
-                        break
+                    chunks = self.split_long_message(message, max_length=4000)
+                    chunks_sent = 0
+
+                    for i, chunk in enumerate(chunks, 1):
+                        safe_print(
+                            f"  Sending HTML chunk {i}/{len(chunks)} ({len(chunk)} chars)..."
+                        )
+                        if await self._send_single_html_message(session, chunk):
+                            chunks_sent += 1
+                            if i < len(chunks):  # Don't delay after the last chunk
+                                await asyncio.sleep(1)  # Rate limiting between chunks
+                        else:
+                            safe_print(
+                                f"  ❌ Failed to send HTML chunk {i}/{len(chunks)}"
+                            )
+                            break
 
-                success = chunks_sent == len(chunks)
-                if success:
-                    safe_print(f"✅ All {len(chunks)} HTML chunks sent successfully")
+                    success = chunks_sent == len(chunks)
+                    if success:
+                        safe_print(
+                            f"✅ All {len(chunks)} HTML chunks sent successfully"
+                        )
+                    else:
+                        safe_print(
+                            f"⚠️  Partial HTML send: {chunks_sent}/{len(chunks)} chunks sent"
+                        )
+                    return success
                 else:
-                    safe_print(
-                        f"⚠️  Partial HTML send: {chunks_sent}/{len(chunks)} chunks sent"
-                    )
-                return success
-            else:
-                # Single message, send normally
-                return self._send_single_html_message(message)
+                    # Single message, send normally
+                    return await self._send_single_html_message(session, message)
 
         except Exception as e:
             safe_print(f"Error sending HTML Telegram message: {e}")
             return False
 
-    def _send_single_html_message(self, message):
+    async def _send_single_html_message(self, session, message):
         """Send a single HTML message chunk to Telegram"""
         try:
-            url = f"https://api.telegram.org/bot{self.TELEGRAM_BOT_TOKEN}/sendMessage"
-
             html_message = self.convert_markdown_to_html(message)
 
             payload = {
@@ -539,37 +660,35 @@ class TelegramBot:
                 "disable_web_page_preview": True,
             }
 
-            response = requests.post(url, json=payload)
+            status, response_text = await self._post_message(session, payload)
 
-            if response.status_code == 200:
+            if status == 200:
                 safe_print(
                     f"HTML message sent successfully (length: {len(html_message)} chars)"
                 )
                 return True
             else:
-                safe_print(
-                    f"Failed to send HTML message. Status code: {response.status_code}"
-                )
-                safe_print(f"Response: {response.text}")
+                safe_print(f"Failed to send HTML message. Status code: {status}")
+                safe_print(f"Response: {response_text}")
 
                 # Fallback to plain text
                 payload["parse_mode"] = ""
                 payload["text"] = message
-                response = requests.post(url, json=payload)
-                return response.status_code == 200
+                status, _ = await self._post_message(session, payload)
+                return status == 200
 
         except Exception as e:
             safe_print(f"Error sending single HTML Telegram message: {e}")
             return False
 
-    def send_new_posts_from_db(self):
+    async def send_new_posts_from_db(self, session=None):
         """Send new posts to all registered users"""
-        return self.send_new_posts_to_all_users()
+        return await self.send_new_posts_to_all_users(session)
 
-    def send_markdown_file(self):
+    async def send_markdown_file(self, session=None):
         """Legacy method - now redirects to database-based sending"""
         safe_print("Using database-based post sending instead of markdown file...")
-        return self.send_new_posts_from_db()
+        return await self.send_new_posts_from_db(session)
 
     def split_long_message(self, message, max_length=4000):
         """Split a long message into smaller chunks while preserving markdown formatting"""
@@ -735,7 +854,7 @@ class TelegramBot:
             safe_print(f"Error getting send status summary: {e}")
             return {}
 
-    def validate_and_send_post(self, post):
+    async def validate_and_send_post(self, post, session=None):
         """Validate a post and send it if it hasn't been sent already"""
         try:
             post_id = post["_id"]
@@ -743,7 +862,9 @@ class TelegramBot:
             post_content = post.get("content", "")
 
             if not post_content.strip():
-                safe_print(f"⚠️  Skipping post with empty content: {post_title[:50]}...")
+                safe_print(
+                    f"⚠️  Skipping post with empty content: {post_title[:50]}..."
+                )
                 return False, "Empty content"
 
             current_post = self.db_manager.collection.find_one({"_id": post_id})
@@ -769,9 +890,9 @@ class TelegramBot:
 
                 for j, chunk in enumerate(chunks, 1):
                     safe_print(f"  Sending chunk {j}/{len(chunks)}...")
-                    if self.send_message_html(chunk):
+                    if await self.send_message_html(chunk, session=session):
                         chunks_sent += 1
-                        time.sleep(1)  # Rate limiting between chunks
+                        await asyncio.sleep(1)  # Rate limiting between chunks
                     else:
                         safe_print(f"  ❌ Failed to send chunk {j}/{len(chunks)}")
                         break
@@ -784,7 +905,7 @@ class TelegramBot:
                     )
                     return False, f"Partial send: {chunks_sent}/{len(chunks)} chunks"
             else:
-                success = self.send_message_html(post_content)
+                success = await self.send_message_html(post_content, session=session)
 
             if success:
 
@@ -831,17 +952,17 @@ class TelegramBot:
             safe_print(f"❌ Exception while processing post: {e}")
             return False, f"Exception: {str(e)}"
 
-    def broadcast_to_all_users(self, message, parse_mode="HTML"):
+    async def broadcast_to_all_users(
+        self, message, parse_mode="HTML", session=None, users=None
+    ):
         """Broadcast a message to all registered users, automatically splitting if too long"""
         try:
-            users = self.db_manager.get_all_users()
+            if users is None:
+                users = await self.async_db_manager.get_all_users()
             if not users:
                 safe_print("No users found to broadcast to")
                 return False
 
-            successful_sends = 0
-            failed_sends = 0
-
             safe_print(f"Broadcasting to {len(users)} users...")
 
             # Check if message needs to be split
@@ -855,85 +976,131 @@ class TelegramBot:
             else:
                 message_chunks = [message]
 
-            for user in users:
-                try:
-                    user_id = user.get("user_id")
-                    username = user.get("username", "Unknown")
-                    user_success = True
-
-                    # Send all chunks to this user
-                    for chunk_index, chunk in enumerate(message_chunks, 1):
-                        if len(message_chunks) > 1:
-                            safe_print(
-                                f"  Sending chunk {chunk_index}/{len(message_chunks)} to user {user_id} (@{username})"
-                            )
+            async with self._http_session(session) as session:
+                results = await asyncio.gather(
+                    *(
+                        self._send_chunks_to_user(
+                            session, user, message_chunks, parse_mode
+                        )
+                        for user in users
+                    )
+                )
 
-                        url = f"https://api.telegram.org/bot{self.TELEGRAM_BOT_TOKEN}/sendMessage"
-                        payload = {
-                            "chat_id": user_id,
-                            "text": chunk,
-                            "parse_mode": parse_mode,
-                            "disable_web_page_preview": True,
-                        }
+            successful_sends = sum(results)
+            failed_sends = len(results) - successful_sends
 
-                        response = requests.post(url, json=payload)
+            safe_print(
+                f"Broadcast complete: {successful_sends} sent, {failed_sends} failed"
+            )
+            return successful_sends > 0
 
-                        if response.status_code == 200:
-                            if len(message_chunks) == 1:
-                                safe_print(f"✅ Sent to user {user_id} (@{username})")
-                        else:
-                            user_success = False
-                            safe_print(
-                                f"❌ Failed to send chunk {chunk_index} to user {user_id} (@{username}): {response.text}"
-                            )
+        except Exception as e:
+            safe_print(f"Error in broadcast: {e}")
+            return False
 
-                            # If user blocked the bot, deactivate them
-                            if "blocked by the user" in response.text.lower():
-                                self.db_manager.deactivate_user(user_id)
-                                safe_print(f"Deactivated user {user_id} (blocked bot)")
-                            break  # Don't send remaining chunks to this user
+    async def _send_chunks_to_user(self, session, user, message_chunks, parse_mode):
+        """Send every chunk of a message to one user, in order
 
-                        # Rate limiting between chunks
-                        if chunk_index < len(message_chunks):
-                            time.sleep(0.3)
+        Returns True if all chunks were delivered.
+        """
+        try:
+            user_id = user.get("user_id")
+            username = user.get("username", "Unknown")
 
-                    if user_success:
-                        successful_sends += 1
-                        if len(message_chunks) > 1:
-                            safe_print(
-                                f"✅ All chunks sent to user {user_id} (@{username})"
-                            )
-                    else:
-                        failed_sends += 1
+            for chunk_index, chunk in enumerate(message_chunks, 1):
+                if len(message_chunks) > 1:
+                    safe_print(
+                        f"  Sending chunk {chunk_index}/{len(message_chunks)} to user {user_id} (@{username})"
+                    )
 
-                    # Rate limiting between users
-                    time.sleep(0.1)
+                status, response_text = await self.send_one(
+                    session, user_id, chunk, parse_mode
+                )
 
-                except Exception as e:
-                    failed_sends += 1
+                if status != 200:
                     safe_print(
-                        f"❌ Error sending to user {user.get('user_id', 'Unknown')}: {e}"
+                        f"❌ Failed to send chunk {chunk_index} to user {user_id} (@{username}): {response_text}"
                     )
 
+                    # If user blocked the bot, deactivate them; pymongo is
+                    # blocking, so keep it off the loop the other sends share
+                    if "blocked by the user" in response_text.lower():
+                        await asyncio.to_thread(
+                            self.db_manager.deactivate_user, user_id
+                        )
+                        safe_print(f"Deactivated user {user_id} (blocked bot)")
+                    return False  # Don't send remaining chunks to this user
+
+            if len(message_chunks) > 1:
+                safe_print(f"✅ All chunks sent to user {user_id} (@{username})")
+            else:
+                safe_print(f"✅ Sent to user {user_id} (@{username})")
+            return True
+
+        except Exception as e:
             safe_print(
-                f"Broadcast complete: {successful_sends} sent, {failed_sends} failed"
+                f"❌ Error sending to user {user.get('user_id', 'Unknown')}: {e}"
             )
-            return successful_sends > 0
+            return False
 
-        except Exception as e:
-            safe_print(f"Error in broadcast: {e}")
+    async def send_post(self, session, post, users=None):
+        """Broadcast a single post to all users and mark it as sent
+
+        Returns True only if the post reached at least one user.
+        """
+        post_content = post.get("content", "")
+        if not post_content.strip():
             return False
 
-    def send_new_posts_to_all_users(self):
+        # Convert to HTML format
+        html_message = self.convert_markdown_to_html(post_content)
+        title = post.get("title", "No Title")[:50]
+
+        # Mark as sent only if successfully sent to at least some users
+        if await self.broadcast_to_all_users(
+            html_message, session=session, users=users
+        ):
+            await self.async_db_manager.mark_as_sent(post["_id"])
+            safe_print(f"✅ Post broadcasted and marked as sent: {title}...")
+            return True
+
+        safe_print(f"❌ Failed to broadcast post: {title}...")
+        return False
+
+    async def sender(self, ready_q, session, users):
+        """Broadcast posts arriving on ready_q until a None sentinel is received
+
+        Posts are drained without sending when there are no users. Returns a
+        (posts_sent, posts_failed) tuple for this worker.
+        """
+        sent_count = 0
+        failed_count = 0
+
+        while (post := await ready_q.get()) is not None:
+            if not users or not post.get("content", "").strip():
+                continue
+
+            try:
+                if await self.send_post(session, post, users):
+                    sent_count += 1
+                else:
+                    failed_count += 1
+            except Exception as e:
+                failed_count += 1
+                safe_print(f"❌ Error sending post {post.get('_id')}: {e}")
+
+        return sent_count, failed_count
+
+    async def send_new_posts_to_all_users(self, session=None):
         """Send new posts to all registered users instead of just one chat"""
         try:
-            unsent_posts = self.db_manager.get_unsent_posts()
+            unsent_posts = await self.async_db_manager.get_unsent_posts()
 
             if not unsent_posts:
                 safe_print("No new posts to send")
                 return True
 
-            users = self.db_manager.get_all_users()
+            users = await self.async_db_manager.get_all_users()
             if not users:
                 safe_print("No users registered for notifications")
                 return False
@@ -942,31 +1109,19 @@ class TelegramBot:
                 f"Found {len(unsent_posts)} new posts to send to {len(users)} users"
             )
 
-            successful_posts = 0
-
-            for post in unsent_posts:
-                post_content = post.get("content", "")
-                if not post_content.strip():
-                    continue
-
-                # Convert to HTML format
-                html_message = self.convert_markdown_to_html(post_content)
-
-                # Broadcast this post to all users
-                if self.broadcast_to_all_users(html_message):
-                    # Mark as sent only if successfully sent to at least some users
-                    self.db_manager.mark_as_sent(post["_id"])
-                    successful_posts += 1
-                    safe_print(
-                        f"✅ Post broadcasted and marked as sent: {post.get('title', 'No Title')[:50]}..."
-                    )
-                else:
-                    safe_print(
-                        f"❌ Failed to broadcast post: {post.get('title', 'No Title')[:50]}..."
-                    )
+            # Every (post, user) send runs concurrently; the shared semaphore and
+            # rate limiter in _post_message keep us within Telegram's limits
+            async with self._http_session(session) as session:
+                results = await asyncio.gather(
+                    *(
+                        self.send_post(session, post, users)
+                        for post in unsent_posts
+                        if post.get("content", "").strip()
+                    ),
+                    return_exceptions=True,
+                )
 
-                # Rate limiting between posts
-                time.sleep(2)
+            successful_posts = sum(1 for result in results if result is True)
 
             safe_print(
                 f"Broadcast summary: {successful_posts}/{len(unsent_posts)} posts sent successfully"
@@ -1016,7 +1171,7 @@ class TelegramBot:
             safe_print(f"Error getting user stats: {e}")
             return {}
 
-    def run(self):
+    async def run(self, session=None):
         """Main method to run Telegram functionality"""
         safe_print("SuperSet Telegram Bot - Send Mode")
         safe_print("1. Testing Telegram connection...")
@@ -1034,7 +1189,7 @@ class TelegramBot:
         self.get_send_status_summary()
 
         safe_print("\n2. Sending new job posts to all registered users...")
-        result = self.send_new_posts_to_all_users()
+        result = await self.send_new_posts_to_all_users(session)
 
         if result:
             safe_print("\n✅ Telegram broadcasting completed successfully!")
@@ -2,6 +2,7 @@ import dotenv
 import time
 import os
 import signal
+import asyncio
 import logging
 from contextlib import contextmanager
 from .config import safe_print
@@ -20,15 +21,20 @@ from .database import MongoDBManager
 
 dotenv.load_dotenv()
 
+# Seconds the scraping thread waits for room in the pipeline queue
+PUBLISH_TIMEOUT = 300
+
 
 class WebScraper:
-    def __init__(self):
+    def __init__(self, mongo_client=None):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.USER_ID = os.getenv("USER_ID")
         self.PASSWORD = os.getenv("PASSWORD")
         self.PORTAL_URL = "https://app.joinsuperset.com/students/login"
         self.driver = None
-        self.db_manager = MongoDBManager()
+        self.new_post_queue = None  # per-run asyncio.Queue of new post ids
+        self._loop = None  # event loop owning new_post_queue when scraping in a thread
+        self.db_manager = MongoDBManager(client=mongo_client)
         self.logger.info("WebScraper initialized")
         self._setup_chrome_options()
 
@@ -539,7 +545,8 @@ class WebScraper:
 
         return title, author, posted_time
 
-    def create_basic_formatted_content(self, content_lines):
+    @staticmethod
+    def create_basic_formatted_content(content_lines):
         """Create basic formatted content for database storage"""
         formatted_lines = []
 
@@ -554,7 +561,7 @@ class WebScraper:
             if line.strip() == "·":
                 continue
 
-            if self.is_title_line_simple(line):
+            if WebScraper.is_title_line_simple(line):
                 formatted_lines.append(f"## {line}")
 
             elif "deadline" in line.lower():
@@ -576,7 +583,8 @@ class WebScraper:
 
         return "\n".join(formatted_lines)
 
-    def is_title_line_simple(self, line):
+    @staticmethod
+    def is_title_line_simple(line):
         """Simple check for title lines"""
         title_patterns = [
             "open for applications",
@@ -595,11 +603,45 @@ class WebScraper:
             and len(line) < 150
         )
 
-    def scrape(self):
-        """Main scraping method with incremental database checking"""
+    def scrape(self, new_post_queue=None):
+        """Main scraping method with incremental database checking
+
+        If new_post_queue is given, ids of newly saved posts are published to
+        it for this run only.
+        """
+        self.new_post_queue = new_post_queue
+
+        try:
+            self.initialize_driver()
+        except Exception as e:
+            self.report_scrape_error(e)
+            self.cleanup()
+            return False
+
+        return self.scrape_with_driver()
+
+    async def produce(self, raw_q):
+        """Scrape in a worker thread, putting new post ids on raw_q as they are saved
+
+        The driver is started on the event loop thread first because its
+        SIGALRM-based timeouts only work on the main thread; the slow login,
+        scrolling and extraction then run off the loop.
+        """
+        self.new_post_queue = raw_q
+        self._loop = asyncio.get_running_loop()
+
         try:
             self.initialize_driver()
+        except Exception as e:
+            self.report_scrape_error(e)
+            self.cleanup()
+            return False
+
+        return await asyncio.to_thread(self.scrape_with_driver)
 
+    def scrape_with_driver(self):
+        """Log in and extract posts using the already initialized driver"""
+        try:
             if not self.login():
                 raise Exception("Login failed")
 
@@ -621,28 +663,31 @@ class WebScraper:
             return True
 
         except Exception as e:
-            safe_print(f"An error occurred during scraping: {e}")
-            safe_print(f"Error type: {type(e).__name__}")
-
-            try:
-                safe_print(
-                    "Current URL:",
-                    self.driver.current_url if self.driver else "Driver not available",
-                )
-                safe_print(
-                    "Page title:",
-                    self.driver.title if self.driver else "Driver not available",
-                )
-            except:
-                safe_print("Could not get additional error information")
-
+            self.report_scrape_error(e)
             return False
 
         finally:
             self.cleanup()
 
+    def report_scrape_error(self, e):
+        """Print details about a failed scraping run"""
+        safe_print(f"An error occurred during scraping: {e}")
+        safe_print(f"Error type: {type(e).__name__}")
+
+        try:
+            safe_print(
+                "Current URL:",
+                self.driver.current_url if self.driver else "Driver not available",
+            )
+            safe_print(
+                "Page title:",
+                self.driver.title if self.driver else "Driver not available",
+            )
+        except:
+            safe_print("Could not get additional error information")
+
     def cleanup(self):
-        """Clean up resources"""
+        """Clean up per-run resources so the scraper can be reused"""
         if self.driver:
             try:
                 self.driver.quit()
@@ -651,6 +696,12 @@ class WebScraper:
             except Exception as close_error:
                 safe_print(f"Error closing browser: {close_error}")
 
+            finally:
+                self.driver = None
+
+        self.new_post_queue = None
+        self._loop = None
+
         if hasattr(self, "db_manager") and self.db_manager:
             try:
                 self.db_manager.close_connection()
@@ -658,6 +709,25 @@ class WebScraper:
             except Exception as db_error:
                 safe_print(f"Error closing database connection: {db_error}")
 
+    def publish_new_post(self, post_id):
+        """Hand a newly saved post id to whoever is consuming new_post_queue"""
+        if self.new_post_queue is None:
+            return
+
+        try:
+            if self._loop is not None:
+                # Scraping in a worker thread: hand the id to the event loop and
+                # wait for room in the queue, which throttles the scraper
+                asyncio.run_coroutine_threadsafe(
+                    self.new_post_queue.put(post_id), self._loop
+                ).result(timeout=PUBLISH_TIMEOUT)
+            else:
+                self.new_post_queue.put_nowait(post_id)
+        except (asyncio.QueueFull, TimeoutError):
+            warning_msg = f"New post queue is full, dropping post id {post_id}"
+            safe_print(warning_msg)
+            self.logger.warning(warning_msg)
+
     def process_single_post(self, content_text, post_number):
         """Process a single post and check if it already exists in database using exact matching
         Returns: 'saved' if new post saved, 'duplicate' if exact post exists, 'error' if error occurred
@@ -705,6 +775,7 @@ class WebScraper:
 
             if success:
                 safe_print(f"✅ Post #{post_number} saved: {title[:50]}...")
+                self.publish_new_post(result)
                 return "saved"
             else:
                 safe_print(f"❌ Post #{post_number} failed to save: {result}")
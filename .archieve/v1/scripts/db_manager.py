@@ -8,24 +8,29 @@ This utility provides commands to manage the MongoDB database:
 - Clear database (with confirmation)
 """
 
-import os
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
-project_root = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, project_root)
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 
+from pymongo.errors import BulkWriteError
 from modules.database import MongoDBManager
 
 
+@lru_cache(maxsize=1)
+def get_db_manager():
+    """Return the MongoDBManager shared by every command in this process"""
+    return MongoDBManager()
+
+
 def show_stats():
     """Show database statistics"""
     try:
-        db_manager = MongoDBManager()
+        db_manager = get_db_manager()
         stats = db_manager.get_posts_stats()
 
         print("\n📊 DATABASE STATISTICS")
@@ -44,16 +49,28 @@ def show_stats():
         print(f"❌ Error showing stats: {e}")
 
 
+# Only the fields list_posts prints, so post bodies are never transferred
+LIST_POSTS_PROJECTION = {
+    "title": 1,
+    "post_type": 1,
+    "created_at": 1,
+    "sent_to_telegram": 1,
+}
+
+
 def list_posts(limit=10, sent_only=False, unsent_only=False):
     """List recent posts"""
     try:
-        db_manager = MongoDBManager()
+        db_manager = get_db_manager()
 
         if unsent_only:
-            posts = db_manager.get_unsent_posts()
+            posts = db_manager.get_unsent_posts(projection=LIST_POSTS_PROJECTION)
+            posts = posts[:limit]
             title = f"📋 UNSENT POSTS (limit: {limit})"
         else:
-            posts = db_manager.get_all_posts(limit=limit)
+            posts = db_manager.get_all_posts(
+                limit=limit, projection=LIST_POSTS_PROJECTION
+            )
             if sent_only:
                 posts = [p for p in posts if p.get("sent_to_telegram")]
                 title = f"📋 SENT POSTS (limit: {limit})"
@@ -67,9 +84,11 @@ def list_posts(limit=10, sent_only=False, unsent_only=False):
             print("No posts found.")
             return
 
-        for i, post in enumerate(posts[:limit], 1):
+        # Fallback for posts missing created_at, computed once rather than per post
+        default_created_at = datetime.utcnow()
+        for i, post in enumerate(posts, 1):
             sent_status = "✅ Sent" if post.get("sent_to_telegram") else "⏳ Pending"
-            created_at = post.get("created_at", datetime.utcnow()).strftime(
+            created_at = (post.get("created_at") or default_created_at).strftime(
                 "%Y-%m-%d %H:%M"
             )
             title = post.get("title", "No Title")[:50]
@@ -92,11 +111,11 @@ def mark_all_as_unsent():
             print("Operation cancelled.")
             return
 
-        db_manager = MongoDBManager()
+        db_manager = get_db_manager()
 
-        # Update all posts to mark as unsent
+        # Update all posts to mark as unsent, skipping ones that already are
         result = db_manager.collection.update_many(
-            {},
+            {"sent_to_telegram": {"$ne": False}},
             {
                 "$set": {"sent_to_telegram": False, "updated_at": datetime.utcnow()},
                 "$unset": {"sent_at": ""},
@@ -123,7 +142,7 @@ def clear_database():
             print("Operation cancelled.")
             return
 
-        db_manager = MongoDBManager()
+        db_manager = get_db_manager()
         result = db_manager.collection.delete_many({})
 
         print(f"✅ Deleted {result.deleted_count} posts from database")
@@ -132,6 +151,19 @@ def clear_database():
         print(f"❌ Error clearing database: {e}")
 
 
+def rehash_posts():
+    """Recompute legacy SHA-256 hex content hashes with the current binary hash"""
+    try:
+        # Connecting already migrates any legacy hashes in ensure_indexes();
+        # this re-runs the pass and reports what is left
+        db_manager = get_db_manager()
+        rehashed = db_manager.rehash_legacy_posts()
+        print(f"✅ Rehashed {rehashed} remaining legacy posts")
+
+    except Exception as e:
+        print(f"❌ Error rehashing posts: {e}")
+
+
 def show_help():
     """Show help information"""
     help_text = """
@@ -147,6 +179,7 @@ Commands:
     list-unsent [N]     List N unsent posts  
     mark-unsent         Mark all posts as unsent (for re-sending)
     test-exact          Test exact content matching functionality
+    rehash              Convert leftover legacy SHA-256 content hashes (also done on connect)
     clear               Clear all posts from database (DESTRUCTIVE!)
     help                Show this help message
 
@@ -166,7 +199,7 @@ def test_exact_matching():
     print("=" * 40)
 
     try:
-        db_manager = MongoDBManager()
+        db_manager = get_db_manager()
 
         # Test posts with slight variations
         test_posts = [
@@ -200,44 +233,84 @@ def test_exact_matching():
             },
         ]
 
+        # Test posts are tagged with _test so cleanup hits a sparse index
+        # instead of scanning every title
+        db_manager.collection.create_index("_test", sparse=True)
+
         # Clean up any existing test posts first
-        cleanup_result = db_manager.collection.delete_many(
-            {"title": {"$regex": "Test Job:"}}
-        )
+        cleanup_result = db_manager.collection.delete_many({"_test": True})
         if cleanup_result.deleted_count > 0:
             print(f"🧹 Cleaned up {cleanup_result.deleted_count} existing test posts")
 
         results = []
 
-        for i, post in enumerate(test_posts, 1):
+        # Look up every test hash in one round-trip instead of one per post.
+        # Stored hashes come back as plain bytes, which never compare equal to
+        # a bson.Binary, so both sides are keyed as bytes
+        hashes = [db_manager.create_post_hash(post["content"]) for post in test_posts]
+        existing_posts = {
+            bytes(doc["content_hash"]): doc
+            for doc in db_manager.collection.find(
+                {"content_hash": {"$in": hashes}}, {"content_hash": 1, "title": 1}
+            )
+        }
+
+        # Queue the first occurrence of each new hash for a single bulk insert;
+        # later test posts with the same hash must see it as a duplicate
+        docs = []
+        doc_tests = []
+        duplicate_of = {}
+        for i, (post, content_hash) in enumerate(zip(test_posts, hashes), 1):
             print(f"\nTest {i}: {post['title']}")
             print("-" * 30)
-
-            # Create content hash
-            content_hash = db_manager.create_post_hash(post["content"])
-            print(f"Content hash: {content_hash[:16]}...")
-
-            # Check if duplicate exists
-            existing = db_manager.post_exists(content_hash)
-            is_duplicate = existing is not None
-
-            print(f"Duplicate check result: {is_duplicate}")
-
-            if not is_duplicate:
-                # Try to save the post
-                success, result_msg = db_manager.save_post(
-                    title=post["title"],
-                    content=post["content"],
+            print(f"Content hash: {content_hash.hex()[:16]}...")
+
+            existing = existing_posts.get(bytes(content_hash))
+            print(f"Duplicate check result: {existing is not None}")
+            if existing is not None:
+                duplicate_of[i] = existing.get("title", "No Title")[:50]
+                continue
+
+            existing_posts[bytes(content_hash)] = {"title": post["title"]}
+            docs.append(
+                db_manager.build_post_document(
+                    post["title"],
+                    post["content"],
+                    content_hash,
                     raw_content=post["raw_content"],
                     author=post["author"],
                     posted_time=post["posted_time"],
+                    extra_fields={"_test": True},
                 )
-                print(f"Save attempt: {'SUCCESS' if success else 'FAILED'}")
-                results.append(f"Test {i}: {'SAVED' if success else 'FAILED TO SAVE'}")
-            else:
-                existing_title = existing.get("title", "No Title")[:50]
-                print(f"Found duplicate: {existing_title}...")
+            )
+            doc_tests.append(i)
+
+        # ordered=False lets every non-duplicate insert in one write command;
+        # the unique content_hash index rejects any duplicates that slip through
+        failed_tests = set()
+        if docs:
+            try:
+                db_manager.collection.insert_many(docs, ordered=False)
+            except BulkWriteError as e:
+                for error in e.details["writeErrors"]:
+                    test_number = doc_tests[error["index"]]
+                    failed_tests.add(test_number)
+                    if error["code"] == 11000:
+                        duplicate_of[test_number] = "existing post"
+
+        for i in range(1, len(test_posts) + 1):
+            if i in duplicate_of:
+                print(f"Test {i}: found duplicate: {duplicate_of[i]}...")
                 results.append(f"Test {i}: DUPLICATE DETECTED")
+            elif i in failed_tests:
+                results.append(f"Test {i}: FAILED TO SAVE")
+            else:
+                results.append(f"Test {i}: SAVED")
+
+        inserted_count = len(docs) - len(failed_tests)
+        print(
+            f"\nBulk insert: {inserted_count} inserted, {len(duplicate_of)} duplicates"
+        )
 
         # Print summary
         print(f"\n{'='*50}")
@@ -254,9 +327,7 @@ def test_exact_matching():
         print("- Test 4: Should save successfully (different content)")
 
         # Clean up test posts
-        cleanup_result = db_manager.collection.delete_many(
-            {"title": {"$regex": "Test Job:"}}
-        )
+        cleanup_result = db_manager.collection.delete_many({"_test": True})
         print(f"\n🧹 Cleaned up {cleanup_result.deleted_count} test posts")
 
     except Exception as e:
@@ -295,6 +366,9 @@ def main():
     elif command == "test-exact":
         test_exact_matching()
 
+    elif command == "rehash":
+        rehash_posts()
+
     elif command == "help" or command == "-h" or command == "--help":
         show_help()
 
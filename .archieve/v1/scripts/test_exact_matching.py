@@ -166,7 +166,7 @@ def test_database_exact_matching():
         existing_post = db_manager.post_exists(content_hash)
         is_duplicate = existing_post is not None
 
-        print(f"Content hash: {content_hash[:16]}...")
+        print(f"Content hash: {content_hash.hex()[:16]}...")
         print(f"Duplicate found: {is_duplicate}")
         print(f"Expected duplicate: {scenario['should_be_duplicate']}")
 
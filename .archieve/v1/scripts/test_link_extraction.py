@@ -5,39 +5,27 @@ Test script for the link extraction functionality in the TextFormatter class
 
 import sys
 import os
-import re
+from unittest.mock import patch
 
 # Add the parent directory to sys.path to import modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from modules.formatting import TextFormatter
+
 
 # Create a mock MongoDBManager class to avoid database dependency
 class MockDBManager:
-    def __init__(self):
+    def __init__(self, client=None):
         pass
 
 
-# Patch the module imports
-import importlib.util
-import types
-
-# Import the re module which we need
-sys.modules["re"] = re
-
-# Create a mock for database module
-mock_db_module = types.ModuleType("database")
-mock_db_module.MongoDBManager = MockDBManager
-sys.modules["modules.database"] = mock_db_module
-
-# Now we can import TextFormatter
-from modules.formatting import TextFormatter
-
-
 def test_link_extraction():
     """Test the link extraction functionality"""
-    formatter = TextFormatter()
-    # Replace the db_manager with our mock
-    formatter.db_manager = MockDBManager()
+    # Construct the formatter against mock database managers
+    with patch("modules.formatting.MongoDBManager", MockDBManager), patch(
+        "modules.formatting.AsyncMongoDBManager", MockDBManager
+    ):
+        formatter = TextFormatter()
     # Debug: Print to confirm the object was created
     print("TextFormatter instance created successfully")
 
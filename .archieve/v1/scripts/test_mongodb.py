@@ -97,9 +97,9 @@ def test_formatting_with_database():
         print("✅ Input file exists, testing formatting...")
         result = formatter.format_content()
 
-        if isinstance(result, dict) and result.get("success"):
-            new_posts = result.get("new_posts", 0)
-            total_processed = result.get("total_processed", 0)
+        if result.success:
+            new_posts = result.new_posts
+            total_processed = result.total_processed
             print(f"✅ Formatting completed!")
             print(f"   New posts saved: {new_posts}")
             print(f"   Total processed: {total_processed}")
@@ -6,21 +6,30 @@ This script tests the user management functionality and database connections.
 
 import os
 import sys
+import asyncio
 from datetime import datetime
+from functools import lru_cache
 
 # Add the project root to the path (parent directory of scripts)
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
+from modules.config import get_mongo_client
 from modules.database import MongoDBManager
 from modules.telegram import TelegramBot
 
 
+@lru_cache(maxsize=1)
+def get_db_manager():
+    """Return the MongoDBManager shared by every test in this run"""
+    return MongoDBManager(client=get_mongo_client())
+
+
 def test_database_connection():
     """Test MongoDB connection"""
     print("🔍 Testing MongoDB connection...")
     try:
-        db = MongoDBManager()
+        get_db_manager()
         print("✅ MongoDB connection successful")
         return True
     except Exception as e:
@@ -32,7 +41,7 @@ def test_user_management():
     """Test user management functions"""
     print("\n🔍 Testing user management...")
     try:
-        db = MongoDBManager()
+        db = get_db_manager()
 
         # Test adding a user
         test_user_id = 12345678
@@ -65,16 +74,22 @@ def test_user_management():
         return False
 
 
-def test_telegram_bot():
+async def test_telegram_bot():
     """Test Telegram bot configuration"""
     print("\n🔍 Testing Telegram bot configuration...")
     try:
-        bot = TelegramBot()
-        if bot.test_connection():
-            print("✅ Telegram bot configuration is valid")
+        # Constructing the bot connects to MongoDB, so keep it off the loop
+        bot = await asyncio.to_thread(TelegramBot, mongo_client=get_mongo_client())
+        if not bot.test_connection():
+            print("❌ Telegram bot configuration failed")
+            return False
+
+        me = await bot.get_me()
+        if me:
+            print(f"✅ Telegram bot configuration is valid (@{me.get('username')})")
             return True
         else:
-            print("❌ Telegram bot configuration failed")
+            print("❌ Telegram rejected the bot token")
             return False
     except Exception as e:
         print(f"❌ Telegram bot test failed: {e}")
@@ -87,8 +102,9 @@ def show_environment_check():
 
     required_vars = ["MONGO_CONNECTION_STR", "TELEGRAM_BOT_TOKEN", "TELEGRAM_CHAT_ID"]
 
+    env = os.environ
     for var in required_vars:
-        value = os.getenv(var)
+        value = env.get(var)
         if value:
             # Show only first few characters for security
             masked_value = value[:8] + "..." if len(value) > 8 else value
@@ -97,6 +113,40 @@ def show_environment_check():
             print(f"❌ {var}: Not set")
 
 
+async def run_test(test_name, test_func):
+    """Run a test, blocking ones in a worker thread, treating a crash as a failure"""
+    try:
+        if asyncio.iscoroutinefunction(test_func):
+            return test_name, await test_func()
+        return test_name, await asyncio.to_thread(test_func)
+    except Exception as e:
+        print(f"❌ Test '{test_name}' crashed: {e}")
+        return test_name, False
+
+
+# Tests within a group run in order; the groups themselves run concurrently
+TEST_GROUPS = [
+    [
+        ("Database Connection", test_database_connection),
+        ("User Management", test_user_management),
+    ],
+    [
+        ("Telegram Bot", test_telegram_bot),
+    ],
+]
+
+
+async def run_test_group(group):
+    """Run one group of dependent tests in order"""
+    return [await run_test(test_name, test_func) for test_name, test_func in group]
+
+
+async def run_tests():
+    """Run every test group concurrently and return the flattened results"""
+    group_results = await asyncio.gather(*map(run_test_group, TEST_GROUPS))
+    return [result for results in group_results for result in results]
+
+
 def main():
     """Run all tests"""
     print("🧪 SuperSet Telegram Bot - Test Suite")
@@ -104,21 +154,11 @@ def main():
 
     show_environment_check()
 
-    # Run tests
-    tests = [
-        ("Database Connection", test_database_connection),
-        ("User Management", test_user_management),
-        ("Telegram Bot", test_telegram_bot),
-    ]
-
-    results = []
-    for test_name, test_func in tests:
-        try:
-            result = test_func()
-            results.append((test_name, result))
-        except Exception as e:
-            print(f"❌ Test '{test_name}' crashed: {e}")
-            results.append((test_name, False))
+    # Create the shared client up front so the concurrent tests cannot race
+    # to build it; this does not open a connection yet
+    get_mongo_client()
+
+    results = asyncio.run(run_tests())
 
     # Summary
     print("\n" + "=" * 50)
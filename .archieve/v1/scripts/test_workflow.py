@@ -4,6 +4,7 @@ Test script to verify the complete workflow with MongoDB integration
 
 import os
 import sys
+import asyncio
 
 # Add the project root to Python path
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -51,9 +52,9 @@ def test_complete_workflow():
         formatter = TextFormatter()
         result = formatter.format_content()
 
-        if isinstance(result, dict) and result.get("success"):
-            new_posts = result.get("new_posts", 0)
-            total_processed = result.get("total_processed", 0)
+        if result.success:
+            new_posts = result.new_posts
+            total_processed = result.total_processed
             print(f"✅ Formatting completed!")
             print(f"   New posts saved: {new_posts}")
             print(f"   Total processed: {total_processed}")
@@ -87,7 +88,7 @@ def test_complete_workflow():
 
         confirm = input("   Send messages to Telegram? (y/N): ")
         if confirm.lower() == "y":
-            result = telegram_bot.send_new_posts_from_db()
+            result = asyncio.run(telegram_bot.send_new_posts_from_db())
             if result:
                 print("✅ Messages sent successfully!")
             else:
@@ -1,23 +1,57 @@
-import json
 import os
-import hashlib
-from typing import Any, Dict, List, Tuple
+import shutil
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Optional
 
+import ijson
+import orjson
+import xxhash
 
-def _fingerprint(entry: Dict[str, Any]) -> Tuple:
-    """Return a stable fingerprint for a job entry to detect duplicates.
-    Prefer the explicit id; otherwise, use a composite key.
-    """
+
+def _job_id(entry: Dict[str, Any]) -> Optional[str]:
+    """Return the entry's explicit id, or None if it has no usable one."""
     jid = entry.get("id")
-    if isinstance(jid, str) and jid:
-        return ("id", jid)
+    return jid if isinstance(jid, str) and jid else None
+
+
+def _fingerprint(entry: Dict[str, Any]) -> int:
+    """Return a stable 128-bit fingerprint for a job entry to detect duplicates.
+    Prefer the explicit id; otherwise, use a composite key. Both are hashed
+    with distinct prefixes so they can share a single set of ints.
+    """
+    jid = _job_id(entry)
+    if jid:
+        return xxhash.xxh3_128_intdigest(b"id\x00" + jid.encode("utf-8"))
 
     company = str(entry.get("company", "")).strip().lower()
     role = str(entry.get("job_profile", "")).strip().lower()
     deadline = entry.get("deadline") or entry.get("createdAt") or 0
     desc = str(entry.get("job_description") or entry.get("content") or "")
-    desc_hash = hashlib.sha256(desc.encode("utf-8")).hexdigest()[:12] if desc else ""
-    return ("composite", company, role, str(deadline), desc_hash)
+    key = "\x00".join(("composite", company, role, str(deadline), desc))
+    return xxhash.xxh3_128_intdigest(key.encode("utf-8"))
+
+
+def _start_backup(
+    jobs_path: str, backup_path: str, executor: ThreadPoolExecutor
+) -> Future:
+    """Back up jobs_path to backup_path, replacing any previous backup.
+
+    The cleaned file is swapped in with os.replace, so a hardlink keeps the
+    original inode intact and costs no copying. Where hardlinks are not
+    possible the copy runs on the executor, overlapping the dedup pass.
+    """
+    try:
+        os.remove(backup_path)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(jobs_path, backup_path)
+    except OSError:
+        return executor.submit(shutil.copyfile, jobs_path, backup_path)
+
+    done: Future = Future()
+    done.set_result(backup_path)
+    return done
 
 
 def main() -> None:
@@ -25,42 +59,57 @@ def main() -> None:
     script_dir = os.path.dirname(__file__)
     data_dir = os.path.abspath(os.path.join(script_dir, "..", "data"))
     jobs_path = os.path.join(data_dir, "structured_job_listings.json")
+    tmp_path = jobs_path + ".tmp"
+    backup_path = jobs_path + ".backup"
 
-    # Load
-    with open(jobs_path, "r", encoding="utf-8") as f:
-        jobs: List[Dict[str, Any]] = json.load(f)
-
-    seen: set = set()
-    unique: List[Dict[str, Any]] = []
+    seen: set[int] = set()
+    total = 0
+    unique_count = 0
 
     dup_by_id = 0
     dup_by_composite = 0
 
-    for entry in jobs:
-        fp = _fingerprint(entry)
-        if fp in seen:
-            # Count duplicates by category
-            if fp and fp[0] == "id":
-                dup_by_id += 1
-            else:
-                dup_by_composite += 1
-            continue
-        seen.add(fp)
-        unique.append(entry)
-
-    removed = len(jobs) - len(unique)
-
-    # Backup
-    backup_path = jobs_path + ".backup"
-    with open(backup_path, "w", encoding="utf-8") as f:
-        json.dump(jobs, f, ensure_ascii=False, indent=2)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        backup = _start_backup(jobs_path, backup_path, executor)
+
+        # Stream entries one at a time and write survivors as they are found, so
+        # only the fingerprints are held in memory. The output matches
+        # json.dump(..., ensure_ascii=False, indent=2). Entries are heterogeneous
+        # dicts, so this is deliberately not a DataFrame unique(): a columnar
+        # round-trip would add null keys to every entry and rewrite the layout.
+        seen_add = seen.add
+        with open(jobs_path, "rb") as src, open(tmp_path, "wb") as dst:
+            write = dst.write
+            write(b"[")
+            for entry in ijson.items(src, "item", use_float=True):
+                total += 1
+                fp = _fingerprint(entry)
+                if fp in seen:
+                    # Count duplicates by category
+                    if _job_id(entry):
+                        dup_by_id += 1
+                    else:
+                        dup_by_composite += 1
+                    continue
+                seen_add(fp)
+
+                write(b",\n  " if unique_count else b"\n  ")
+                # JSON strings never contain raw newlines, so this only re-indents
+                encoded = orjson.dumps(entry, option=orjson.OPT_INDENT_2)
+                write(encoded.replace(b"\n", b"\n  "))
+                unique_count += 1
+            write(b"\n]" if unique_count else b"]")
+
+        # Only swap the cleaned file in once the backup exists
+        backup.result()
+
+    # Swap the cleaned file in atomically
+    os.replace(tmp_path, jobs_path)
 
-    # Write cleaned
-    with open(jobs_path, "w", encoding="utf-8") as f:
-        json.dump(unique, f, ensure_ascii=False, indent=2)
+    removed = total - unique_count
 
-    print(f"Original entries: {len(jobs)}")
-    print(f"Unique entries:   {len(unique)}")
+    print(f"Original entries: {total}")
+    print(f"Unique entries:   {unique_count}")
     print(
         f"Removed:          {removed} (by id: {dup_by_id}, by composite: {dup_by_composite})"
     )
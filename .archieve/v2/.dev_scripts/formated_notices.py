@@ -1,15 +1,22 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
 from typing import Required, TypedDict
-from pydantic import BaseModel
-from bs4 import BeautifulSoup
+from pydantic import BaseModel, TypeAdapter
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 from rapidfuzz import fuzz, process
 from dotenv import load_dotenv
 import os
+import re
 import json
+import orjson
+import asyncio
+import itertools
 import time
-from datetime import datetime
+from functools import lru_cache
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain.prompts import ChatPromptTemplate
+from langchain_core.runnables import Runnable
+from langchain_core.globals import set_llm_cache
+from langchain_community.cache import SQLiteCache
 from langgraph.graph import StateGraph, END
 from google.api_core.exceptions import ResourceExhausted
 
@@ -51,6 +58,10 @@ class Notice(BaseModel):
     createdAt: int
 
 
+# Validate whole lists with one compiled validator instead of per-object calls
+JOBS_ADAPTER = TypeAdapter(List[Job])
+
+
 # --- LangGraph State ---
 
 
@@ -58,22 +69,36 @@ class PostState(TypedDict, total=False):
     # inputs
     notice: Required["Notice"]
     jobs: Required[List["Job"]]
+    # first job per company name, for O(1) lookup after fuzzy matching
+    company_to_job: Dict[str, "Job"]
 
     # computed fields through the graph
     id: str
     raw_text: str
     category: str
+    companies: List[str]
     matched_job: Optional["Job"]
     matched_job_id: Optional[str]
     extracted: Dict[str, Any]
     formatted_message: str
 
+    # index into llm_pool of the API key this run uses
+    api_key_index: int
+
 
 # --- Global LLM and Graph Variables ---
-# These will be initialized and potentially re-initialized in the main execution block.
-llm: Optional[ChatGoogleGenerativeAI] = None
+# One client per API key, built in the main execution block. Each graph run
+# picks its client by index, so rotating keys never rebuilds the graph.
+llm_pool: List[ChatGoogleGenerativeAI] = []
+# Prompt | llm chains composed once per pooled client, indexed like llm_pool
+analysis_chains: List[Runnable] = []
+batch_analysis_chains: List[Runnable] = []
 workflow = StateGraph(PostState)
 
+# LLM requests in flight at once, and notices analyzed per LLM request
+MAX_CONCURRENT_NOTICES = 12
+BATCH_SIZE = 8
+
 # --- Helper Functions ---
 
 
@@ -92,6 +117,28 @@ def _ensure_str_content(content: Any) -> str:
     return str(content)
 
 
+def _analysis_chain_for(state: PostState) -> Runnable:
+    """Return the pooled analysis chain for the API key assigned to this run."""
+    return analysis_chains[state.get("api_key_index", 0)]
+
+
+@lru_cache(maxsize=4096)
+def _format_timestamp(ms: int, fmt: str) -> str:
+    """Format a millisecond epoch timestamp in local time."""
+    return time.strftime(fmt, time.localtime(ms / 1000))
+
+
+def _get_text(node: Optional[LexborNode], separator: str) -> str:
+    """Join the non-empty, stripped text nodes under node with separator."""
+    if node is None:
+        return ""
+    return separator.join(
+        text
+        for child in node.traverse(include_text=True)
+        if child.tag == "-text" and (text := (child.text_content or "").strip())
+    )
+
+
 def format_html_breakdown(html_content: Optional[str]) -> str:
     """
     Parses an HTML string (typically from package_info) and formats it into a
@@ -100,29 +147,33 @@ def format_html_breakdown(html_content: Optional[str]) -> str:
     if not html_content:
         return ""
 
-    soup = BeautifulSoup(html_content, "html.parser")
+    # Most package_info values are plain text with no markup or entities to
+    # decode, so skip the parser and just tidy the text
+    if "<" not in html_content and "&" not in html_content:
+        result = html_content.replace("\xa0", " ").strip()
+        return f"(\n{result}\n)" if result else ""
+
+    tree = LexborHTMLParser(html_content)
     lines = []
 
     # Process tables into "Key | Value" format for each row
-    for table in soup.find_all("table"):
-        for row in table.find_all("tr"):
+    for table in tree.css("table"):
+        for row in table.css("tr"):
             cells = [
-                cell.get_text(separator=" ", strip=True)
-                for cell in row.find_all(["td", "th"])
-                if cell.get_text(strip=True)
+                text for cell in row.css("td, th") if (text := _get_text(cell, " "))
             ]
             if cells:
                 lines.append(" | ".join(cells))
 
     # Process paragraphs and list items
-    for element in soup.find_all(["p", "li"]):
-        text = element.get_text(separator=" ", strip=True)
+    for element in tree.css("p, li"):
+        text = _get_text(element, " ")
         if text:
             lines.append(text)
 
     # If no specific elements were found, fall back to getting all text
     if not lines:
-        fallback_text = soup.get_text(separator="\n", strip=True)
+        fallback_text = _get_text(tree.body, "\n")
         if fallback_text:
             lines.append(fallback_text)
 
@@ -140,77 +191,184 @@ def format_html_breakdown(html_content: Optional[str]) -> str:
 
 def extract_text(state: PostState) -> PostState:
     """Extracts clean text from the notice's HTML content."""
-    soup = BeautifulSoup(state["notice"].content, "html.parser")
-    text = soup.get_text(separator="\n", strip=True)
+    tree = LexborHTMLParser(state["notice"].content)
+    text = _get_text(tree.body, "\n")
     state["raw_text"] = (state["notice"].title + "\n" + text).strip()
     state["id"] = state["notice"].id
     print("--- 1. Text Extracted ---")
     return state
 
 
-def classify_post(state: PostState) -> PostState:
-    """Classifies the notice into a predefined category."""
-    classification_prompt = ChatPromptTemplate.from_messages(
-        [
-            (
-                "system",
-                "You are a classifier. Categorize the notice into one of: "
-                "[update, shortlisting, announcement, hackathon, webinar, job posting].",
-            ),
-            ("human", "{raw_text}"),
-        ]
-    )
-    chain = classification_prompt | llm
-    result = chain.invoke({"raw_text": state.get("raw_text", "")})
-    category = _ensure_str_content(result.content).strip().lower()
-    state["category"] = category
-    print(f"--- 2. Classified as: {category} ---")
+# Keywords that name a notice's category outright when they appear in its
+# title; a title matching more than one is left to the LLM
+CATEGORY_PATTERNS = {
+    "shortlisting": re.compile(r"\bshortlist(?:ed|ing)?\b", re.IGNORECASE),
+    "webinar": re.compile(r"\bwebinar\b", re.IGNORECASE),
+    "hackathon": re.compile(r"\bhackathon\b", re.IGNORECASE),
+    "job posting": re.compile(r"\bjob posting\b", re.IGNORECASE),
+}
+
+# Categories whose message is the notice text itself: no company matching or
+# extraction is needed, so a keyword hit skips the LLM call entirely
+TEXT_ONLY_CATEGORIES = {"webinar", "hackathon"}
+
+ANALYSIS_RULES = (
+    '- "category": one of [update, shortlisting, announcement, hackathon, webinar, job posting].\n'
+    '- "companies": a list of every company name mentioned in the text, or an empty list.\n'
+    '- "extracted": structured details based on the category:\n'
+    "  - For shortlisting: extract a list of students under the key 'students', each with 'name' and 'enrollment'. Also extract 'company_name' and 'role' if mentioned.\n"
+    "  - For job posting: extract 'company_name', 'role', 'package', and 'deadline'.\n"
+    "  - For all others: extract relevant details based on the context (e.g., 'message', 'event_name', etc.)."
+)
+
+# Templates are parsed once at import; only the llm they pipe into varies
+ANALYSIS_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            "You are a notice analyzer. Your response MUST be a valid JSON object "
+            'with exactly the keys "category", "companies" and "extracted".\n\n'
+            + ANALYSIS_RULES,
+        ),
+        ("human", "Notice:\n{raw_text}"),
+    ]
+)
+
+BATCH_ANALYSIS_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            "You are a notice analyzer. You will receive several numbered notices. "
+            "Your response MUST be a valid JSON list with exactly one element per "
+            "notice, in order; element i corresponds to Notice i. Each element is "
+            'a JSON object with exactly the keys "category", "companies" and '
+            '"extracted".\n\n' + ANALYSIS_RULES,
+        ),
+        ("human", "{notices}"),
+    ]
+)
+
+
+def _clean_json_str(content: Any) -> str:
+    """Strip markdown code fences from an LLM JSON response."""
+    raw_content = _ensure_str_content(content)
+    return raw_content.strip().replace("```json", "").replace("```", "").strip()
+
+
+def _apply_analysis(state: PostState, analysis: Any) -> PostState:
+    """Copy category, companies and extracted details from an analysis object."""
+    if not isinstance(analysis, dict):
+        analysis = {}
+
+    state["category"] = str(analysis.get("category") or "announcement").strip().lower()
+    companies = analysis.get("companies") or []
+    state["companies"] = [str(name).strip() for name in companies if str(name).strip()]
+    extracted = analysis.get("extracted")
+    state["extracted"] = extracted if isinstance(extracted, dict) else {}
+    print(f"--- 2. Classified as: {state['category']} ---")
     return state
 
 
-def match_job(state: PostState) -> PostState:
+def quick_category(title: str) -> Optional[str]:
+    """Return the category a notice's title names outright, or None if unclear.
+
+    Only the title is checked: a placement notice may mention a webinar or a
+    hackathon round in its body and still need company matching.
     """
-    Intelligently matches the notice to a job by first extracting company names
-    from the notice and then performing a fuzzy match.
+    hits = [
+        category
+        for category, pattern in CATEGORY_PATTERNS.items()
+        if pattern.search(title)
+    ]
+    return hits[0] if len(hits) == 1 else None
+
+
+async def analyze_notice(state: PostState) -> PostState:
     """
-    notice_text = state.get("raw_text", "")
-    jobs = state.get("jobs", [])
+    Classifies the notice, extracts the company names it mentions and its
+    structured details in a single LLM call.
+    """
+    category = quick_category(state["notice"].title)
+    if category in TEXT_ONLY_CATEGORIES:
+        return _apply_analysis(state, {"category": category})
 
-    company_extraction_prompt = ChatPromptTemplate.from_messages(
-        [
-            (
-                "system",
-                "You are an expert entity extractor. Your task is to identify and extract any company names mentioned in the text. List them separated by commas. If no company is mentioned, return an empty string.",
-            ),
-            ("human", "Text: {raw_text}"),
-        ]
+    chain = _analysis_chain_for(state)
+    result = await chain.ainvoke({"raw_text": state.get("raw_text", "")})
+    cleaned_json_str = _clean_json_str(result.content)
+    try:
+        analysis = json.loads(cleaned_json_str)
+        if not isinstance(analysis, dict):
+            raise json.JSONDecodeError("Expected a JSON object", cleaned_json_str, 0)
+    except json.JSONDecodeError:
+        print("--- 2. FAILED to parse JSON from LLM ---")
+        analysis = {
+            "extracted": {"error": "Failed to parse JSON", "raw": cleaned_json_str}
+        }
+
+    return _apply_analysis(state, analysis)
+
+
+async def batch_analyze_notices(
+    states: List[PostState], chain: Runnable
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Analyzes several notices in one LLM call so the shared system prompt is
+    processed once per batch. Returns one analysis object per state, or None
+    if the response isn't a JSON list of the right length.
+    """
+    notices_text = "\n\n".join(
+        f"Notice {i}:\n{state.get('raw_text', '')}" for i, state in enumerate(states, 1)
     )
+    result = await chain.ainvoke({"notices": notices_text})
+    try:
+        analyses = json.loads(_clean_json_str(result.content))
+    except json.JSONDecodeError:
+        return None
+
+    if not isinstance(analyses, list) or len(analyses) != len(states):
+        return None
+    return analyses
+
 
-    extraction_chain = company_extraction_prompt | llm
-    result = extraction_chain.invoke({"raw_text": notice_text})
-    extracted_names_str = _ensure_str_content(result.content).strip()
+def build_company_index(jobs: List[Job]) -> Dict[str, Job]:
+    """Map each company name to its first job in jobs."""
+    # reversed, so earlier jobs overwrite later ones with the same company
+    return {job.company: job for job in reversed(jobs)}
 
-    if not extracted_names_str:
+
+def match_job(state: PostState) -> PostState:
+    """
+    Matches the notice to a job by fuzzy matching the company names extracted
+    from the notice against the known jobs.
+    """
+    company_to_job = state.get("company_to_job") or build_company_index(
+        state.get("jobs", [])
+    )
+    extracted_names = state.get("companies", [])
+
+    if not extracted_names:
         print("--- 3. No company names extracted, skipping match ---")
         state["matched_job"] = None
         state["matched_job_id"] = None
         return state
 
-    extracted_names = [name.strip() for name in extracted_names_str.split(",")]
     best_overall_match_job = None
     highest_score = 0
-    job_company_choices = [job.company for job in jobs]
+    job_company_choices = list(company_to_job)
 
+    # Only matches above the threshold and the best score so far matter, so
+    # let rapidfuzz skip every choice that can't beat them
     for name in extracted_names:
         match_result = process.extractOne(
-            name, job_company_choices, scorer=fuzz.token_set_ratio
+            name,
+            job_company_choices,
+            scorer=fuzz.WRatio,
+            score_cutoff=max(highest_score, 80),
         )
         if match_result and match_result[1] > highest_score:
             highest_score = match_result[1]
             matched_company_name = match_result[0]
-            best_overall_match_job = next(
-                (j for j in jobs if j.company == matched_company_name), None
-            )
+            best_overall_match_job = company_to_job.get(matched_company_name)
 
     if best_overall_match_job and highest_score > 80:
         state["matched_job"] = best_overall_match_job
@@ -224,41 +382,6 @@ def match_job(state: PostState) -> PostState:
     return state
 
 
-def extract_info(state: PostState) -> PostState:
-    """Extracts structured information based on the notice category."""
-    extraction_prompt = ChatPromptTemplate.from_messages(
-        [
-            (
-                "system",
-                "You are an information extractor. Based on the category, "
-                "extract structured details. Your response MUST be a valid JSON object.\n\n"
-                "- For shortlisting: extract a list of students under the key 'students', each with 'name' and 'enrollment'. Also extract 'company_name' and 'role' if mentioned.\n"
-                "- For job posting: extract 'company_name', 'role', 'package', and 'deadline'.\n"
-                "- For all others: extract relevant details based on the context (e.g., 'message', 'event_name', etc.).",
-            ),
-            ("human", "Category: {category}\n\nNotice:\n{raw_text}"),
-        ]
-    )
-    chain = extraction_prompt | llm
-    result = chain.invoke(
-        {
-            "category": state.get("category", "announcement"),
-            "raw_text": state.get("raw_text", ""),
-        }
-    )
-    raw_content = _ensure_str_content(result.content)
-    cleaned_json_str = (
-        raw_content.strip().replace("```json", "").replace("```", "").strip()
-    )
-    try:
-        state["extracted"] = json.loads(cleaned_json_str)
-        print("--- 4. Information Extracted Successfully ---")
-    except json.JSONDecodeError:
-        print("--- 4. FAILED to parse JSON from LLM ---")
-        state["extracted"] = {"error": "Failed to parse JSON", "raw": cleaned_json_str}
-    return state
-
-
 def format_message(state: PostState) -> PostState:
     """
     Formats the final message using all available information, including the
@@ -269,11 +392,8 @@ def format_message(state: PostState) -> PostState:
     job = state.get("matched_job")
     notice = state["notice"]
 
-    post_date = datetime.fromtimestamp(notice.updatedAt / 1000).strftime(
-        "%B %d, %Y at %I:%M %p"
-    )
+    post_date = _format_timestamp(notice.updatedAt, "%B %d, %Y at %I:%M %p")
     title = notice.title
-    msg_parts = [f"**{title}**\n"]
 
     if cat == "shortlisting":
         students = data.get("students", [])
@@ -287,37 +407,38 @@ def format_message(state: PostState) -> PostState:
         company_name = job.company if job else data.get("company_name", "N/A")
         role = job.job_profile if job else data.get("role", "N/A")
 
-        msg_parts.append(f"**🎉 Shortlisting Update**")
-        msg_parts.append(f"**Company:** {company_name}")
-        msg_parts.append(f"**Role:** {role}\n")
-
-        if student_list:
-            msg_parts.append("Congratulations to the following students:")
-            msg_parts.append(student_list)
-
+        # Optional sections are left empty and dropped before joining
+        congratulations = (
+            f"Congratulations to the following students:\n{student_list}"
+            if student_list
+            else ""
+        )
+        hiring_process = ""
         if job and job.hiring_flow:
             hiring_flow_list = "\n".join(
                 [f"{i+1}. {step}" for i, step in enumerate(job.hiring_flow)]
             )
-            msg_parts.append(f"\n**Hiring Process:**\n{hiring_flow_list}")
-
+            hiring_process = f"\n**Hiring Process:**\n{hiring_flow_list}"
+        ctc = ""
         if job:
-            package_lpa = job.package / 100000
-            package_info = f"{package_lpa:.2f} LPA"
             package_breakdown = format_html_breakdown(job.package_info)
-            msg_parts.append(f"\n**CTC:** {package_info} {package_breakdown}")
+            ctc = f"\n**CTC:** {job.package / 100000:.2f} LPA {package_breakdown}"
+
+        body = [
+            "**🎉 Shortlisting Update**",
+            f"**Company:** {company_name}",
+            f"**Role:** {role}\n",
+            congratulations,
+            hiring_process,
+            ctc,
+        ]
+        body = [part for part in body if part]
 
     elif cat == "job posting":
         if job:
-            company_name = job.company
-            role = job.job_profile
-            package_lpa = job.package / 100000
-            package_info = f"{package_lpa:.2f} LPA"
             package_breakdown = format_html_breakdown(job.package_info)
             deadline = (
-                datetime.fromtimestamp(job.deadline / 1000).strftime(
-                    "%B %d, %Y, %I:%M %p"
-                )
+                _format_timestamp(job.deadline, "%B %d, %Y, %I:%M %p")
                 if job.deadline
                 else "Not specified"
             )
@@ -326,190 +447,258 @@ def format_message(state: PostState) -> PostState:
                 eligibility_list.append(
                     f"- **{mark.level} Marks:** {mark.criteria} CGPA or equivalent"
                 )
-            eligibility_str = "**Eligibility Criteria:**\n" + "\n".join(
-                eligibility_list
-            )
+            eligibility = "\n".join(eligibility_list)
             hiring_flow_list = "\n".join(
                 [f"{i+1}. {step}" for i, step in enumerate(job.hiring_flow)]
             )
-            hiring_flow_str = f"**Hiring Flow:**\n{hiring_flow_list}"
+            body = [
+                "**📢 Job Posting**",
+                f"**Company:** {job.company}",
+                f"**Role:** {job.job_profile}",
+                f"**CTC:** {job.package / 100000:.2f} LPA {package_breakdown}\n",
+                f"**Eligibility Criteria:**\n{eligibility}\n",
+                f"**Hiring Flow:**\n{hiring_flow_list}",
+                f"\n⚠️ **Deadline:** {deadline}",
+            ]
         else:
-            company_name, role, package_info, deadline = (
-                "N/A",
-                "N/A",
-                "Not specified",
-                "Not specified",
-            )
-            package_breakdown, eligibility_str, hiring_flow_str = "", "", ""
-
-        msg_parts.extend(
-            [
-                f"**📢 Job Posting**",
-                f"**Company:** {company_name}",
-                f"**Role:** {role}",
-                f"**CTC:** {package_info} {package_breakdown}\n",
+            body = [
+                "**📢 Job Posting**",
+                "**Company:** N/A",
+                "**Role:** N/A",
+                "**CTC:** Not specified \n",
+                "\n⚠️ **Deadline:** Not specified",
             ]
-        )
-        if eligibility_str:
-            msg_parts.append(eligibility_str + "\n")
-        if hiring_flow_str:
-            msg_parts.append(hiring_flow_str)
-        msg_parts.append(f"\n⚠️ **Deadline:** {deadline}")
 
     else:
         message_content = data.get(
             "message", state.get("raw_text", "See notice for details.")
         )
-        msg_parts.append(f"**🔔 {cat.capitalize()}**\n")
-        msg_parts.append(message_content.replace(title, "").strip())
-        if data.get("deadline"):
-            msg_parts.append(f"\n⚠️ **Deadline:** {data.get('deadline')}")
-
-    msg_parts.extend(["\n", f"*Posted by*: {notice.author} \n*On:* {post_date}"])
-    state["formatted_message"] = "\n".join(msg_parts)
-    print("--- 5. Message Formatted ---")
+        # raw_text starts with the title, so only a leading copy is removed
+        body = [
+            f"**🔔 {cat.capitalize()}**\n",
+            message_content.removeprefix(title).strip(),
+        ]
+        if deadline := data.get("deadline"):
+            body.append(f"\n⚠️ **Deadline:** {deadline}")
+
+    state["formatted_message"] = "\n".join(
+        [
+            f"**{title}**\n",
+            *body,
+            "\n",
+            f"*Posted by*: {notice.author} \n*On:* {post_date}",
+        ]
+    )
+    print("--- 4. Message Formatted ---")
     return state
 
 
 # --- Build LangGraph Workflow ---
 
 workflow.add_node("extract_text", extract_text)
-workflow.add_node("classify_post", classify_post)
+workflow.add_node("analyze_notice", analyze_notice)
 workflow.add_node("match_job", match_job)
-workflow.add_node("extract_info", extract_info)
 workflow.add_node("format_message", format_message)
 
 workflow.set_entry_point("extract_text")
-workflow.add_edge("extract_text", "classify_post")
-workflow.add_edge("classify_post", "match_job")
-workflow.add_edge("match_job", "extract_info")
-workflow.add_edge("extract_info", "format_message")
+workflow.add_edge("extract_text", "analyze_notice")
+workflow.add_edge("analyze_notice", "match_job")
+workflow.add_edge("match_job", "format_message")
 workflow.add_edge("format_message", END)
 
 # --- Main Execution Block ---
 
-if __name__ == "__main__":
-    load_dotenv()
-
-    # 1. API Key Setup with Rotation
-    api_keys_str = os.getenv("GOOGLE_API_KEYS", "")
-    api_keys = [key.strip() for key in api_keys_str.split(",") if key.strip()]
-    if not api_keys:
-        raise ValueError("GOOGLE_API_KEYS not found in .env file or is empty.")
-
-    current_api_key_index = 0
-
-    # 2. Initial LLM and App setup
-    llm = ChatGoogleGenerativeAI(
-        model="gemini-2.0-flash-lite",
-        temperature=0,
-        google_api_key=api_keys[current_api_key_index],
-        max_retries=1,  # Prevent internal retries to allow our custom rotation to trigger
-    )
-    app = workflow.compile()
-
-    # 3. Load data files
-    data_dir = os.path.join(os.path.dirname(__file__), "data")
-    notices_path = os.path.join(data_dir, "structured_notices.json")
-    with open(notices_path, "r", encoding="utf-8") as f:
-        notices_data = json.load(f)
-
-    jobs_path = os.path.join(data_dir, "structured_job_listings.json")
-    with open(jobs_path, "r", encoding="utf-8") as f:
-        jobs_data = json.load(f)
-
-    all_jobs = [Job(**j) for j in jobs_data]
-
-    # 4. Incremental Saving Setup
-    final_out_path = os.path.join(data_dir, "final_notices.json")
-    final_records = []
-    if os.path.exists(final_out_path):
-        try:
-            with open(final_out_path, "r", encoding="utf-8") as f:
-                final_records = json.load(f)
-        except json.JSONDecodeError:
-            print(f"Warning: Could not parse {final_out_path}. Starting fresh.")
-
-    processed_notice_ids = {record["id"] for record in final_records}
-    print(f"Found {len(processed_notice_ids)} already processed notices.")
 
-    # 5. Main Processing Loop
-    for notice_dict in notices_data:
-        if notice_dict["id"] in processed_notice_ids:
-            print(f"Skipping already processed Notice ID: {notice_dict['id']}")
-            continue
-
-        notice = Notice(**notice_dict)
-        inputs = {"notice": notice, "jobs": all_jobs}
-
-        attempts_left = len(api_keys)
-        success = False
-        result = None
-
-        while attempts_left > 0:
+async def process_notice(
+    app: Any,
+    notice_dict: Dict[str, Any],
+    all_jobs: List[Job],
+    company_to_job: Dict[str, Job],
+    sem: asyncio.Semaphore,
+    key_cycle: "itertools.cycle[int]",
+) -> Optional[Dict[str, Any]]:
+    """Run one notice through the graph, rotating API keys when rate-limited."""
+    notice = Notice(**notice_dict)
+
+    async with sem:
+        for _ in range(len(llm_pool)):
+            api_key_index = next(key_cycle)
+            inputs = {
+                "notice": notice,
+                "jobs": all_jobs,
+                "company_to_job": company_to_job,
+                "api_key_index": api_key_index,
+            }
             try:
                 print(
-                    f"\nProcessing Notice ID: {notice.id} with API Key Index: {current_api_key_index}"
+                    f"\nProcessing Notice ID: {notice.id} with API Key Index: {api_key_index}"
                 )
-                result = app.invoke(inputs)
-                success = True
-                break
+                return await app.ainvoke(inputs)
             except ResourceExhausted:
                 print(
-                    f"API Key at index {current_api_key_index} is rate-limited. Rotating keys..."
+                    f"API Key at index {api_key_index} is rate-limited. Rotating keys..."
                 )
-                current_api_key_index = (current_api_key_index + 1) % len(api_keys)
+            except Exception as e:
+                print(f"An unexpected error occurred for notice {notice.id}: {e}")
+                return None
+
+    print(f"All API keys are rate-limited. Skipping notice {notice.id}.")
+    return None
 
-                llm = ChatGoogleGenerativeAI(
-                    model="gemini-2.0-flash-lite",
-                    temperature=0,
-                    google_api_key=api_keys[current_api_key_index],
-                    max_retries=1,  # Re-initialize with the new key and retry setting
-                )
-                app = workflow.compile()
 
-                attempts_left -= 1
-                if attempts_left == 0:
+async def process_batch(
+    app: Any,
+    notice_dicts: List[Dict[str, Any]],
+    all_jobs: List[Job],
+    company_to_job: Dict[str, Job],
+    sem: asyncio.Semaphore,
+    key_cycle: "itertools.cycle[int]",
+) -> List[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]:
+    """
+    Run a batch of notices with one LLM call for the whole batch. The text
+    extraction, job matching and formatting steps run locally per notice.
+    Falls back to one graph run per notice if the batched call fails.
+    """
+    states: List[PostState] = [
+        extract_text(
+            {
+                "notice": Notice(**notice_dict),
+                "jobs": all_jobs,
+                "company_to_job": company_to_job,
+            }
+        )
+        for notice_dict in notice_dicts
+    ]
+
+    # Notices the keyword check settles don't need the LLM at all
+    pending = []
+    for index, state in enumerate(states):
+        category = quick_category(state["notice"].title)
+        if category in TEXT_ONLY_CATEGORIES:
+            _apply_analysis(state, {"category": category})
+        else:
+            pending.append(index)
+
+    results: List[Optional[Dict[str, Any]]] = [None] * len(states)
+    analyses = None
+    if pending:
+        async with sem:
+            for _ in range(len(llm_pool)):
+                api_key_index = next(key_cycle)
+                try:
                     print(
-                        f"All API keys are rate-limited. Skipping notice {notice.id}."
+                        f"\nProcessing batch of {len(pending)} notices with API Key Index: {api_key_index}"
                     )
-            except Exception as e:
-                print(f"An unexpected error occurred for notice {notice.id}: {e}")
-                break
+                    analyses = await batch_analyze_notices(
+                        [states[index] for index in pending],
+                        batch_analysis_chains[api_key_index],
+                    )
+                    break
+                except ResourceExhausted:
+                    print(
+                        f"API Key at index {api_key_index} is rate-limited. Rotating keys..."
+                    )
+                except Exception as e:
+                    print(f"An unexpected error occurred for the batch: {e}")
+                    break
+
+        if analyses is None:
+            print("Batched analysis failed, falling back to single-notice mode.")
+            fallback_results = await asyncio.gather(
+                *[
+                    process_notice(
+                        app,
+                        notice_dicts[index],
+                        all_jobs,
+                        company_to_job,
+                        sem,
+                        key_cycle,
+                    )
+                    for index in pending
+                ]
+            )
+            for index, result in zip(pending, fallback_results):
+                results[index] = result
+        else:
+            for index, analysis in zip(pending, analyses):
+                _apply_analysis(states[index], analysis)
+
+    for index, state in enumerate(states):
+        if results[index] is None and "category" in state:
+            results[index] = format_message(match_job(state))
+    return list(zip(notice_dicts, results))
+
+
+def build_enriched_record(
+    notice_dict: Dict[str, Any], result: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Combine the original notice with the graph's output for saving."""
+    matched_job = result.get("matched_job")
+    extracted = result.get("extracted", {}) or {}
+    pkg_str, pkg_breakdown = None, ""
+    if matched_job:
+        pkg_lpa = matched_job.package / 100000
+        pkg_str = f"{pkg_lpa:.2f} LPA"
+        pkg_breakdown = format_html_breakdown(matched_job.package_info)
+
+    return {
+        **notice_dict,
+        "category": result.get("category"),
+        "matched_job_id": result.get("matched_job_id"),
+        "job_company": (
+            matched_job.company if matched_job else extracted.get("company_name")
+        ),
+        "job_role": (matched_job.job_profile if matched_job else extracted.get("role")),
+        "package": pkg_str,
+        "package_breakdown": pkg_breakdown,
+        "formatted_message": result.get("formatted_message"),
+    }
+
+
+async def main_async(
+    app: Any,
+    pending_notices: List[Dict[str, Any]],
+    all_jobs: List[Job],
+    company_to_job: Dict[str, Job],
+    out_file: BinaryIO,
+    processed_count: int,
+) -> None:
+    """
+    Process notices in concurrent batches of BATCH_SIZE, appending each
+    result to out_file as one JSON line as soon as it completes.
+    """
+    sem = asyncio.Semaphore(MAX_CONCURRENT_NOTICES)
+    key_cycle = itertools.cycle(range(len(llm_pool)))
+
+    tasks = [
+        asyncio.create_task(
+            process_batch(
+                app,
+                pending_notices[start : start + BATCH_SIZE],
+                all_jobs,
+                company_to_job,
+                sem,
+                key_cycle,
+            )
+        )
+        for start in range(0, len(pending_notices), BATCH_SIZE)
+    ]
 
-        if not success or not result:
-            time.sleep(2)  # Add a delay even if it fails before trying the next one
-            continue
+    async def completed_notices():
+        for next_done in asyncio.as_completed(tasks):
+            for pair in await next_done:
+                yield pair
 
-        # 6. Build enriched record and save incrementally
-        matched_job = result.get("matched_job")
-        extracted = result.get("extracted", {}) or {}
-        pkg_str, pkg_breakdown = None, ""
-        if matched_job:
-            pkg_lpa = matched_job.package / 100000
-            pkg_str = f"{pkg_lpa:.2f} LPA"
-            pkg_breakdown = format_html_breakdown(matched_job.package_info)
-
-        enriched = {
-            **notice_dict,
-            "category": result.get("category"),
-            "matched_job_id": result.get("matched_job_id"),
-            "job_company": (
-                matched_job.company if matched_job else extracted.get("company_name")
-            ),
-            "job_role": (
-                matched_job.job_profile if matched_job else extracted.get("role")
-            ),
-            "package": pkg_str,
-            "package_breakdown": pkg_breakdown,
-            "formatted_message": result.get("formatted_message"),
-        }
-        final_records.append(enriched)
+    async for notice_dict, result in completed_notices():
+        if not result:
+            continue
 
-        with open(final_out_path, "w", encoding="utf-8") as f:
-            json.dump(final_records, f, ensure_ascii=False, indent=2)
+        enriched = build_enriched_record(notice_dict, result)
+        # orjson emits UTF-8 bytes directly, so the line is written as-is
+        out_file.write(orjson.dumps(enriched) + b"\n")
+        out_file.flush()
+        processed_count += 1
 
-        # 7. Print Final Output to Console
         print("\n" + "=" * 30)
         print("      FINAL OUTPUT")
         print("=" * 30)
@@ -519,10 +708,87 @@ if __name__ == "__main__":
         print(result.get("formatted_message"))
         print("=" * 30)
         print(
-            f"Successfully processed and saved notice {notice.id}. Total saved: {len(final_records)}"
+            f"Successfully processed and saved notice {notice_dict['id']}. Total saved: {processed_count}"
+        )
+
+
+if __name__ == "__main__":
+    load_dotenv()
+
+    # 1. API Key Setup with Rotation
+    api_keys_str = os.getenv("GOOGLE_API_KEYS", "")
+    api_keys = [key.strip() for key in api_keys_str.split(",") if key.strip()]
+    if not api_keys:
+        raise ValueError("GOOGLE_API_KEYS not found in .env file or is empty.")
+
+    # 2. Initial LLM pool and App setup
+    llm_pool.extend(
+        ChatGoogleGenerativeAI(
+            model="gemini-2.0-flash-lite",
+            temperature=0,
+            google_api_key=api_key,
+            max_retries=1,  # Prevent internal retries to allow our custom rotation to trigger
         )
+        for api_key in api_keys
+    )
+    analysis_chains.extend(ANALYSIS_PROMPT | llm for llm in llm_pool)
+    batch_analysis_chains.extend(BATCH_ANALYSIS_PROMPT | llm for llm in llm_pool)
+    # Compiled exactly once: rotating keys only changes the api_key_index a
+    # run is started with, never the graph itself
+    app = workflow.compile()
+
+    # 3. Load data files
+    data_dir = os.path.join(os.path.dirname(__file__), "data")
+
+    # Identical prompts on re-runs are answered from disk instead of Gemini
+    set_llm_cache(SQLiteCache(database_path=os.path.join(data_dir, "llm_cache.db")))
+    notices_path = os.path.join(data_dir, "structured_notices.json")
+    with open(notices_path, "rb") as f:
+        notices_data = orjson.loads(f.read())
+
+    jobs_path = os.path.join(data_dir, "structured_job_listings.json")
+    with open(jobs_path, "rb") as f:
+        jobs_data = orjson.loads(f.read())
+
+    all_jobs = JOBS_ADAPTER.validate_python(jobs_data)
+    company_to_job = build_company_index(all_jobs)
 
-        # 8. Add delay to respect rate limits
-        time.sleep(2)
+    # 4. Incremental Saving Setup
+    # One JSON object per line, appended as notices complete
+    final_out_path = os.path.join(data_dir, "final_notices.jsonl")
+    processed_notice_ids = set()
+    if os.path.exists(final_out_path):
+        with open(final_out_path, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    processed_notice_ids.add(orjson.loads(line)["id"])
+                except (orjson.JSONDecodeError, KeyError):
+                    print(f"Warning: Skipping unreadable line in {final_out_path}.")
+    print(f"Found {len(processed_notice_ids)} already processed notices.")
+
+    # 5. Main Processing Loop
+    pending_notices = [
+        notice_dict
+        for notice_dict in notices_data
+        if notice_dict["id"] not in processed_notice_ids
+    ]
+    print(
+        f"Skipping {len(notices_data) - len(pending_notices)} already processed notices. "
+        f"{len(pending_notices)} notices to process."
+    )
+
+    with open(final_out_path, "ab") as out_file:
+        asyncio.run(
+            main_async(
+                app,
+                pending_notices,
+                all_jobs,
+                company_to_job,
+                out_file,
+                len(processed_notice_ids),
+            )
+        )
 
     print(f"\nProcessing complete. All enriched notices saved to: {final_out_path}")
@@ -1,5 +1,20 @@
 import os
-import json
+
+import orjson
+
+
+def _transform_notice(notice):
+    """Reshape one raw SuperSet notice into the structured layout"""
+    tmp = {}
+    tmp["id"] = notice.get("identifier")
+    tmp["title"] = notice.get("title", "Notice")
+    tmp["content"] = notice.get("content", "")
+    tmp["author"] = notice.get("lastModifiedByUserName", "")
+    tmp["updatedAt"] = (
+        time if (time := notice.get("lastModifiedOn")) else notice.get("publishedAt")
+    )
+    tmp["createdAt"] = notice.get("publishedAt")
+    return tmp
 
 
 def main():
@@ -8,23 +23,10 @@ def main():
         "data",
         "notices.json",
     )
-    with open(path, "r") as f:
-        data = f.read()
-        json_data = json.loads(data)
-        structured_notices = []
-        for notice in json_data:
-            tmp = {}
-            tmp["id"] = notice.get("identifier")
-            tmp["title"] = notice.get("title", "Notice")
-            tmp["content"] = notice.get("content", "")
-            tmp["author"] = notice.get("lastModifiedByUserName", "")
-            tmp["updatedAt"] = (
-                time
-                if (time := notice.get("lastModifiedOn"))
-                else notice.get("publishedAt")
-            )
-            tmp["createdAt"] = notice.get("publishedAt")
-            structured_notices.append(tmp)
+    with open(path, "rb") as f:
+        json_data = orjson.loads(f.read())
+
+    structured_notices = [_transform_notice(notice) for notice in json_data]
 
     save_path = os.path.join(
         os.getcwd(),
@@ -32,8 +34,8 @@ def main():
         "structured_notices.json",
     )
 
-    with open(save_path, "w") as f:
-        json.dump(structured_notices, f, indent=4)
+    with open(save_path, "wb") as f:
+        f.write(orjson.dumps(structured_notices, option=orjson.OPT_INDENT_2))
 
 
 if __name__ == "__main__":
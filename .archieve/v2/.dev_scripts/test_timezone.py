@@ -1,16 +1,17 @@
-from datetime import datetime, timezone
-from zoneinfo import ZoneInfo
+from datetime import datetime, timedelta, timezone
 import time
 
+# IST is a fixed UTC+05:30 with no DST, so no tzdata lookup is needed
+IST = timezone(timedelta(hours=5, minutes=30), "IST")
+IST_FORMAT = "%B %d, %Y at %I:%M %p %Z"
 
-def _format_ms_epoch_to_ist(ms, fmt="%B %d, %Y at %I:%M %p %Z"):
+
+def _format_ms_epoch_to_ist(ms, fmt=IST_FORMAT):
     if not ms:
         return "Not specified"
     try:
         ts = float(ms) / 1000.0
-        dt_utc = datetime.fromtimestamp(ts, tz=timezone.utc)
-        ist = dt_utc.astimezone(ZoneInfo("Asia/Kolkata"))
-        return ist.strftime(fmt)
+        return datetime.fromtimestamp(ts, tz=IST).strftime(fmt)
     except Exception as e:
         return f"Error: {e}"
 
@@ -23,11 +24,9 @@ def _fmt_dt_simulated(val):
         dt = datetime.fromisoformat(str(val))
         if dt.tzinfo is None:
             # This is the change we made: treat naive as IST
-            dt = dt.replace(tzinfo=ZoneInfo("Asia/Kolkata"))
+            dt = dt.replace(tzinfo=IST)
 
-        return dt.astimezone(ZoneInfo("Asia/Kolkata")).strftime(
-            "%B %d, %Y at %I:%M %p %Z"
-        )
+        return dt.astimezone(IST).strftime(IST_FORMAT)
     except Exception as e:
         return str(e)
 
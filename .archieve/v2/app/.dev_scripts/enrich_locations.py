@@ -1,39 +1,52 @@
-import json
 import os
+import shutil
 from typing import Any, Dict, List
 
+import msgspec
+import orjson
+
 
 def main() -> None:
     # Resolve data directory relative to this script (../data)
     script_dir = os.path.dirname(__file__)
     data_dir = os.path.abspath(os.path.join(script_dir, "..", "data"))
 
-    final_path = os.path.join(data_dir, "final_notices.json")
+    final_path = os.path.join(data_dir, "final_notices.jsonl")
     jobs_path = os.path.join(data_dir, "structured_job_listings.json")
 
+    # Backup the original bytes before modifying anything
+    backup_path = final_path + ".backup"
+    shutil.copyfile(final_path, backup_path)
+
     # Load files
-    with open(final_path, "r", encoding="utf-8") as f:
-        final_notices: List[Dict[str, Any]] = json.load(f)
+    # final_notices.jsonl holds one notice object per line
+    with open(final_path, "rb") as f:
+        final_notices: List[Dict[str, Any]] = [
+            msgspec.json.decode(line) for line in f if line.strip()
+        ]
 
-    with open(jobs_path, "r", encoding="utf-8") as f:
-        jobs: List[Dict[str, Any]] = json.load(f)
+    with open(jobs_path, "rb") as f:
+        jobs: List[Dict[str, Any]] = msgspec.json.decode(f.read())
 
     # Build job id -> location map (fallback to None if missing)
-    id_to_location: Dict[str, Any] = {}
-    for j in jobs:
-        jid = j.get("id")
-        if isinstance(jid, str) and jid:
-            id_to_location[jid] = j.get("location")
+    id_to_location: Dict[str, Any] = {
+        j["id"]: j.get("location")
+        for j in jobs
+        if isinstance(j.get("id"), str) and j["id"]
+    }
 
     updated_count = 0
     missing_jobs = 0
 
+    # Local alias keeps the per-entry lookup off the attribute path
+    get_location = id_to_location.get
+
     for entry in final_notices:
         job_id = entry.get("matched_job_id")
         if not job_id:
             continue
 
-        loc = id_to_location.get(job_id)
+        loc = get_location(job_id)
         if loc is None:
             missing_jobs += 1
             continue
@@ -43,13 +56,10 @@ def main() -> None:
             entry["location"] = loc
             updated_count += 1
 
-    # Backup then write in place
-    backup_path = final_path + ".backup"
-    with open(backup_path, "w", encoding="utf-8") as f:
-        json.dump(final_notices, f, ensure_ascii=False, indent=2)
-
-    with open(final_path, "w", encoding="utf-8") as f:
-        json.dump(final_notices, f, ensure_ascii=False, indent=2)
+    # Write in place; orjson always emits UTF-8, like ensure_ascii=False
+    with open(final_path, "wb") as f:
+        for entry in final_notices:
+            f.write(orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS) + b"\n")
 
     print(f"Updated entries: {updated_count}")
     print(f"Missing job ids: {missing_jobs}")
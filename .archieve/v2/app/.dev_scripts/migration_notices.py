@@ -16,6 +16,8 @@ def migrate_structured_notices():
         print(f"Error reading JSON file: {e}")
         return
 
+    # Every record is stamped with the same migration time
+    now_iso = datetime.utcnow().isoformat()
     mongo_structured = []
     for notice in notices:
         title = notice.get("title", "No Title")
@@ -34,10 +36,10 @@ def migrate_structured_notices():
                 "raw_content": raw_content,
                 "author": author.strip() if author else "Unknown",
                 "posted_time": posted_time.strip() if posted_time else "",
-                "scraped_at": datetime.utcnow().isoformat(),
+                "scraped_at": now_iso,
                 "sent_to_telegram": True,
-                "created_at": datetime.utcnow().isoformat(),
-                "updated_at": datetime.utcnow().isoformat(),
+                "created_at": now_iso,
+                "updated_at": now_iso,
             }
         )
 
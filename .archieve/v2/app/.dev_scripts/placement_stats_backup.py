@@ -1,17 +1,17 @@
 import os
-import json
 import re
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional, Dict, TypedDict
+from functools import lru_cache
+from typing import Any, Iterator, List, Optional, Dict, Tuple
 from dotenv import load_dotenv
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel
 from langchain_google_genai import ChatGoogleGenerativeAI
+from langchain_core.globals import set_llm_cache
+from langchain_community.cache import SQLiteCache
 from langchain.prompts import ChatPromptTemplate
 from langgraph.graph import StateGraph, END
-
-# --- Environment Variable Setup ---
-load_dotenv()
-GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
+from selectolax.lexbor import LexborHTMLParser
 
 # ---------------- Pydantic Schema for Data Validation ----------------
 
@@ -42,15 +42,25 @@ class PlacementOffer(BaseModel):
 
 
 # ---------------- LangChain LLM Setup ----------------
-llm = ChatGoogleGenerativeAI(
-    model="gemini-2.0-flash-lite",
-    temperature=0,
-    google_api_key=GOOGLE_API_KEY,
-)
 
-# The prompt is updated to request JSON matching the detailed Pydantic schema.
-prompt = ChatPromptTemplate.from_template(
-    """
+
+@lru_cache(maxsize=1)
+def get_llm() -> ChatGoogleGenerativeAI:
+    """Load the environment and create the shared Gemini client on first use."""
+    load_dotenv()
+    # temperature=0 makes responses deterministic, so re-runs and duplicate
+    # emails are served from the local cache instead of calling Gemini again
+    set_llm_cache(SQLiteCache(database_path=".placement_llm_cache.db"))
+    return ChatGoogleGenerativeAI(
+        model="gemini-2.0-flash-lite",
+        temperature=0,
+        google_api_key=os.getenv("GOOGLE_API_KEY"),
+    )
+
+
+# The schema and instructions form a fixed system message and only the email
+# varies per call, so providers with prefix caching can reuse the system block.
+SCHEMA_AND_RULES = """
     You are an expert assistant specializing in extracting structured data from placement offer emails.
     Analyze the email content and extract the information in a JSON format that strictly matches the schema below.
 
@@ -79,95 +89,187 @@ prompt = ChatPromptTemplate.from_template(
     }}
 
     Return only the raw JSON object, without any surrounding text, explanations, or markdown.
-
-    Email Content to analyze:
-    Subject: {subject}
-    From: {sender}
-    Body: {body}
     """
+
+prompt = ChatPromptTemplate.from_messages(
+    [
+        ("system", SCHEMA_AND_RULES),
+        ("user", "Subject: {subject}\nFrom: {sender}\nBody: {body}"),
+    ]
 )
 
+
+@lru_cache(maxsize=1)
+def get_extraction_chain():
+    """Build the prompt | LLM chain on first use."""
+    # Gemini's JSON mode returns PlacementOffer instances directly, so there is
+    # no markdown fence stripping or hand-rolled JSON parsing on the response
+    return prompt | get_llm().with_structured_output(PlacementOffer, method="json_mode")
+
+
 # ---------------- LangGraph Workflow State and Nodes ----------------
 
 
-class GraphState(TypedDict):
+# Nodes read attributes and return only the keys they change, which LangGraph
+# merges into the state instead of each node copying the whole dict
+@dataclass(slots=True)
+class GraphState:
     email: Dict[str, str]
-    is_relevant: Optional[bool]
-    extracted_offer: Optional[PlacementOffer]
+    is_relevant: Optional[bool] = None
+    extracted_offer: Optional[PlacementOffer] = None
 
 
 # Keywords to identify relevant emails
 ALLOWED_KEYWORDS = ["tnp", "placement", "offer", "congratulations"]
+# An alternation of plain literals has nothing to backtrack over, so re already
+# scans each field once in C; re2/pyahocorasick would add a native dependency
+# without changing the O(N) cost for a keyword set this small.
+KEYWORD_PATTERN = re.compile("|".join(map(re.escape, ALLOWED_KEYWORDS)), re.IGNORECASE)
 
 
-def classify_email(state: GraphState) -> GraphState:
+# Re-delivered threads and forwards repeat the same subject/sender pair, so
+# only that check is memoized; keying on the body would hash it on every call
+@lru_cache(maxsize=2048)
+def _header_is_relevant(subject: str, sender: str) -> bool:
+    search = KEYWORD_PATTERN.search
+    return bool(search(subject) or search(sender))
+
+
+def _is_relevant(subject: str, sender: str, body: str) -> bool:
+    """Check the subject and sender first; the HTML body is scanned only if they miss."""
+    return _header_is_relevant(subject, sender) or bool(KEYWORD_PATTERN.search(body))
+
+
+def classify_email(state: GraphState) -> Dict[str, Any]:
     """Node 1: Classifies if the email is a relevant placement offer."""
     print("--- Step 1: Classifying Email ---")
-    email = state["email"]
-    # Combine all text sources for a comprehensive keyword search
-    search_text = (
-        email["sender"].lower() + email["subject"].lower() + email["body"].lower()
-    )
-
-    if any(keyword in search_text for keyword in ALLOWED_KEYWORDS):
+    email = state.email
+    if _is_relevant(email["subject"], email["sender"], email["body"]):
         print("✅ Email classified as RELEVANT.")
-        return {**state, "is_relevant": True}
+        return {"is_relevant": True}
 
     print("❌ Email classified as NOT RELEVANT. Halting workflow.")
-    return {**state, "is_relevant": False}
+    return {"is_relevant": False}
 
 
-def extract_json_from_response(response_content: str) -> str:
-    """Extract JSON from response content, handling markdown code blocks."""
-    # Remove markdown code blocks if present
-    json_pattern = r"```(?:json)?\s*([\s\S]*?)\s*```"
-    match = re.search(json_pattern, response_content)
+# Blank lines and indentation left behind once the Gmail markup is stripped
+BLANK_LINES_PATTERN = re.compile(r"\s*\n\s*")
 
-    if match:
-        return match.group(1).strip()
+# Block-level tags that start a new line in the rendered email
+BLOCK_TAGS = "p, div, br, tr, li, h1, h2, h3, h4, h5, h6"
 
-    # If no code blocks found, return the original content
-    return response_content.strip()
+# One row of the T&P student list:
+# S.NO  ENROLLMENT NO  NAME  INSTITUTECODE  PROGRAMCODE  BRANCHCODE  GMAIL ID
+STUDENT_ROW_PATTERN = re.compile(
+    r"^\d+\s+(\d{8,10})\s+([A-Z][A-Z .]+?)\s+[A-Z]+\s+\S+\s+\S+\s+(\S+@\S+)$",
+    re.MULTILINE,
+)
 
 
-def extract_info(state: GraphState) -> GraphState:
-    """Node 2: Extracts information and validates it against the Pydantic schema."""
-    print("\n--- Step 2: Extracting and Validating Information ---")
-    email = state["email"]
-    chain = prompt | llm
+def html_to_text(html: str) -> str:
+    """Strip markup from an email body so only its text is sent to the LLM."""
+    tree = LexborHTMLParser(html)
+    if tree.body is None:
+        return html.strip()
+    # Break lines only at block elements so each table row stays on one line
+    for node in tree.css(BLOCK_TAGS):
+        node.insert_after("\n")
+    return BLANK_LINES_PATTERN.sub("\n", tree.body.text(separator="")).strip()
 
-    response = chain.invoke(
-        {"subject": email["subject"], "sender": email["sender"], "body": email["body"]}
-    )
 
-    try:
-        # Extract JSON from response, handling markdown code blocks
-        json_content = extract_json_from_response(str(response.content))
-        data = json.loads(json_content)
+def extract_students(text: str) -> Tuple[List[Student], str]:
+    """Parse the student table out of the email text.
+
+    Returns the parsed students and the text with the table rows removed.
+    """
+    students = [
+        Student(name=name, enrollment_number=enrollment_number, email=email)
+        for enrollment_number, name, email in STUDENT_ROW_PATTERN.findall(text)
+    ]
+    if not students:
+        return students, text
+    return students, BLANK_LINES_PATTERN.sub("\n", STUDENT_ROW_PATTERN.sub("", text))
+
+
+# Upper bound on concurrent Gemini requests when extracting a batch of emails
+MAX_LLM_CONCURRENCY = 8
+
+
+def finalize_offer(
+    email: Dict[str, str], students: List[Student], offer: PlacementOffer
+) -> PlacementOffer:
+    """Attach the locally parsed students and email metadata to an offer."""
+    if students:
+        offer.students_selected = students
+        offer.number_of_offers = len(students)
+    # Add metadata from the original email
+    offer.email_subject = email["subject"]
+    offer.email_sender = email["sender"]
+    return offer
+
 
-        # Validate the extracted data by creating a PlacementOffer instance
-        offer = PlacementOffer(**data)
-        # Add metadata from the original email
-        offer.email_subject = email["subject"]
-        offer.email_sender = email["sender"]
+def prepare_input(email: Dict[str, str]) -> Tuple[List[Student], Dict[str, str]]:
+    """Build the prompt variables for an email.
+
+    The student table is parsed here rather than by the LLM, which then only
+    has to read the narrative part of the email.
+    """
+    students, body = extract_students(html_to_text(email["body"]))
+    return students, {
+        "subject": email["subject"],
+        "sender": email["sender"],
+        "body": body,
+    }
+
+
+def extract_many(emails: List[Dict[str, str]]) -> List[Optional[PlacementOffer]]:
+    """Extract placement offers from several emails with concurrent LLM calls."""
+    prepared = [prepare_input(email) for email in emails]
+    results = get_extraction_chain().batch(
+        [inputs for _, inputs in prepared],
+        config={"max_concurrency": MAX_LLM_CONCURRENCY},
+        return_exceptions=True,
+    )
+
+    offers = []
+    for email, (students, _), result in zip(emails, prepared, results):
+        if isinstance(result, Exception):
+            print(
+                f"❌ Extraction Error: The LLM output did not match the required schema.\n{result}"
+            )
+            offers.append(None)
+            continue
         print("✅ Information extracted and validated successfully.")
-        return {**state, "extracted_offer": offer}
-    except ValidationError as e:
-        print(
-            f"❌ Pydantic Validation Error: The LLM output did not match the required schema.\n{e}"
-        )
-        return {**state, "extracted_offer": None}
-    except json.JSONDecodeError as e:
-        print(
-            f"❌ JSON Parsing Error: The LLM output was not valid JSON.\nError: {e}\nResponse: {response.content}"
-        )
-        return {**state, "extracted_offer": None}
+        offers.append(finalize_offer(email, students, result))
+    return offers
+
+
+def stream_extract(email: Dict[str, str]) -> Iterator[PlacementOffer]:
+    """Yield progressively more complete offers as the LLM output streams in.
+
+    Meant for interactive use where showing partial results early matters;
+    the graph uses extract_many so its calls go through the LLM cache.
+    """
+    students, inputs = prepare_input(email)
+
+    offer = None
+    for offer in get_extraction_chain().stream(inputs):
+        yield offer
+    if offer is not None:
+        yield finalize_offer(email, students, offer)
+
+
+def extract_info(state: GraphState) -> Dict[str, Any]:
+    """Node 2: Extracts information and validates it against the Pydantic schema."""
+    print("\n--- Step 2: Extracting and Validating Information ---")
+    (offer,) = extract_many([state.email])
+    return {"extracted_offer": offer}
 
 
 def display_results(state: GraphState) -> None:
     """Node 3: Displays the final, validated placement offer details."""
     print("\n--- Step 3: Displaying Results ---")
-    offer = state.get("extracted_offer")
+    offer = state.extracted_offer
 
     print("\n" + "=" * 50)
     print("    Final Extracted Placement Details")
@@ -176,12 +278,8 @@ def display_results(state: GraphState) -> None:
     if not offer:
         print("No valid placement information could be extracted.")
     else:
-        # Pydantic's .dict() method is useful for clean printing
-        offer_dict = offer.dict()
-        for key, value in offer_dict.items():
-            if value is not None:
-                formatted_key = key.replace("_", " ").title()
-                print(f"- {formatted_key+':':<20} {json.dumps(value, indent=2)}")
+        # Serialize the whole offer in one pass inside pydantic-core
+        print(offer.model_dump_json(indent=2, exclude_none=True))
 
     print("=" * 50 + "\n")
 
@@ -191,21 +289,25 @@ def display_results(state: GraphState) -> None:
 
 def decide_to_extract(state: GraphState) -> str:
     """Determines the next step after classification."""
-    return "extract_info" if state.get("is_relevant") else END
+    return "extract_info" if state.is_relevant else END
+
 
+@lru_cache(maxsize=1)
+def get_app():
+    """Build and compile the workflow graph on first use."""
+    workflow = StateGraph(GraphState)
 
-workflow = StateGraph(GraphState)
+    workflow.add_node("classify", classify_email)
+    workflow.add_node("extract_info", extract_info)
+    workflow.add_node("display_results", display_results)
 
-workflow.add_node("classify", classify_email)
-workflow.add_node("extract_info", extract_info)
-workflow.add_node("display_results", display_results)
+    workflow.set_entry_point("classify")
+    workflow.add_conditional_edges("classify", decide_to_extract)
+    workflow.add_edge("extract_info", "display_results")
+    workflow.add_edge("display_results", END)
 
-workflow.set_entry_point("classify")
-workflow.add_conditional_edges("classify", decide_to_extract)
-workflow.add_edge("extract_info", "display_results")
-workflow.add_edge("display_results", END)
+    return workflow.compile()
 
-app = workflow.compile()
 
 # ---------------- Run Pipeline with Manual Text Input ----------------
 if __name__ == "__main__":
@@ -265,8 +367,8 @@ For more options, visit <a href="https://groups.google.com/d/optout" target="_bl
         "body": input_email_body,
     }
 
-    initial_state = {"email": test_email}
+    initial_state = GraphState(email=test_email)
 
     print("🚀 Starting email processing pipeline...")
-    app.invoke(initial_state)  # type: ignore
+    get_app().invoke(initial_state)
     print("✅ Pipeline finished.")
@@ -2,18 +2,26 @@
 """
 Script to fetch all posts from SuperSet and update MongoDB entries with documents
 """
-import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any
 from dotenv import load_dotenv
 from pprint import pprint
 
 from scrapper import SupersetClient, User, Job, Document
 from database import MongoDBManager
-from config import safe_print
+from config import safe_print, get_credentials
 
 load_dotenv()
 
+# Jobs sent to MongoDB per bulk_write round-trip
+BULK_WRITE_BATCH_SIZE = 500
+
+# Concurrent SuperSet requests when refreshing job documents
+FETCH_WORKERS = 16
+# Print one progress line every this many jobs instead of several per job
+PROGRESS_EVERY = 10
+
 
 def update_all_jobs_with_documents():
     """Fetch all jobs from SuperSet and update MongoDB with document information"""
@@ -22,19 +30,16 @@ def update_all_jobs_with_documents():
     db = MongoDBManager()
     
     # Login multiple users
-    cse_email = os.getenv("CSE_EMAIL")
-    cse_password = os.getenv("CSE_ENCRYPTION_PASSWORD")
-    ece_email = os.getenv("ECE_EMAIL")
-    ece_password = os.getenv("ECE_ENCRYPTION_PASSWORD")
+    creds = get_credentials()
     
-    if not all([cse_email, cse_password, ece_email, ece_password]):
+    if not all([creds.cse_email, creds.cse_password, creds.ece_email, creds.ece_password]):
         safe_print("❌ Missing credentials in environment variables")
         return
     
     try:
         # Login both users
-        cse_user = client.login(cse_email, cse_password)
-        ece_user = client.login(ece_email, ece_password)
+        cse_user = client.login(creds.cse_email, creds.cse_password)
+        ece_user = client.login(creds.ece_email, creds.ece_password)
         users = [cse_user, ece_user]
         
         safe_print(f"✅ Logged in as {cse_user.name} and {ece_user.name}")
@@ -51,37 +56,27 @@ def update_all_jobs_with_documents():
         
         safe_print("💾 Updating MongoDB with job data and documents...")
         
+        job_dicts = []
         for i, job in enumerate(all_jobs, 1):
             try:
                 # Convert job to dict for MongoDB storage
-                job_dict = job.model_dump()
+                job_dicts.append(job.model_dump())
                 
                 # Log progress
-                if i % 10 == 0 or i == len(all_jobs):
-                    safe_print(f"Processing job {i}/{len(all_jobs)}: {job.job_profile} at {job.company}")
-                
-                # Log document info
-                if job.documents:
-                    safe_print(f"  📄 Found {len(job.documents)} documents:")
-                    for doc in job.documents:
-                        safe_print(f"    - {doc.name} (URL: {'✅' if doc.url else '❌'})")
-                
-                # Upsert to MongoDB
-                success, info = db.upsert_structured_job(job_dict)
-                
-                if success:
-                    if info == "updated":
-                        updated_count += 1
-                    else:
-                        inserted_count += 1
-                else:
-                    safe_print(f"❌ Failed to save job {job.id}: {info}")
-                    error_count += 1
+                if i % PROGRESS_EVERY == 0 or i == len(all_jobs):
+                    safe_print(f"Processing job {i}/{len(all_jobs)}: {job.job_profile} at {job.company} ({len(job.documents or [])} documents)")
                     
             except Exception as e:
                 safe_print(f"❌ Error processing job {job.id}: {e}")
                 error_count += 1
         
+        # Upsert to MongoDB in batches instead of one round-trip per job
+        for start in range(0, len(job_dicts), BULK_WRITE_BATCH_SIZE):
+            stats = db.bulk_upsert_structured_jobs(job_dicts[start:start + BULK_WRITE_BATCH_SIZE])
+            inserted_count += stats["inserted"]
+            updated_count += stats["updated"]
+            error_count += stats["errors"]
+        
         # Print summary
         safe_print("\n" + "="*50)
         safe_print("📊 SUMMARY:")
@@ -111,6 +106,23 @@ def update_all_jobs_with_documents():
         db.close_connection()
 
 
+def fetch_job_documents(client: SupersetClient, user: User, job_id: str) -> List[Dict[str, Any]]:
+    """Fetch fresh job details from SuperSet and resolve each document's URL"""
+    job_details = client.get_job_details(user, job_id)
+    
+    docs = [doc for doc in job_details.get("documents", []) if doc.get("name") and doc.get("identifier")]
+    doc_urls = client.get_document_urls(user, job_id, [doc.get("identifier") for doc in docs])
+    
+    documents = []
+    for doc, doc_url in zip(docs, doc_urls):
+        documents.append({
+            "name": doc.get("name"),
+            "identifier": doc.get("identifier"),
+            "url": doc_url
+        })
+    return documents
+
+
 def update_existing_jobs_with_documents():
     """Update existing jobs in MongoDB that don't have document information"""
     
@@ -119,76 +131,55 @@ def update_existing_jobs_with_documents():
     
     try:
         # Login users
-        cse_email = os.getenv("CSE_EMAIL")
-        cse_password = os.getenv("CSE_ENCRYPTION_PASSWORD")
+        creds = get_credentials()
         
-        if not cse_email or not cse_password:
+        if not creds.cse_email or not creds.cse_password:
             safe_print("❌ Missing CSE credentials")
             return
             
-        user = client.login(cse_email, cse_password)
+        user = client.login(creds.cse_email, creds.cse_password)
         safe_print(f"✅ Logged in as {user.name}")
         
-        # Get all existing jobs from MongoDB
-        safe_print("📥 Fetching existing jobs from MongoDB...")
-        existing_jobs = db.get_all_jobs(limit=1000)  # Get more jobs
-        safe_print(f"📊 Found {len(existing_jobs)} existing jobs in MongoDB")
-        
-        # Filter jobs that don't have documents or have empty documents
-        jobs_needing_update = []
-        for job in existing_jobs:
-            if not job.get("documents") or len(job.get("documents", [])) == 0:
-                jobs_needing_update.append(job)
+        # Stream only the jobs without documents; the filter runs in MongoDB
+        safe_print("📥 Fetching jobs without documents from MongoDB...")
+        jobs_to_fetch = [job for job in db.iter_jobs_missing_documents() if job.get("id")]
         
-        safe_print(f"🔄 {len(jobs_needing_update)} jobs need document updates")
+        safe_print(f"🔄 {len(jobs_to_fetch)} jobs need document updates")
         
-        if not jobs_needing_update:
+        if not jobs_to_fetch:
             safe_print("✅ All jobs already have document information")
             return
         
         updated_count = 0
         error_count = 0
-        
-        for i, job in enumerate(jobs_needing_update, 1):
-            try:
-                job_id = job.get("id")
-                if not job_id:
-                    continue
+        updated_jobs = []
+        
+        # The SuperSet calls are pure network waits, so fetch jobs concurrently;
+        # the pool size bounds how many requests are in flight at once
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+            futures = [
+                executor.submit(fetch_job_documents, client, user, job["id"])
+                for job in jobs_to_fetch
+            ]
+            
+            for i, (job, future) in enumerate(zip(jobs_to_fetch, futures), 1):
+                try:
+                    documents = future.result()
                     
-                safe_print(f"🔄 Updating job {i}/{len(jobs_needing_update)}: {job.get('job_profile', 'Unknown')} at {job.get('company', 'Unknown')}")
-                
-                # Fetch fresh job details from SuperSet
-                job_details = client.get_job_details(user, job_id)
-                
-                # Extract documents
-                documents = []
-                for doc in job_details.get("documents", []):
-                    if doc.get("name") and doc.get("identifier"):
-                        doc_url = client.get_document_url(user, job_id, doc.get("identifier"))
-                        documents.append({
-                            "name": doc.get("name"),
-                            "identifier": doc.get("identifier"),
-                            "url": doc_url
-                        })
-                
-                if documents:
-                    safe_print(f"  📄 Found {len(documents)} documents")
-                    for doc in documents:
-                        safe_print(f"    - {doc['name']} (URL: {'✅' if doc['url'] else '❌'})")
-                
-                # Update the job in MongoDB
-                updated_job = {**job, "documents": documents}
-                success, info = db.upsert_structured_job(updated_job)
-                
-                if success:
-                    updated_count += 1
-                else:
-                    safe_print(f"❌ Failed to update job {job_id}: {info}")
-                    error_count += 1
+                    if i % PROGRESS_EVERY == 0 or i == len(jobs_to_fetch):
+                        safe_print(f"🔄 Updating job {i}/{len(jobs_to_fetch)}: {job.get('job_profile', 'Unknown')} at {job.get('company', 'Unknown')} ({len(documents)} documents)")
                     
-            except Exception as e:
-                safe_print(f"❌ Error updating job {job.get('id', 'Unknown')}: {e}")
-                error_count += 1
+                    # Queue the job for the batched MongoDB update
+                    updated_jobs.append({**job, "documents": documents})
+                    
+                except Exception as e:
+                    safe_print(f"❌ Error updating job {job.get('id', 'Unknown')}: {e}")
+                    error_count += 1
+        
+        for start in range(0, len(updated_jobs), BULK_WRITE_BATCH_SIZE):
+            stats = db.bulk_upsert_structured_jobs(updated_jobs[start:start + BULK_WRITE_BATCH_SIZE])
+            updated_count += stats["inserted"] + stats["updated"]
+            error_count += stats["errors"]
         
         safe_print(f"\n✅ Update complete: {updated_count} jobs updated, {error_count} errors")
         
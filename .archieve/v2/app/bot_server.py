@@ -19,17 +19,23 @@ Features:
 
 import os
 import sys
+import asyncio
 import logging
 import argparse
-from datetime import datetime
+from datetime import datetime, timedelta
 import pytz
 from telegram_handeller import TelegramBot
-import schedule
-import time
-import threading
-from main import main as run_main_process
+from main import build_context, run_pipeline
 import subprocess
 
+try:
+    import uvloop
+except ImportError:  # not available on Windows
+    uvloop = None
+
+# Times of day (IST) the scraping/notification job runs
+SCHEDULE_TIMES = ("09:00", "12:00", "15:00", "18:00", "20:00", "00:00")
+
 
 def setup_logging(daemon_mode=False):
     """Setup logging configuration for daemon and normal modes"""
@@ -72,8 +78,11 @@ class BotServer:
         self.logger = logging.getLogger(self.__class__.__name__)
         self.daemon_mode = daemon_mode
         self.telegram_bot = TelegramBot()
+        # Built once and shared across scheduled runs so the HTTP/MongoDB
+        # connection pools and LLM client aren't recreated three+ times a day
+        self.ctx = build_context(telegram_bot=self.telegram_bot)
         self.ist = pytz.timezone("Asia/Kolkata")
-        self.running = True
+        self._scheduler_task = None
 
         self.logger.info(
             f"BotServer initialized in {'daemon' if daemon_mode else 'normal'} mode"
@@ -93,7 +102,7 @@ class BotServer:
             self.logger.info(f"SCHEDULED JOB STARTED AT {current_time}")
 
             # Run the main process (scraping + formatting + sending)
-            result = run_main_process(daemon_mode=self.daemon_mode)
+            result = run_pipeline(self.ctx, daemon_mode=self.daemon_mode)
 
             if result == 0:
                 success_msg = (
@@ -115,16 +124,9 @@ class BotServer:
                 print(error_msg)
 
     def setup_schedule(self):
-        """Setup the scheduled jobs for 3 times a day"""
+        """Log the times of day the scheduled job runs"""
         self.logger.info("Setting up scheduled jobs")
 
-        schedule.every().day.at("09:00").do(self.scheduled_job)
-        schedule.every().day.at("12:00").do(self.scheduled_job)
-        schedule.every().day.at("15:00").do(self.scheduled_job)
-        schedule.every().day.at("18:00").do(self.scheduled_job)
-        schedule.every().day.at("20:00").do(self.scheduled_job)
-        schedule.every().day.at("00:00").do(self.scheduled_job)
-
         schedule_msg = "📅 Scheduled jobs setup: 9:00 AM, 12:00 PM, 3:00 PM, 6:00 PM, 8:00 PM, 12:00 AM IST"
         self.logger.info(schedule_msg)
 
@@ -137,17 +139,57 @@ class BotServer:
             print("   - 8:00 PM IST (Night)")
             print("   - 12:00 AM IST (Midnight)")
 
-    def run_scheduler(self):
-        """Run the scheduler in a separate thread"""
-        self.logger.info("Starting job scheduler thread")
+    def next_run_time(self, after):
+        """Return the first scheduled IST datetime strictly after `after`"""
+        candidates = []
+        for slot in SCHEDULE_TIMES:
+            hour, minute = map(int, slot.split(":"))
+            run_at = after.replace(hour=hour, minute=minute, second=0, microsecond=0)
+            if run_at <= after:
+                run_at += timedelta(days=1)
+            candidates.append(run_at)
+        return min(candidates)
+
+    async def run_scheduler(self):
+        """Sleep until each scheduled time, then run the job off the event loop"""
+        self.logger.info("Starting job scheduler")
         if not self.daemon_mode:
             print("🕐 Starting job scheduler...")
 
-        while self.running:
-            schedule.run_pending()
-            time.sleep(60)  # Check every minute
-
-        self.logger.info("Job scheduler thread stopped")
+        last_run = None
+        try:
+            while True:
+                now = datetime.now(self.ist)
+                # Count from the slot that just ran so an early wake-up can't
+                # pick the same slot twice
+                next_run = self.next_run_time(max(now, last_run) if last_run else now)
+                self.logger.info(
+                    f"Next scheduled job at {next_run.strftime('%Y-%m-%d %H:%M:%S IST')}"
+                )
+                await asyncio.sleep((next_run - now).total_seconds())
+                last_run = next_run
+
+                # The pipeline is blocking network/DB work, so it runs in the
+                # default thread pool and the bot keeps answering commands
+                await asyncio.to_thread(self.scheduled_job)
+        except asyncio.CancelledError:
+            self.logger.info("Job scheduler stopped")
+            raise
+
+    async def _start_scheduler(self, application):
+        """post_init hook: run the scheduler on the bot's event loop"""
+        self._scheduler_task = asyncio.create_task(self.run_scheduler())
+
+    async def _stop_scheduler(self, application):
+        """post_shutdown hook: cancel the scheduler before the loop closes"""
+        if self._scheduler_task is None:
+            return
+        self._scheduler_task.cancel()
+        try:
+            await self._scheduler_task
+        except asyncio.CancelledError:
+            pass
+        self._scheduler_task = None
 
     def start_bot_and_scheduler(self):
         """Start both the Telegram bot and the scheduler"""
@@ -159,10 +201,10 @@ class BotServer:
             # Setup scheduled jobs
             self.setup_schedule()
 
-            # Start scheduler in a separate thread
-            scheduler_thread = threading.Thread(target=self.run_scheduler, daemon=True)
-            scheduler_thread.start()
-            self.logger.info("Scheduler thread started")
+            # The bot's event loop (and the scheduler running on it) uses
+            # uvloop when it is installed
+            if uvloop is not None:
+                asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
             # Get current time in IST
             current_time = datetime.now(self.ist)
@@ -182,15 +224,18 @@ class BotServer:
             if not self.daemon_mode:
                 print(start_msg)
                 print("Send /start to the bot to register for notifications!")
-            # Start the bot server (this will block)
-            self.telegram_bot.start_bot_server()
+            # Start the bot server (this will block); the scheduler starts and
+            # stops with the bot's event loop
+            self.telegram_bot.start_bot_server(
+                post_init=self._start_scheduler,
+                post_shutdown=self._stop_scheduler,
+            )
 
         except KeyboardInterrupt:
             shutdown_msg = "Shutting down bot server..."
             self.logger.info(shutdown_msg)
             if not self.daemon_mode:
                 print(f"\n{shutdown_msg}")
-            self.running = False
         except Exception as e:
             error_msg = f"Error starting bot server: {e}"
             self.logger.error(error_msg, exc_info=True)
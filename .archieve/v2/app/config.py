@@ -1,6 +1,9 @@
+import os
 import logging
 import inspect
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 
 """
 Global configuration for SuperSet Telegram Bot
@@ -46,3 +49,24 @@ def safe_print(*args, **kwargs):
         msg = " ".join(str(arg) for arg in args)
         if msg:
             logger.info(f"{func_name}:{line_no} - {msg}")
+
+
+@dataclass(frozen=True)
+class Credentials:
+    """SuperSet login credentials for the CSE and ECE accounts"""
+
+    cse_email: str | None
+    cse_password: str | None
+    ece_email: str | None
+    ece_password: str | None
+
+
+@lru_cache(maxsize=1)
+def get_credentials() -> Credentials:
+    """Read the SuperSet credentials from the environment once per process"""
+    return Credentials(
+        cse_email=os.getenv("CSE_EMAIL"),
+        cse_password=os.getenv("CSE_ENCRYPTION_PASSWORD"),
+        ece_email=os.getenv("ECE_EMAIL"),
+        ece_password=os.getenv("ECE_ENCRYPTION_PASSWORD"),
+    )
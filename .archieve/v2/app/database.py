@@ -2,7 +2,8 @@ import os
 import re
 from dotenv import load_dotenv
 import logging
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne
+from pymongo.errors import BulkWriteError
 from datetime import datetime
 import hashlib
 from config import safe_print
@@ -40,7 +41,7 @@ class MongoDBManager:
                 self.logger.error(error_msg)
                 raise ValueError(error_msg)
 
-            self.client = MongoClient(self.connection_string)
+            self.client = MongoClient(self.connection_string, maxPoolSize=50)
             self.db = self.client["SupersetPlacement"]
             self.notices_collection = self.db["Notices"]
             self.jobs_collection = self.db["Jobs"]
@@ -49,6 +50,8 @@ class MongoDBManager:
 
             # test the connection
             self.client.admin.command("ping")
+
+            self.ensure_indexes()
             success_msg = "Successfully connected to MongoDB"
             self.logger.info(success_msg)
             safe_print(success_msg)
@@ -59,6 +62,16 @@ class MongoDBManager:
             safe_print(error_msg)
             raise
 
+    def ensure_indexes(self):
+        """Create the indexes the lookup-by-id and merge queries rely on"""
+        # notices and jobs are looked up by their SuperSet id on every run
+        self.notices_collection.create_index("id")
+        self.jobs_collection.create_index("id")
+        # offers are merged into the most recently updated doc per company
+        self.placement_offers_collection.create_index(
+            [("company", 1), ("updated_at", -1)]
+        )
+
     def notice_exists(self, notice_id: str) -> bool:
         """Check if a notice with given id exists in the Notices collection."""
         if not notice_id:
@@ -70,6 +83,21 @@ class MongoDBManager:
             safe_print(f"Error checking notice existence: {e}")
             return False
 
+    def existing_notice_ids(self, notice_ids: list[str]) -> set[str]:
+        """Return the subset of notice_ids already in the Notices collection."""
+        ids = [nid for nid in notice_ids if nid]
+        if not ids:
+            return set()
+        try:
+            cursor = self.notices_collection.find(
+                {"id": {"$in": ids}}, {"id": 1, "_id": 0}
+            )
+            return {doc["id"] for doc in cursor}
+
+        except Exception as e:
+            safe_print(f"Error checking notice existence: {e}")
+            return set()
+
     def save_notice(self, notice: dict) -> tuple[bool, str]:
         """Insert a notice dict into Notices collection if id not present.
 
@@ -141,6 +169,62 @@ class MongoDBManager:
             safe_print(f"Error upserting structured job: {e}")
             return False, str(e)
 
+    def bulk_upsert_structured_jobs(self, structured_jobs: list[dict]) -> dict:
+        """Upsert many structured jobs by id with a single unordered bulk_write.
+
+        Returns stats: {'inserted': n, 'updated': m, 'errors': k}
+        """
+        now = datetime.utcnow()
+        operations = []
+        errors = 0
+
+        for structured_job in structured_jobs:
+            sid = structured_job.get("id") if isinstance(structured_job, dict) else None
+            if not sid:
+                errors += 1
+                continue
+
+            # Round-tripped documents carry _id and the timestamps; those are
+            # set below and may not appear in both $set and $setOnInsert
+            fields = {
+                k: v
+                for k, v in structured_job.items()
+                if k not in ("_id", "saved_at", "updated_at")
+            }
+            operations.append(
+                UpdateOne(
+                    {"id": sid},
+                    {
+                        "$set": {**fields, "updated_at": now},
+                        "$setOnInsert": {"saved_at": now},
+                    },
+                    upsert=True,
+                )
+            )
+
+        if not operations:
+            return {"inserted": 0, "updated": 0, "errors": errors}
+
+        try:
+            res = self.jobs_collection.bulk_write(operations, ordered=False)
+            inserted, updated = res.upserted_count, res.matched_count
+
+        except BulkWriteError as e:
+            # Unordered writes keep going past bad documents; count what landed
+            details = e.details
+            inserted, updated = details["nUpserted"], details["nMatched"]
+            errors += len(details["writeErrors"])
+            safe_print(f"Bulk upsert had {len(details['writeErrors'])} write errors")
+
+        except Exception as e:
+            safe_print(f"Error bulk upserting structured jobs: {e}")
+            return {"inserted": 0, "updated": 0, "errors": errors + len(operations)}
+
+        safe_print(
+            f"Bulk upserted structured jobs: {inserted} inserted, {updated} updated"
+        )
+        return {"inserted": inserted, "updated": updated, "errors": errors}
+
     def save_placement_offers(self, offers: list[dict]) -> dict:
         """Save a list of placement offers (merged by company) into PlacementOffers collection.
 
@@ -149,6 +233,7 @@ class MongoDBManager:
         inserted = 0
         updated = 0
         skipped = 0
+        now = datetime.utcnow()
 
         try:
             # Defensive checks for initialized collections
@@ -182,6 +267,11 @@ class MongoDBManager:
 
                 if existing_company:
                     # MERGE LOGIC
+                    # Only the changes are written back, as targeted array
+                    # updates, so concurrent merges into the same company
+                    # can't overwrite each other's students or roles
+                    company_filter = {"_id": existing_company["_id"]}
+                    operations = []
 
                     # 1. Merge Roles
                     existing_roles = existing_company.get("roles", [])
@@ -205,17 +295,34 @@ class MongoDBManager:
                             if new_pkg is not None:
                                 if old_pkg is None or float(new_pkg) > float(old_pkg):
                                     role_map[r_name]["package"] = new_pkg
+                                    role_fields = {"roles.$[r].package": new_pkg}
                                     # Also update details if available
                                     if new_role.get("package_details"):
                                         role_map[r_name]["package_details"] = (
                                             new_role.get("package_details")
                                         )
+                                        role_fields["roles.$[r].package_details"] = (
+                                            new_role.get("package_details")
+                                        )
+                                    operations.append(
+                                        UpdateOne(
+                                            company_filter,
+                                            {"$set": role_fields},
+                                            array_filters=[{"r.role": r_name}],
+                                        )
+                                    )
                         else:
                             # Add new role
                             existing_roles.append(new_role)
                             role_map[r_name] = (
                                 new_role  # Add to map to avoid duplicates in same batch if any
                             )
+                            operations.append(
+                                UpdateOne(
+                                    {**company_filter, "roles.role": {"$ne": r_name}},
+                                    {"$push": {"roles": new_role}},
+                                )
+                            )
 
                     # 2. Merge Students
                     existing_students = existing_company.get("students_selected", [])
@@ -230,9 +337,12 @@ class MongoDBManager:
                             student_map[key] = s
 
                     for new_student in new_students:
-                        key = new_student.get("enrollment_number") or new_student.get(
-                            "name"
+                        key_field = (
+                            "enrollment_number"
+                            if new_student.get("enrollment_number")
+                            else "name"
                         )
+                        key = new_student.get(key_field)
                         if not key:
                             continue
 
@@ -245,9 +355,22 @@ class MongoDBManager:
                             if new_pkg is not None:
                                 if old_pkg is None or float(new_pkg) > float(old_pkg):
                                     existing_s["package"] = new_pkg
+                                    student_fields = {
+                                        "students_selected.$[s].package": new_pkg
+                                    }
                                     # Also update role if provided in new data
                                     if new_student.get("role"):
                                         existing_s["role"] = new_student.get("role")
+                                        student_fields[
+                                            "students_selected.$[s].role"
+                                        ] = new_student.get("role")
+                                    operations.append(
+                                        UpdateOne(
+                                            company_filter,
+                                            {"$set": student_fields},
+                                            array_filters=[{f"s.{key_field}": key}],
+                                        )
+                                    )
                         else:
                             # Add new student
                             existing_students.append(new_student)
@@ -255,25 +378,42 @@ class MongoDBManager:
                             newly_added_students.append(
                                 new_student
                             )  # Track for notification
+                            operations.append(
+                                UpdateOne(
+                                    {
+                                        **company_filter,
+                                        f"students_selected.{key_field}": {"$ne": key},
+                                    },
+                                    {"$push": {"students_selected": new_student}},
+                                )
+                            )
 
                     # Update counts and timestamps
                     total_students = len(existing_students)
 
-                    update_doc = {
-                        "$set": {
-                            "roles": existing_roles,
-                            "students_selected": existing_students,
-                            "number_of_offers": total_students,
-                            "updated_at": datetime.utcnow(),
-                        }
-                    }
-
-                    self.placement_offers_collection.update_one(
-                        {
-                            "_id": existing_company["_id"],
-                        },
-                        update_doc,
+                    # Recount from the stored array so the count includes
+                    # students pushed by any concurrent merge
+                    operations.append(
+                        UpdateOne(
+                            company_filter,
+                            [
+                                {
+                                    "$set": {
+                                        "number_of_offers": {
+                                            "$size": {
+                                                "$ifNull": ["$students_selected", []]
+                                            }
+                                        },
+                                        # stamped by the server
+                                        "updated_at": "$$NOW",
+                                    }
+                                }
+                            ],
+                        )
                     )
+
+                    # Ordered, so the recount runs after the pushes
+                    self.placement_offers_collection.bulk_write(operations)
                     updated += 1
                     safe_print(f"Updated placement data for {company_name}")
 
@@ -291,7 +431,7 @@ class MongoDBManager:
                     # Insert new
                     doc = {
                         **offer,
-                        "saved_at": datetime.utcnow(),
+                        "saved_at": now,
                     }
                     offer_res = self.placement_offers_collection.insert_one(doc)
                     inserted += 1
@@ -626,6 +766,18 @@ class MongoDBManager:
             safe_print(f"Error getting all jobs: {e}")
             return []
 
+    def iter_jobs_missing_documents(self, batch_size=200):
+        """Stream jobs whose documents list is missing, null or empty"""
+        try:
+            # documents.0 only exists when the array has at least one entry
+            return self.jobs_collection.find(
+                {"documents.0": {"$exists": False}}
+            ).batch_size(batch_size)
+
+        except Exception as e:
+            safe_print(f"Error getting jobs missing documents: {e}")
+            return iter(())
+
     def get_all_offers(self, limit=100):
         """Get all offers with optional limit"""
         try:
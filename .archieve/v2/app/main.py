@@ -11,14 +11,45 @@ Modules:
 """
 
 import logging
+from typing import TypedDict
 from update import run_update
+from scrapper import SupersetClient
+from database import MongoDBManager
+from notice_formater import NoticeFormatter
 from telegram_handeller import TelegramBot
 from config import set_daemon_mode, safe_print
 import sys
 
 
+class PipelineContext(TypedDict):
+    client: SupersetClient
+    db: MongoDBManager
+    formatter: NoticeFormatter
+    telegram_bot: TelegramBot
+
+
+def build_context(telegram_bot: TelegramBot | None = None) -> PipelineContext:
+    """Create the clients a pipeline run needs.
+
+    Long-running callers build this once and pass it to run_pipeline on every
+    run, so HTTP/MongoDB connection pools and the LLM client are reused.
+    """
+    telegram_bot = telegram_bot or TelegramBot()
+    return {
+        "client": SupersetClient(),
+        "db": telegram_bot.db_manager,
+        "formatter": NoticeFormatter(),
+        "telegram_bot": telegram_bot,
+    }
+
+
 def main(daemon_mode=False):
     """Main function to orchestrate the complete workflow"""
+    return run_pipeline(build_context(), daemon_mode=daemon_mode)
+
+
+def run_pipeline(ctx: PipelineContext, daemon_mode=False):
+    """Run scraping and Telegram sending once using the clients in ctx"""
     logger = logging.getLogger(__name__)
     logger.info("Starting SuperSet Telegram Notification Bot")
 
@@ -29,13 +60,15 @@ def main(daemon_mode=False):
     safe_print("=" * 50)
 
     # Web Scraping (this now returns per-step status)
-    update_result = run_update()
+    update_result = run_update(
+        client=ctx["client"], db=ctx["db"], formatter=ctx["formatter"]
+    )
 
     # Telegram Sending
     safe_print("Sending formatted content to Telegram...")
     safe_print("-" * 30)
     logger.info("Sending formatted content to Telegram")
-    telegram_bot = TelegramBot()
+    telegram_bot = ctx["telegram_bot"]
 
     try:
         telegram_result = telegram_bot.run()
@@ -6,8 +6,7 @@ from rapidfuzz import fuzz, process
 from dotenv import load_dotenv
 import os
 import json
-from datetime import datetime, timezone
-from zoneinfo import ZoneInfo
+from datetime import datetime, timedelta, timezone
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain.prompts import ChatPromptTemplate
 from langgraph.graph import StateGraph, END
@@ -59,6 +58,9 @@ class Notice(BaseModel):
 load_dotenv()
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 
+# Asia/Kolkata is a fixed UTC+05:30 with no DST, so no tzdata lookup is needed
+IST = timezone(timedelta(hours=5, minutes=30), "IST")
+
 
 # state - LangGraph
 class PostState(TypedDict, total=False):
@@ -124,10 +126,8 @@ class NoticeFormatter:
         try:
             # timestamps in the codebase are milliseconds
             ts = float(ms) / 1000.0
-            # build aware datetime from UTC then convert to Asia/Kolkata
-            dt_utc = datetime.fromtimestamp(ts, tz=timezone.utc)
-            ist = dt_utc.astimezone(ZoneInfo("Asia/Kolkata"))
-            return ist.strftime(fmt)
+            # build an aware datetime directly in Asia/Kolkata
+            return datetime.fromtimestamp(ts, tz=IST).strftime(fmt)
 
         except Exception:
             return "Not specified"
@@ -474,9 +474,9 @@ class NoticeFormatter:
                         dt = datetime.fromisoformat(str(val))
 
                         if dt.tzinfo is None:
-                            dt = dt.replace(tzinfo=ZoneInfo("Asia/Kolkata"))
+                            dt = dt.replace(tzinfo=IST)
 
-                        return dt.astimezone(ZoneInfo("Asia/Kolkata")).strftime(
+                        return dt.astimezone(IST).strftime(
                             "%B %d, %Y at %I:%M %p %Z"
                         )
 
@@ -532,9 +532,9 @@ class NoticeFormatter:
                     try:
                         dt = datetime.fromisoformat(str(val))
                         if dt.tzinfo is None:
-                            dt = dt.replace(tzinfo=ZoneInfo("Asia/Kolkata"))
+                            dt = dt.replace(tzinfo=IST)
 
-                        return dt.astimezone(ZoneInfo("Asia/Kolkata")).strftime(
+                        return dt.astimezone(IST).strftime(
                             "%B %d, %Y at %I:%M %p %Z"
                         )
                     except Exception:
@@ -629,8 +629,8 @@ class NoticeFormatter:
                         try:
                             dt = datetime.fromisoformat(str(raw_deadline))
                             if dt.tzinfo is None:
-                                dt = dt.replace(tzinfo=ZoneInfo("Asia/Kolkata"))
-                            deadline = dt.astimezone(ZoneInfo("Asia/Kolkata")).strftime(
+                                dt = dt.replace(tzinfo=IST)
+                            deadline = dt.astimezone(IST).strftime(
                                 "%B %d, %Y, %I:%M %p %Z"
                             )
                         except Exception:
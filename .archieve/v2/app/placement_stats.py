@@ -221,6 +221,14 @@ NEGATIVE_KEYWORDS = [
 ]
 
 
+# Patterns used by the classifier, compiled once at import
+STUDENT_NAME_PATTERN = re.compile(r"\b[A-Z][a-z]+ [A-Z][a-z]+\b")
+NUMBER_PATTERN = re.compile(r"\d+")
+EMAIL_ADDRESS_PATTERN = re.compile(
+    r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
+)
+
+
 def intelligent_classify_email(state: GraphState) -> GraphState:
     print("--- Step 1: Intelligent Email Classification ---")
     email_data = state["email"]
@@ -243,16 +251,9 @@ def intelligent_classify_email(state: GraphState) -> GraphState:
     negative_score = sum(1 for keyword in NEGATIVE_KEYWORDS if keyword in full_text)
 
     # Check for specific patterns
-    has_student_names = bool(
-        re.search(r"\b[A-Z][a-z]+ [A-Z][a-z]+\b", email_data.get("body", ""))
-    )
-    has_numbers = bool(re.search(r"\d+", email_data.get("body", "")))
-    has_email_format = bool(
-        re.search(
-            r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b",
-            email_data.get("body", ""),
-        )
-    )
+    has_student_names = bool(STUDENT_NAME_PATTERN.search(email_data.get("body", "")))
+    has_numbers = bool(NUMBER_PATTERN.search(email_data.get("body", "")))
+    has_email_format = bool(EMAIL_ADDRESS_PATTERN.search(email_data.get("body", "")))
 
     # Check for security/spam indicators that should reduce confidence
     security_indicators = [
@@ -320,9 +321,12 @@ def intelligent_classify_email(state: GraphState) -> GraphState:
     }
 
 
+# Markdown code block the LLM occasionally wraps its JSON in
+CODE_FENCE_PATTERN = re.compile(r"```(?:json)?\s*([\s\S]*?)\s*```")
+
+
 def extract_json_from_response(response_content: str) -> str:
-    json_pattern = r"```(?:json)?\s*([\s\S]*?)\s*```"
-    match = re.search(json_pattern, response_content)
+    match = CODE_FENCE_PATTERN.search(response_content)
     return match.group(1).strip() if match else response_content.strip()
 
 
@@ -654,6 +658,25 @@ def enhanced_display_results(state: GraphState) -> GraphState:
 
 
 # ---------------- Privacy Sanitization ----------------
+# Header-like lines and forwarded markers, joined into one case-insensitive pattern
+HEADER_LINE_PATTERN = re.compile(
+    "|".join(
+        f"(?:{pattern})"
+        for pattern in [
+            r"^\s*(From|Sender|Sent|To|Cc|Subject)\s*:.*$",
+            r"^\s*(Fwd|FW)\s*:.*$",
+            r"^\s*(Begin forwarded message|Forwarded message).*$",
+            r"^\s*On .+ wrote:\s*$",
+        ]
+    ),
+    re.IGNORECASE,
+)
+VIA_SENDER_PATTERN = re.compile(r"\bvia\s+[^\s\n]+", re.IGNORECASE)
+FORWARDED_PHRASE_PATTERN = re.compile(
+    r"\bforward(ed)?(\s+message)?\b", re.IGNORECASE
+)
+
+
 def _strip_headers_and_forwarded_markers(text: str) -> str:
     """Remove lines that look like email headers or forwarded markers and redact obvious sender mentions.
 
@@ -670,27 +693,20 @@ def _strip_headers_and_forwarded_markers(text: str) -> str:
         return text
 
     # Remove entire header-like lines
-    header_patterns = [
-        r"^\s*(From|Sender|Sent|To|Cc|Subject)\s*:.*$",
-        r"^\s*(Fwd|FW)\s*:.*$",
-        r"^\s*(Begin forwarded message|Forwarded message).*$",
-        r"^\s*On .+ wrote:\s*$",
-    ]
-
     lines = text.splitlines()
     cleaned_lines: List[str] = []
     for ln in lines:
-        if any(re.search(pat, ln, flags=re.IGNORECASE) for pat in header_patterns):
+        if HEADER_LINE_PATTERN.search(ln):
             continue
         cleaned_lines.append(ln)
 
     cleaned = "\n".join(cleaned_lines)
 
     # Also remove inline "via" sender mentions like "via Gmail" or "via <service>"
-    cleaned = re.sub(r"\bvia\s+[^\s\n]+", "", cleaned, flags=re.IGNORECASE)
+    cleaned = VIA_SENDER_PATTERN.sub("", cleaned)
 
     # Redact explicit phrases stating it's forwarded
-    cleaned = re.sub(r"\bforward(ed)?(\s+message)?\b", "", cleaned, flags=re.IGNORECASE)
+    cleaned = FORWARDED_PHRASE_PATTERN.sub("", cleaned)
 
     return cleaned.strip()
 
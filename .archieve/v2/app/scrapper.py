@@ -1,8 +1,11 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pydantic import BaseModel
 from dotenv import load_dotenv
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Union
 
 
@@ -74,11 +77,29 @@ class SupersetClient:
     BASE_URL = "https://app.joinsuperset.com/tnpsuite-core"
 
     def __init__(
-        self, tenant_id: str = "jaypee_in_in_it_16", tenant_type: str = "STUDENT"
+        self,
+        tenant_id: str = "jaypee_in_in_it_16",
+        tenant_type: str = "STUDENT",
+        session: Optional[requests.Session] = None,
     ) -> None:
         self.tenant_id = tenant_id
         self.tenant_type = tenant_type
 
+        # One keep-alive session so repeated calls reuse TLS connections; the
+        # pool is sized for the concurrent document fetches. Idempotent
+        # requests are retried on transient errors, then raise_for_status
+        # sees the last response as before
+        retries = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False,
+        )
+        self.session = session or requests.Session()
+        self.session.mount(
+            "https://", HTTPAdapter(pool_maxsize=32, max_retries=retries)
+        )
+
     def _common_headers(self) -> dict:
         return {
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:141.0) Gecko/20100101 Firefox/141.0",
@@ -109,7 +130,7 @@ class SupersetClient:
             "Sec-Fetch-Site": "same-origin",
             "TE": "trailers",
         }
-        response = requests.post(url, headers=headers, data=payload)
+        response = self.session.post(url, headers=headers, data=payload)
         response.raise_for_status()
         return User(**response.json())
 
@@ -135,7 +156,7 @@ class SupersetClient:
                 "Sec-Fetch-Site": "same-origin",
                 "TE": "trailers",
             }
-            response = requests.get(url, headers=headers, params=params)
+            response = self.session.get(url, headers=headers, params=params)
             response.raise_for_status()
             notices = response.json()
 
@@ -184,7 +205,7 @@ class SupersetClient:
             "Sec-Fetch-Mode": "cors",
             "Sec-Fetch-Site": "same-origin",
         }
-        response = requests.get(url, params=params, headers=headers)
+        response = self.session.get(url, params=params, headers=headers)
         response.raise_for_status()
         return response.json()
 
@@ -207,7 +228,7 @@ class SupersetClient:
         }
 
         try:
-            response = requests.get(url, headers=headers)
+            response = self.session.get(url, headers=headers)
             response.raise_for_status()
             result = response.json()
             return result.get("url")
@@ -216,6 +237,20 @@ class SupersetClient:
             print(f"Error fetching document URL for {document_id}: {e}")
             return None
 
+    def get_document_urls(
+        self, user: User, job_id: str, document_ids: List[str]
+    ) -> List[Optional[str]]:
+        """Fetch the URLs for several documents of a job, in the given order
+
+        Resolved one after another: callers already run this per job inside
+        their own worker pools, and a nested pool here would multiply the
+        requests in flight past the session's connection pool.
+        """
+        return [
+            self.get_document_url(user, job_id, document_id)
+            for document_id in document_ids
+        ]
+
     @staticmethod
     def structure_job_listing(job: dict) -> Job:
         category_mapping = {
@@ -333,8 +368,32 @@ class SupersetClient:
 
         return Job(**tmp)
 
+    def _fetch_job_listing(
+        self, user: User, job: dict, include_documents: bool = True
+    ) -> Job:
+        """Fetch details (and document URLs) for one listing and structure it"""
+        job_id = job.get("jobProfileIdentifier")
+        if job_id:
+            job["jobDetails"] = self.get_job_details(user, job_id)
+
+        structured_job = self.structure_job_listing(job)
+
+        # Fetch document URLs for each document
+        if include_documents and job_id and structured_job.documents:
+            docs = [doc for doc in structured_job.documents if doc.identifier]
+            urls = self.get_document_urls(
+                user, job_id, [doc.identifier for doc in docs]
+            )
+            for doc, doc_url in zip(docs, urls):
+                doc.url = doc_url
+
+        return structured_job
+
     def get_job_listings(
-        self, users: Union[User, List[User]], limit: Optional[int] = None
+        self,
+        users: Union[User, List[User]],
+        limit: Optional[int] = None,
+        include_documents: bool = True,
     ) -> List[Job]:
         if isinstance(users, User):
             users = [users]
@@ -357,7 +416,7 @@ class SupersetClient:
                 "Sec-Fetch-Site": "same-origin",
                 "TE": "trailers",
             }
-            response = requests.get(url, headers=headers, params=params)
+            response = self.session.get(url, headers=headers, params=params)
             response.raise_for_status()
             job_listings = response.json()
 
@@ -374,27 +433,23 @@ class SupersetClient:
         if limit is not None:
             job_listings_sorted = job_listings_sorted[:limit]
 
-        # Use the first user to fetch details reliably
+        if not job_listings_sorted:
+            return []
+
+        # Use the first user to fetch details reliably. Each job's details and
+        # document URLs are fetched together, and jobs are fetched concurrently
         detail_user = users[0]
-        for job in job_listings_sorted:
-            job_id = job.get("jobProfileIdentifier")
-            if job_id:
-                job["jobDetails"] = self.get_job_details(detail_user, job_id)
-
-        formatted_job_listings: List[Job] = []
-        for job in job_listings_sorted:
-            structured_job = self.structure_job_listing(job)
-
-            # Fetch document URLs for each document
-            job_id = job.get("jobProfileIdentifier")
-            if job_id and structured_job.documents:
-                for doc in structured_job.documents:
-                    if doc.identifier:
-                        doc.url = self.get_document_url(
-                            detail_user, job_id, doc.identifier
-                        )
-
-            formatted_job_listings.append(structured_job)
+        with ThreadPoolExecutor(
+            max_workers=min(len(job_listings_sorted), 8)
+        ) as executor:
+            formatted_job_listings: List[Job] = list(
+                executor.map(
+                    lambda job: self._fetch_job_listing(
+                        detail_user, job, include_documents
+                    ),
+                    job_listings_sorted,
+                )
+            )
         return formatted_job_listings
 
     def update_notices(
@@ -20,11 +20,11 @@ dotenv.load_dotenv()
 
 
 class TelegramBot:
-    def __init__(self):
+    def __init__(self, db_manager: MongoDBManager | None = None):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
         self.TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
-        self.db_manager = MongoDBManager()
+        self.db_manager = db_manager or MongoDBManager()
         self.bot = (
             Bot(token=self.TELEGRAM_BOT_TOKEN) if self.TELEGRAM_BOT_TOKEN else None
         )
@@ -1198,14 +1198,23 @@ class TelegramBot:
         except Exception as e:
             safe_print(f"Error in web_command: {e}")
 
-    def start_bot_server(self):
-        """Start the bot server to handle user interactions"""
+    def start_bot_server(self, post_init=None, post_shutdown=None):
+        """Start the bot server to handle user interactions
+
+        post_init/post_shutdown are optional async callbacks run on the bot's
+        event loop right after startup and during shutdown.
+        """
         try:
             if not self.TELEGRAM_BOT_TOKEN:
                 safe_print("TELEGRAM_BOT_TOKEN not configured")
                 return False
 
-            application = Application.builder().token(self.TELEGRAM_BOT_TOKEN).build()
+            builder = Application.builder().token(self.TELEGRAM_BOT_TOKEN)
+            if post_init:
+                builder = builder.post_init(post_init)
+            if post_shutdown:
+                builder = builder.post_shutdown(post_shutdown)
+            application = builder.build()
 
             # Add command handlers
             application.add_handler(CommandHandler("start", self.start_command))
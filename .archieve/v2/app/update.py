@@ -1,50 +1,65 @@
-import os
 import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any
 import requests
 from dotenv import load_dotenv
-from pprint import pprint
 
 from scrapper import SupersetClient, User, Notice, Job
 from notice_formater import NoticeFormatter
 from database import MongoDBManager
 from placement_stats import update_placement_records
+from config import get_credentials
 
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
 
-def run_update() -> dict:
+
+def run_update(
+    client: SupersetClient | None = None,
+    db: MongoDBManager | None = None,
+    formatter: NoticeFormatter | None = None,
+) -> dict:
     """Run update pipeline and return per-step success status.
 
+    Long-running callers can pass a client, db and formatter to reuse them
+    across runs; fresh ones are created otherwise.
+
     Returns a dict with keys: notices, jobs, placements indicating whether
     each sub-step completed without an unhandled exception.
     """
-    client = SupersetClient()
-    db = MongoDBManager()
+    client = client or SupersetClient()
+    db = db or MongoDBManager()
 
     # Login multiple users (CSE, ECE)
-    cse_email = os.getenv("CSE_EMAIL")
-    cse_password = os.getenv("CSE_ENCRYPTION_PASSWORD")
-    ece_email = os.getenv("ECE_EMAIL")
-    ece_password = os.getenv("ECE_ENCRYPTION_PASSWORD")
-
-    cse_user: User = client.login(cse_email, cse_password)
-    ece_user: User = client.login(ece_email, ece_password)
-
-    users: List[User] = [cse_user, ece_user]
-
-    # Fetch data for notices
-    notices: List[Notice] = [
-        notice
-        for notice in client.get_notices(users, num_posts=20)
-        if not db.notice_exists(notice.id)
-    ]
-    pprint(notices)
-    jobs: List[Job] = client.get_job_listings(users, limit=10)
+    creds = get_credentials()
+
+    # The SuperSet calls are independent network requests, so overlap them:
+    # both logins together, then notices and job listings together
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        cse_login = executor.submit(client.login, creds.cse_email, creds.cse_password)
+        ece_login = executor.submit(client.login, creds.ece_email, creds.ece_password)
+        cse_user: User = cse_login.result()
+        ece_user: User = ece_login.result()
+
+        users: List[User] = [cse_user, ece_user]
+
+        notices_future = executor.submit(client.get_notices, users, num_posts=20)
+        jobs_future = executor.submit(client.get_job_listings, users, limit=10)
+
+        # Fetch data for notices, checking which are already stored in one query
+        fetched_notices: List[Notice] = notices_future.result()
+        existing_ids = db.existing_notice_ids([notice.id for notice in fetched_notices])
+        notices: List[Notice] = [
+            notice for notice in fetched_notices if notice.id not in existing_ids
+        ]
+        logger.debug("New notices: %s", notices)
+        jobs: List[Job] = jobs_future.result()
 
     # Format using LLM pipeline
-    formatter = NoticeFormatter()
+    formatter = formatter or NoticeFormatter()
     enriched = formatter.format_many(notices, jobs)  # type: ignore
 
     # Track step success flags
@@ -67,7 +82,7 @@ def run_update() -> dict:
                 if info and "already exists" in str(info).lower():
                     pass
                 else:
-                    pprint(f"Notice save error: {info}")
+                    logger.warning("Notice save error: %s", info)
 
         if inserted_notices:
             print(f"Inserted {inserted_notices} new notices into DB")
@@ -76,7 +91,7 @@ def run_update() -> dict:
 
         notices_success = True
     except Exception as e:
-        pprint(f"Notices processing failed: {e}")
+        logger.error("Notices processing failed: %s", e)
         notices_success = False
 
     # Process jobs and upsert into DB - using the jobs already fetched above
@@ -86,7 +101,9 @@ def run_update() -> dict:
         for job_model in jobs:
             try:
                 structured = job_model.model_dump()
-                pprint(f"Structured job: {job_model.job_profile} ({job_model.id})")
+                logger.debug(
+                    "Structured job: %s (%s)", job_model.job_profile, job_model.id
+                )
                 success, info = db.upsert_structured_job(structured)
                 if success:
                     if info == "updated":
@@ -94,17 +111,19 @@ def run_update() -> dict:
                     else:
                         inserted_jobs += 1
                 else:
-                    pprint(
-                        f"Failed to upsert structured job {structured.get('id')}: {info}"
+                    logger.warning(
+                        "Failed to upsert structured job %s: %s",
+                        structured.get("id"),
+                        info,
                     )
 
             except Exception as e:
-                pprint(f"Error structuring/upserting job: {e}")
+                logger.error("Error structuring/upserting job: %s", e)
 
         print(f"Structured jobs - inserted: {inserted_jobs}, updated: {updated_jobs}")
         jobs_success = True
     except Exception as e:
-        pprint(f"Jobs processing failed: {e}")
+        logger.error("Jobs processing failed: %s", e)
         jobs_success = False
 
     # placement updating
@@ -112,7 +131,7 @@ def run_update() -> dict:
         update_placement_records()
         placements_success = True
     except Exception as e:
-        pprint(f"Placement updating failed: {e}")
+        logger.error("Placement updating failed: %s", e)
         placements_success = False
 
     return {